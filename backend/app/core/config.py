@@ -2,24 +2,48 @@ from functools import lru_cache
 from pathlib import Path
 from pydantic.v1 import BaseSettings, Field, ValidationError, EmailStr
 
-from dotenv import load_dotenv
-
 ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
-load_dotenv(dotenv_path=ENV_PATH, override=True)  # force using file values
 
 
 class Settings(BaseSettings):
     api_title: str = "PlayBud API"
     api_version: str = "0.1.0"
 
+    web_host: str = Field("0.0.0.0", env="WEB_HOST")
+    web_port: int = Field(2121, env="WEB_PORT")
+    web_workers: int = Field(0, env="WEB_WORKERS")
+    web_keepalive_seconds: int = Field(5, env="WEB_KEEPALIVE_SECONDS")
+    threadpool_size: int = Field(40, env="THREADPOOL_SIZE")
+    cache_bus_path: str = Field("", env="CACHE_BUS_PATH")
+    warmup_enabled: bool = Field(True, env="WARMUP_ENABLED")
+    warmup_games: int = Field(20, env="WARMUP_GAMES")
+    dependency_probe_interval_seconds: float = Field(10.0, env="DEPENDENCY_PROBE_INTERVAL_SECONDS")
+
     cors_origins: list[str] = Field(
         default_factory=list,
         env="CORS_ORIGINS"
     )
     admin_emails_raw: str = Field("", env="ADMIN_EMAILS")
 
+    storage_backend: str = Field("supabase", env="STORAGE_BACKEND")
+    sqlite_path: str = Field("", env="SQLITE_PATH")
     supabase_url: str = Field("", env="SUPABASE_URL")
     supabase_service_role_key: str = Field("", env="SERVICE_ROLE")
+    supabase_http2: bool = Field(True, env="SUPABASE_HTTP2")
+    supabase_pool_max_connections: int = Field(20, env="SUPABASE_POOL_MAX_CONNECTIONS")
+    supabase_pool_max_keepalive: int = Field(10, env="SUPABASE_POOL_MAX_KEEPALIVE")
+    supabase_keepalive_expiry_seconds: float = Field(30.0, env="SUPABASE_KEEPALIVE_EXPIRY_SECONDS")
+    supabase_connect_timeout_seconds: float = Field(5.0, env="SUPABASE_CONNECT_TIMEOUT_SECONDS")
+    supabase_read_timeout_seconds: float = Field(15.0, env="SUPABASE_READ_TIMEOUT_SECONDS")
+    supabase_write_timeout_seconds: float = Field(15.0, env="SUPABASE_WRITE_TIMEOUT_SECONDS")
+    supabase_pool_timeout_seconds: float = Field(5.0, env="SUPABASE_POOL_TIMEOUT_SECONDS")
+    supabase_read_retries: int = Field(2, env="SUPABASE_READ_RETRIES")
+    supabase_retry_backoff_seconds: float = Field(0.2, env="SUPABASE_RETRY_BACKOFF_SECONDS")
+    supabase_circuit_failure_ratio: float = Field(0.5, env="SUPABASE_CIRCUIT_FAILURE_RATIO")
+    supabase_circuit_window: int = Field(20, env="SUPABASE_CIRCUIT_WINDOW")
+    supabase_circuit_min_calls: int = Field(10, env="SUPABASE_CIRCUIT_MIN_CALLS")
+    supabase_circuit_probe_seconds: float = Field(5.0, env="SUPABASE_CIRCUIT_PROBE_SECONDS")
+    stale_cache_max_age_seconds: int = Field(86400, env="STALE_CACHE_MAX_AGE_SECONDS")
 
     jwt_secret_key: str = Field("dev-access-secret", env="JWT_SECRET_KEY")
     jwt_refresh_secret_key: str = Field("dev-refresh-secret", env="JWT_REFRESH_SECRET_KEY")
@@ -32,13 +56,25 @@ class Settings(BaseSettings):
     smtp_port: int = Field(587, env="SMTP_PORT")
     smtp_username: str = Field("", env="SMTP_USERNAME")
     smtp_password: str = Field("", env="SMTP_PASSWORD")
+    smtp_pool_size: int = Field(2, env="SMTP_POOL_SIZE")
+    smtp_pool_idle_seconds: float = Field(60.0, env="SMTP_POOL_IDLE_SECONDS")
+    email_outbox_enabled: bool = Field(True, env="EMAIL_OUTBOX_ENABLED")
+    email_outbox_path: str = Field("", env="EMAIL_OUTBOX_PATH")
+    email_outbox_workers: int = Field(2, env="EMAIL_OUTBOX_WORKERS")
+    email_outbox_max_attempts: int = Field(6, env="EMAIL_OUTBOX_MAX_ATTEMPTS")
+    reminder_store_path: str = Field("", env="REMINDER_STORE_PATH")
+    admin_digest_window_minutes: int = Field(15, env="ADMIN_DIGEST_WINDOW_MINUTES")
+    admin_digest_urgent_hours: float = Field(24.0, env="ADMIN_DIGEST_URGENT_HOURS")
     password_reset_url: str = Field("https://playbud.site/reset-password", env="PASSWORD_RESET_URL")
     signup_url: str = Field("https://playbud.site/auth?mode=signup", env="SIGNUP_URL")
     mail_from: EmailStr = Field("ballerz@playbud.site", env="MAIL_FROM")
     whatsapp_bot_secret: str = Field("", env="WHATSAPP_BOT_SECRET")
+    reference_data_ttl_seconds: int = Field(300, env="REFERENCE_DATA_TTL_SECONDS")
+    organizer_profile_ttl_seconds: int = Field(120, env="ORGANIZER_PROFILE_TTL_SECONDS")
 
     class Config:
-        env_file = ".env"
+        # Read once by pydantic; real environment variables win over the file.
+        env_file = ENV_PATH
         env_file_encoding = "utf-8"
 
 
@@ -50,13 +86,6 @@ def get_settings() -> Settings:
     except ValidationError as e:
         missing = [ ".".join(map(str, err["loc"])) for err in e.errors() if err["type"]=="value_error.missing"]
         raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}") from e
-
-    # Quick debug (safe prefixes)
-    print(f"ENV path exists: {ENV_PATH.exists()} ({ENV_PATH})")
-    print(f"✅ Supabase URL: {s.supabase_url}")
-    print(f"✅ Service Role Key: {s.supabase_service_role_key[:6]}********" if s.supabase_service_role_key else "❌ Service Role Key: MISSING")
-    print(f"✅ JWT Access Secret: {s.jwt_secret_key[:6]}********")
-    print(f"✅ STMP Secret: {s.smtp_password[6:]}********")
     return s
 
 
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Callable, Iterable, Union
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[str, ...]
+GaugeValue = Union[float, dict[Labels, float], None]
+
+
+class _Sharded:
+    """Per-thread storage: writers only touch their own thread's dict, so the hot path takes no lock.
+
+    Scrapes sum every shard. Once a thread has exited its shard is folded into a retired
+    total, so totals never go backwards and short-lived threads do not pile up shards.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[tuple[weakref.ref[threading.Thread], dict]] = []
+        self._retired: dict = {}
+        self._register_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: dict = {}
+            with self._register_lock:
+                self._prune()
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+            self._local.shard = shard
+            return shard
+
+    def _prune(self) -> None:
+        # Caller holds _register_lock. A dead thread can no longer write, so its shard is final.
+        live = []
+        for owner, shard in self._shards:
+            thread = owner()
+            if thread is not None and thread.is_alive():
+                live.append((owner, shard))
+            else:
+                self._fold(self._retired, shard)
+        self._shards = live
+
+    def _fold(self, into: dict, shard: dict) -> None:
+        for labels, value in shard.items():
+            into[labels] = into.get(labels, 0.0) + value
+
+    def _snapshots(self) -> list[dict]:
+        with self._register_lock:
+            self._prune()
+            shards = [shard for _, shard in self._shards]
+            retired = self._retired.copy()
+        # dict.copy() runs under the GIL, so a concurrent write cannot break the iteration below.
+        return [retired] + [shard.copy() for shard in shards]
+
+
+class _Metric(_Sharded):
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__()
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        REGISTRY[name] = self
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def _totals(self) -> dict[Labels, float]:
+        totals: dict[Labels, float] = {}
+        for shard in self._snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def collect(self) -> list[str]:
+        lines = self._header()
+        for labels, value in sorted(self._totals().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._totals().get(labels, 0.0)
+
+
+class Gauge(Counter):
+    """A sharded sum that can go down, e.g. requests currently in flight."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class CallbackGauge(_Metric):
+    """A gauge read from ``callback`` at scrape time; return a number, or a dict keyed by label tuples.
+
+    Callbacks may block (several count SQLite rows): ``render`` is meant to run off the event loop.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, help: str, callback: Callable[[], GaugeValue], labelnames: Iterable[str] = ()
+    ) -> None:
+        self.callback = callback
+        super().__init__(name, help, labelnames)
+
+    def _totals(self) -> dict[Labels, float]:
+        try:
+            value = self.callback()
+        except Exception as exc:  # a broken gauge must not take the whole scrape down
+            print(f"Metric {self.name} failed to collect: {exc}")
+            return {}
+        if value is None:
+            return {}
+        if isinstance(value, dict):
+            return value
+        return {(): float(value)}
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help, labelnames)
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # Per-bucket (not cumulative) counts, then +Inf, then the running sum.
+            state = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def _fold(self, into: dict, shard: dict) -> None:
+        # Build new lists: scrapes may still hold the old ones from a snapshot.
+        for labels, state in shard.items():
+            total = into.get(labels)
+            into[labels] = list(state) if total is None else [a + b for a, b in zip(total, state)]
+
+    def _merged(self) -> dict[Labels, list[float]]:
+        merged: dict[Labels, list[float]] = {}
+        for shard in self._snapshots():
+            for labels, state in shard.items():
+                state = list(state)
+                total = merged.get(labels)
+                merged[labels] = state if total is None else [a + b for a, b in zip(total, state)]
+        return merged
+
+    def count(self, *labels: str) -> int:
+        state = self._merged().get(labels)
+        return int(sum(state[:-1])) if state else 0
+
+    def collect(self) -> list[str]:
+        lines = self._header()
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for labels, state in sorted(self._merged().items()):
+            cumulative = 0
+            for bound, observed in zip(bounds, state[:-1]):
+                cumulative += observed
+                bucket_labels = _format_labels(self.labelnames + ("le",), labels + (bound,))
+                lines.append(f"{self.name}_bucket{bucket_labels} {int(cumulative)}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{label_text} {int(cumulative)}")
+        return lines
+
+
+REGISTRY: dict[str, _Metric] = {}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render() -> str:
+    """Every registered metric in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for metric in list(REGISTRY.values()):
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+CATEGORIES = ("db", "email", "hash")
+
+
+class RequestMetrics:
+    """Call counts and time spent per category (database, email, password hashing) for one request."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.counts: dict[str, int] = dict.fromkeys(CATEGORIES, 0)
+        self.durations_ms: dict[str, float] = dict.fromkeys(CATEGORIES, 0.0)
+
+    def record(self, category: str, duration_ms: float) -> None:
+        self.counts[category] = self.counts.get(category, 0) + 1
+        self.durations_ms[category] = self.durations_ms.get(category, 0.0) + duration_ms
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        parts = [
+            f'{category};dur={self.durations_ms[category]:.2f};desc="{count} calls"'
+            for category, count in self.counts.items()
+            if count
+        ]
+        parts.append(f"app;dur={self.elapsed_ms():.2f}")
+        return ", ".join(parts)
+
+
+# The same object is shared with threadpool workers (they get a copy of the context,
+# not of the object), so hooks in sync endpoints add to the request that started them.
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+
+def begin() -> RequestMetrics:
+    metrics = RequestMetrics()
+    _current.set(metrics)
+    return metrics
+
+
+def current() -> Optional[RequestMetrics]:
+    return _current.get()
+
+
+def record(category: str, duration_ms: float) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.record(category, duration_ms)
+
+
+@contextmanager
+def timed(category: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(category, (time.perf_counter() - start) * 1000)
+
+
+def track(category: str) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def capture() -> Iterator[RequestMetrics]:
+    """Collect metrics for the enclosed block; lets tests assert query budgets outside HTTP."""
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from . import request_metrics
 from .config import get_settings
 
 
@@ -11,15 +11,23 @@ pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 ALGORITHM = "HS256" 
 
 
+class TokenDecodeError(Exception):
+    """Raised when a JWT cannot be decoded."""
+
+
+@request_metrics.track("hash")
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@request_metrics.track("hash")
 def verify_password(password: str, password_hash: str) -> bool:
     return pwd_context.verify(password, password_hash)
 
 
 def _create_token(data: Dict[str, Any], expires_delta: timedelta, secret_key: str) -> str:
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.utcnow() + expires_delta
     to_encode.update({"exp": expire})
@@ -38,25 +46,28 @@ def create_refresh_token(subject: str) -> str:
     return _create_token({"sub": subject}, expires, settings.jwt_refresh_secret_key)
 
 
+def _decode(token: str, secret_key: str) -> Dict[str, Any]:
+    # python-jose is imported on first use rather than at startup; after that this is a dict lookup.
+    from jose import JWTError, jwt
+
+    try:
+        return jwt.decode(token, secret_key, algorithms=[ALGORITHM])
+    except JWTError as exc:
+        raise TokenDecodeError(str(exc)) from exc
+
+
 def decode_access_token(token: str) -> Dict[str, Any]:
     settings = get_settings()
-    return jwt.decode(token, settings.jwt_secret_key, algorithms=[ALGORITHM])
+    return _decode(token, settings.jwt_secret_key)
 
 
 def decode_refresh_token(token: str) -> Dict[str, Any]:
     settings = get_settings()
-    return jwt.decode(token, settings.jwt_refresh_secret_key, algorithms=[ALGORITHM])
-
-
-class TokenDecodeError(Exception):
-    """Raised when a JWT cannot be decoded."""
+    return _decode(token, settings.jwt_refresh_secret_key)
 
 
 def get_subject_from_token(token: str, refresh: bool = False) -> str:
-    try:
-        payload = decode_refresh_token(token) if refresh else decode_access_token(token)
-    except JWTError as exc:
-        raise TokenDecodeError(str(exc)) from exc
+    payload = decode_refresh_token(token) if refresh else decode_access_token(token)
     subject = payload.get("sub")
     if subject is None:
         raise TokenDecodeError("Token subject missing")
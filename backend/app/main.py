@@ -1,16 +1,98 @@
+import json
+import logging
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 import httpx
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from .core import metrics, request_metrics
 from .core.config import get_settings
 from .routers import auth, reference_data, games, organizers, bookings, feedback, admin
-from .services.supabase_client import SupabaseUnavailableError
+from .services import (
+    admin_digest,
+    cache_bus,
+    dependency_probes,
+    email_outbox,
+    fallback_cache,
+    profiler,
+    reminder_scheduler,
+    warmup,
+)
+from .services.circuit_breaker import CircuitOpenError
+from .services.smtp_pool import close_smtp_pool
+from .services.storage_backend import close_storage
+from .services.supabase_client import SupabaseUnavailableError, close_supabase_client
 
 
 settings = get_settings()
+request_log = logging.getLogger("playbud.requests")
+# Uvicorn's logging config only covers its own loggers; without a handler here every
+# per-request line would fall through to the root logger's WARNING level and be dropped.
+if not request_log.handlers:
+    _request_handler = logging.StreamHandler()
+    _request_handler.setFormatter(logging.Formatter("%(message)s"))
+    request_log.addHandler(_request_handler)
+    request_log.setLevel(logging.INFO)
+
+REQUEST_LATENCY = metrics.Histogram(
+    "playbud_http_request_duration_seconds", "Request latency per route template.", ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = metrics.Gauge("playbud_http_requests_in_flight", "Requests currently being handled.")
+
+
+def _limiter_usage() -> tuple[anyio.CapacityLimiter, anyio.CapacityLimiterStatistics]:
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return limiter, limiter.statistics()
+
+
+def _threadpool_usage() -> dict[tuple[str, ...], float]:
+    # /metrics renders in a worker thread, but the limiter belongs to the event loop: ask it there.
+    try:
+        limiter, stats = anyio.from_thread.run_sync(_limiter_usage)
+    except RuntimeError:
+        return {}
+    return {
+        ("busy",): float(stats.borrowed_tokens),
+        ("capacity",): float(limiter.total_tokens),
+        ("waiting",): float(stats.tasks_waiting),
+    }
+
+
+metrics.CallbackGauge(
+    "playbud_threadpool_workers",
+    "Threadpool workers in use, pool size and tasks queued for a worker.",
+    _threadpool_usage,
+    ("state",),
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints and storage calls share this pool; size it to what the database pool can serve.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    cache_bus.start()
+    if settings.email_outbox_enabled:
+        # Deliver anything left in the outbox by a previous run.
+        email_outbox.start_workers()
+    reminder_scheduler.start()
+    admin_digest.start()
+    warmup.start()
+    dependency_probes.start()
+    yield
+    dependency_probes.stop()
+    admin_digest.stop()
+    reminder_scheduler.stop()
+    email_outbox.stop_workers()
+    cache_bus.stop()
+    close_smtp_pool()
+    close_supabase_client()
+    close_storage()
 
-app = FastAPI(title=settings.api_title, version=settings.api_version)
+
+app = FastAPI(title=settings.api_title, version=settings.api_version, lifespan=lifespan)
 
 
 @app.exception_handler(SupabaseUnavailableError)
@@ -22,6 +104,61 @@ async def supabase_unavailable_handler(request: Request, exc: SupabaseUnavailabl
 async def httpx_connect_error_handler(request: Request, exc: httpx.ConnectError):
     return JSONResponse(status_code=503, content={"detail": "Database service is unreachable. Please try again later."})
 
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database service is degraded. Please try again shortly."},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
+
+
+@app.middleware("http")
+async def request_instrumentation(request: Request, call_next):
+    timings = request_metrics.begin()
+    REQUESTS_IN_FLIGHT.inc()
+    status = 500
+    try:
+        async with profiler.track_allocations(request.url.path):
+            response = await call_next(request)
+        status = response.status_code
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        # Label by route template, not raw path, so ids in URLs cannot blow up series cardinality.
+        REQUEST_LATENCY.observe(
+            timings.elapsed_ms() / 1000,
+            request.method,
+            getattr(route, "path", "unmatched"),
+            str(status),
+        )
+    response.headers["Server-Timing"] = timings.server_timing()
+    request_log.info(
+        json.dumps(
+            {
+                "method": request.method,
+                "path": request.url.path,
+                "status": response.status_code,
+                "duration_ms": round(timings.elapsed_ms(), 2),
+                "calls": timings.counts,
+                "durations_ms": {key: round(value, 2) for key, value in timings.durations_ms.items()},
+            }
+        )
+    )
+    return response
+
+
+@app.middleware("http")
+async def stale_data_header(request: Request, call_next):
+    state = fallback_cache.begin_request()
+    response = await call_next(request)
+    if "stale_age" in state:
+        response.headers[fallback_cache.STALE_HEADER] = "true"
+        response.headers["Age"] = str(int(state["stale_age"]))
+    return response
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -41,4 +178,32 @@ app.include_router(admin.router, prefix="/api", tags=["admin"])
 
 @app.get("/health")
 async def health_check():
+    """Liveness: the process is up and serving."""
     return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness: warm-up has finished and the database answered its latest background probe.
+
+    Only cached probe results are read here, so load-balancer checks never reach the backends.
+    """
+    dependencies = dependency_probes.snapshot()
+    if not warmup.is_ready():
+        state = "warming_up"
+    elif not dependency_probes.healthy(dependencies):
+        state = "unavailable"
+    else:
+        state = "ready"
+    return JSONResponse(
+        status_code=200 if state == "ready" else 503,
+        content={"status": state, "warmup": warmup.report(), "dependencies": dependencies},
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> PlainTextResponse:
+    # Some gauges query SQLite, so render off the loop. A private limiter keeps scrapes from
+    # queueing behind (or showing up in) a saturated default threadpool.
+    body = await anyio.to_thread.run_sync(metrics.render, limiter=anyio.CapacityLimiter(1))
+    return PlainTextResponse(body, media_type=metrics.CONTENT_TYPE)
@@ -1,6 +1,7 @@
 from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from ..schemas.auth import UserBase
@@ -15,6 +16,7 @@ from ..services import (
     user_repository,
     organizer_repository,
     booking_repository,
+    profiler,
 )
 
 
@@ -110,3 +112,31 @@ def get_game_detail(
         organizer=organizer_obj,
         participants=participants,
     )
+
+
+@router.get("/admin/profile", response_class=PlainTextResponse)
+def profile_cpu(
+    seconds: float = Query(5.0, gt=0, le=profiler.MAX_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    include_idle: bool = False,
+    _: UserBase = Depends(_require_admin),
+) -> PlainTextResponse:
+    """Collapsed stacks of every thread sampled for ``seconds``; feed to flamegraph.pl or speedscope."""
+    try:
+        stacks = profiler.sample_stacks(seconds, interval_ms / 1000, include_idle=include_idle)
+    except profiler.ProfilerBusyError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    return PlainTextResponse(stacks)
+
+
+@router.get("/admin/profile/allocations")
+def profile_allocations(
+    path: str = Query(..., description="Request path to trace, e.g. /api/games"),
+    seconds: float = Query(10.0, gt=0, le=profiler.MAX_SECONDS),
+    top: int = Query(25, ge=1, le=200),
+    _: UserBase = Depends(_require_admin),
+) -> dict:
+    try:
+        return profiler.trace_allocations(path, seconds, top=top)
+    except profiler.ProfilerBusyError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
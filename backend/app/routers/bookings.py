@@ -8,9 +8,8 @@ from ..schemas.bookings import (
     BookingParticipant,
     BookingResponse,
     GameWithBooking,
-    ParticipantUser,
 )
-from ..services import booking_service, user_repository
+from ..services import booking_service
 from .auth import _get_current_user
 
 router = APIRouter()
@@ -47,22 +46,7 @@ def cancel_booking_endpoint(
 
 @router.get("/games/{game_id}/participants", response_model=list[BookingParticipant])
 def get_game_participants_endpoint(game_id: str) -> list[BookingParticipant]:
-    bookings = booking_service.get_game_participants(game_id)
-    participants: list[BookingParticipant] = []
-    for booking in bookings:
-        user = user_repository.get_user_by_id(booking.user_id)
-        participants.append(
-            BookingParticipant(
-                booking_id=booking.id,
-                user=ParticipantUser(
-                    id=booking.user_id,
-                    name=user.name if user else None,
-                    avatar_url=getattr(user, "avatar_url", None) if user else None,
-                ),
-                joined_at=booking.joined_at,
-            )
-        )
-    return participants
+    return booking_service.get_game_participant_details(game_id)
 
 
 @router.get("/users/me/games", response_model=list[GameWithBooking])
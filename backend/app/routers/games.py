@@ -10,7 +10,10 @@ router = APIRouter()
 
 @router.post("", response_model=Game, status_code=status.HTTP_201_CREATED)
 def create_game(payload: GameCreate, current_user: UserBase = Depends(_get_current_user)) -> Game:
-    return game_service.create_game(payload, current_user)
+    try:
+        return game_service.create_game(payload, current_user)
+    except game_service.GameValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get("", response_model=list[Game])
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from ..schemas.organizers import Organizer, OrganizerCreate
-from ..services import organizer_service, email_service
+from ..schemas.games import Game
+from ..schemas.organizers import Organizer, OrganizerCreate, OrganizerProfile, OrganizerStats
+from ..services import organizer_service, organizer_stats_service, email_service
 from ..schemas.auth import UserBase
 from .auth import _get_current_user
 
@@ -25,3 +26,31 @@ def get_my_organizer(current_user: UserBase = Depends(_get_current_user)) -> Org
     if not organizer:
         organizer = organizer_service.get_or_create(OrganizerCreate(user_id=current_user.id))
     return organizer
+
+
+@router.get("/me/games", response_model=list[Game])
+def list_my_organizer_games(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: UserBase = Depends(_get_current_user),
+) -> list[Game]:
+    organizer = organizer_service.get_by_user_id(current_user.id)
+    if not organizer:
+        return []
+    return organizer_service.list_organizer_games(organizer.id, limit=limit, offset=offset)
+
+
+@router.get("/me/stats", response_model=OrganizerStats)
+def get_my_organizer_stats(current_user: UserBase = Depends(_get_current_user)) -> OrganizerStats:
+    organizer = organizer_service.get_by_user_id(current_user.id)
+    if not organizer:
+        return OrganizerStats()
+    return organizer_stats_service.get_stats(organizer.id)
+
+
+@router.get("/by-slug/{slug}", response_model=OrganizerProfile)
+def get_organizer_profile(slug: str) -> OrganizerProfile:
+    profile = organizer_service.get_public_profile(slug)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organizer not found")
+    return profile
@@ -1,11 +1,60 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
-from ..schemas.metadata import ReferenceData
-from ..services import metadata_repository
+from ..schemas.metadata import ReferenceData, ResolvedCity
+from ..services import fallback_cache, metadata_repository, reference_data_service
+from ..services.supabase_client import breaker
 
 router = APIRouter()
 
 
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for part in header.split(","):
+        token, _, params = part.partition(";")
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                if float(value) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if token.strip():
+            accepted.add(token.strip().lower())
+    return accepted
+
+
 @router.get("", response_model=ReferenceData)
-def get_reference_data() -> ReferenceData:
-    return metadata_repository.get_reference_data()
+def get_reference_data(request: Request) -> Response:
+    encoded = reference_data_service.get_encoded_reference_data()
+    if breaker.is_open():
+        fallback_cache.mark_stale(metadata_repository.reference_data_age() or 0.0)
+    headers = {
+        "ETag": encoded.etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "public, max-age=60",
+    }
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if encoded.etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")} or if_none_match == "*":
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    body = encoded.identity
+    if "br" in accepted and encoded.brotli is not None:
+        body = encoded.brotli
+        headers["Content-Encoding"] = "br"
+    elif "gzip" in accepted:
+        body = encoded.gzip
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/resolve-city", response_model=ResolvedCity)
+def resolve_city(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+) -> ResolvedCity:
+    resolved = reference_data_service.resolve_city_for_point(lat, lng)
+    if resolved is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No cities available")
+    return resolved
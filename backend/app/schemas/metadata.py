@@ -26,3 +26,9 @@ class ReferenceData(BaseModel):
     sports: list[LookupItem]
     abilities: list[LookupItem]
     genders: list[LookupItem]
+
+
+class ResolvedCity(BaseModel):
+    city: City
+    distance_km: float
+    within_radius: bool
@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from .games import Game
+
 
 class OrganizerCreate(BaseModel):
     user_id: str = Field(..., description="ID of the user becoming an organiser")
@@ -19,5 +21,35 @@ class Organizer(BaseModel):
     sports: list[str] = Field(default_factory=list)
     experience: str | None = None
     unique_link: str | None = None
-    game_ids: list[str] = Field(default_factory=list)
     created_at: datetime
+
+
+class SportStats(BaseModel):
+    sport_code: str
+    games_hosted: int = 0
+    bookings: int = 0
+    cancellations: int = 0
+    average_fill_rate: float = Field(default=0.0, description="Active bookings divided by total capacity")
+
+
+class OrganizerStats(BaseModel):
+    games_hosted: int = 0
+    bookings: int = 0
+    cancellations: int = 0
+    average_fill_rate: float = Field(default=0.0, description="Active bookings divided by total capacity")
+    repeat_players: int = Field(default=0, description="Players with active bookings in two or more games")
+    by_sport: list[SportStats] = Field(default_factory=list)
+
+
+class PublicOrganizer(BaseModel):
+    id: str
+    slug: str | None = None
+    sports: list[str] = Field(default_factory=list)
+    experience: str | None = None
+    unique_link: str | None = None
+    created_at: datetime
+
+
+class OrganizerProfile(BaseModel):
+    organizer: PublicOrganizer
+    upcoming_games: list[Game] = Field(default_factory=list)
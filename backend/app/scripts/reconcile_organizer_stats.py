@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List
+
+from ..services.organizer_stats_repository import SPORT_ROLLUPS_TABLE, SportRollup, replace_rollups
+from ..services.storage_backend import StorageClient, get_storage_client
+
+PAGE_SIZE = 1000
+BOOKINGS_CHUNK = 100
+
+
+def _fetch_all(client: StorageClient, table: str, columns: str, **filters: str) -> Iterable[Dict[str, Any]]:
+    offset = 0
+    while True:
+        query = client.table(table).select(columns)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        rows = query.order("id").range(offset, offset + PAGE_SIZE - 1).execute().data or []
+        yield from rows
+        if len(rows) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
+
+
+def _existing_cancellations(client: StorageClient, organiser_id: str) -> Dict[str, int]:
+    # Cancelled bookings are deleted, so cancellation counts cannot be rebuilt from rows; keep them.
+    response = (
+        client.table(SPORT_ROLLUPS_TABLE)
+        .select("sport_code,cancellations")
+        .eq("organiser_id", organiser_id)
+        .execute()
+    )
+    return {row["sport_code"]: row.get("cancellations") or 0 for row in response.data or []}
+
+
+def rebuild(client: StorageClient, organiser_id: str) -> tuple[List[SportRollup], Dict[str, int]]:
+    games = list(_fetch_all(client, "games", "id,sport_code,players", organiser_id=organiser_id))
+    cancellations = _existing_cancellations(client, organiser_id)
+    sports: Dict[str, SportRollup] = {}
+    players: Counter[str] = Counter()
+
+    bookers: Dict[str, set[str]] = defaultdict(set)
+    game_ids = [game["id"] for game in games]
+    for start in range(0, len(game_ids), BOOKINGS_CHUNK):
+        chunk = game_ids[start : start + BOOKINGS_CHUNK]
+        response = client.table("bookings").select("game_id,user_id").in_("game_id", chunk).execute()
+        for row in response.data or []:
+            bookers[row["game_id"]].add(row["user_id"])
+
+    for game in games:
+        rollup = sports.setdefault(
+            game["sport_code"],
+            SportRollup(
+                organiser_id=organiser_id,
+                sport_code=game["sport_code"],
+                cancellations=cancellations.get(game["sport_code"], 0),
+            ),
+        )
+        rollup.games_hosted += 1
+        rollup.capacity_total += max(game.get("players") or 0, 0)
+        user_ids = bookers.get(game["id"], set())
+        rollup.bookings_total += len(user_ids)
+        players.update(user_ids)
+
+    for sport_code, count in cancellations.items():
+        if sport_code not in sports and count:
+            sports[sport_code] = SportRollup(organiser_id=organiser_id, sport_code=sport_code, cancellations=count)
+
+    return list(sports.values()), dict(players)
+
+
+def _organiser_ids(client: StorageClient) -> List[str]:
+    return [row["id"] for row in _fetch_all(client, "organizers", "id")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild organizer stats rollups from games and bookings.")
+    parser.add_argument("--organiser-id", action="append", help="Only reconcile these organisers (repeatable).")
+    parser.add_argument("--dry-run", action="store_true", help="Print the rebuilt counters without writing them.")
+    args = parser.parse_args()
+
+    client = get_storage_client()
+    if not client:
+        print(
+            "Storage backend is not configured. "
+            "Set SUPABASE_URL and SERVICE_ROLE (or STORAGE_BACKEND=sqlite) in backend/.env before reconciling.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    organiser_ids = args.organiser_id or _organiser_ids(client)
+    for organiser_id in organiser_ids:
+        sports, players = rebuild(client, organiser_id)
+        games = sum(rollup.games_hosted for rollup in sports)
+        print(f"{organiser_id}: {games} games across {len(sports)} sports, {len(players)} players")
+        if not args.dry_run:
+            replace_rollups(organiser_id, sports, players)
+
+    print(f"Reconciled {len(organiser_ids)} organisers{' (dry run)' if args.dry_run else ''}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 
-from ..services import email_service
+from .send_campaign import CHECKPOINT_DIR, CampaignError, Recipient, run_campaign
 
 BETA_TESTERS = [
     "adeoluwaamori@gmail.com",
@@ -26,14 +26,17 @@ BETA_TESTERS = [
 ]
 
 
-def send_invites(*, dry_run: bool = False, link: str = "https://playbud.site") -> None:
-    for email in BETA_TESTERS:
-        if dry_run:
-            print(f"[DRY-RUN] Would send beta invite to {email}")
-            continue
-        sent = email_service.send_beta_invite_email(recipient=email, link=link)
-        status = "sent" if sent else "failed"
-        print(f"{status.upper()}: {email}")
+def send_invites(*, dry_run: bool = False, link: str = "https://playbud.site", workers: int = 4, rate: float = 5.0) -> None:
+    report = run_campaign(
+        "beta-invite",
+        [Recipient(email=email) for email in BETA_TESTERS],
+        checkpoint_path=CHECKPOINT_DIR / "beta-invite.sent",
+        workers=workers,
+        rate=rate,
+        dry_run=dry_run,
+        link=link,
+    )
+    print(report.summary())
 
 
 def main() -> None:
@@ -44,13 +47,18 @@ def main() -> None:
         default="https://playbud.site",
         help="MVP link to include in the invite.",
     )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent SMTP sessions.")
+    parser.add_argument("--rate", type=float, default=5.0, help="Maximum emails per second.")
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Print recipients without sending emails.",
     )
     args = parser.parse_args()
-    send_invites(dry_run=args.dry_run, link=args.link)
+    try:
+        send_invites(dry_run=args.dry_run, link=args.link, workers=args.workers, rate=args.rate)
+    except CampaignError as exc:
+        parser.exit(1, f"{exc}\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,249 @@
+"""
+Send a bulk email campaign with bounded concurrency, rate limiting and resume support.
+
+Usage:
+    python -m app.scripts.send_campaign beta-invite --recipients-file testers.csv
+    python -m app.scripts.send_campaign beta-invite --from-users --workers 4 --rate 5
+
+Recipients files hold one address per line, optionally followed by ",Name".
+Every successful send is appended to a checkpoint file, so rerunning the same
+campaign after a failure only sends to the addresses that were missed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+from ..core.config import get_settings
+from ..services import email_service
+from ..services.smtp_pool import SMTPConnectionPool
+
+CHECKPOINT_DIR = Path(__file__).resolve().parent.parent / "storage" / "campaigns"
+
+TEMPLATES: dict[str, Callable[..., email_service.RenderedEmail]] = {
+    "beta-invite": email_service.render_beta_invite_email,
+}
+
+
+class CampaignError(Exception):
+    """Raised when a campaign cannot start, before any recipient is processed."""
+
+
+@dataclass
+class Recipient:
+    email: str
+    name: str | None = None
+
+
+@dataclass
+class CampaignReport:
+    total: int = 0
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.sent} sent, {self.failed} failed, {self.skipped} skipped of {self.total} "
+            f"in {self.elapsed:.1f}s ({self.throughput:.2f} emails/s)"
+        )
+
+
+class RateLimiter:
+    """Token bucket shared by every worker thread."""
+
+    def __init__(self, per_second: float, burst: int = 1) -> None:
+        self.per_second = per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.per_second <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.per_second)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.per_second
+            time.sleep(wait)
+
+
+class Checkpoint:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.done: set[str] = set()
+        if path.exists():
+            self.done = {line.strip().lower() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()}
+
+    def mark(self, email: str) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(f"{email.lower()}\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            self.done.add(email.lower())
+
+
+def recipients_from_file(path: Path) -> list[Recipient]:
+    recipients: list[Recipient] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        email, _, name = line.partition(",")
+        recipients.append(Recipient(email=email.strip(), name=name.strip() or None))
+    return recipients
+
+
+def recipients_from_users() -> list[Recipient]:
+    from ..services import user_repository
+
+    return [Recipient(email=str(user.email), name=user.name or None) for user in user_repository.list_users()]
+
+
+def _dedupe(recipients: Iterable[Recipient]) -> list[Recipient]:
+    seen: set[str] = set()
+    unique: list[Recipient] = []
+    for recipient in recipients:
+        key = recipient.email.lower()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(recipient)
+    return unique
+
+
+def run_campaign(
+    template: str,
+    recipients: Iterable[Recipient],
+    *,
+    checkpoint_path: Path,
+    workers: int = 4,
+    rate: float = 5.0,
+    personalise: bool = False,
+    dry_run: bool = False,
+    **template_kwargs,
+) -> CampaignReport:
+    render = TEMPLATES[template]
+    queue = _dedupe(recipients)
+    checkpoint = Checkpoint(checkpoint_path)
+    report = CampaignReport(total=len(queue))
+
+    todo = [recipient for recipient in queue if recipient.email.lower() not in checkpoint.done]
+    report.skipped = len(queue) - len(todo)
+
+    rendered_cache: dict[str | None, email_service.RenderedEmail] = {}
+    render_lock = threading.Lock()
+
+    def rendered_for(recipient: Recipient) -> email_service.RenderedEmail:
+        key = recipient.name if personalise else None
+        with render_lock:
+            if key not in rendered_cache:
+                rendered_cache[key] = render(name=key, **template_kwargs)
+            return rendered_cache[key]
+
+    if dry_run:
+        for recipient in todo:
+            print(f"[DRY-RUN] Would send {template} to {recipient.email}")
+        return report
+    if not email_service.can_send():
+        # Fail before touching the checkpoint so a fixed rerun still reaches everyone.
+        raise CampaignError("SMTP is not configured (SMTP_HOST, SMTP_USERNAME, SMTP_PASSWORD, MAIL_FROM)")
+
+    settings = get_settings()
+    pool = SMTPConnectionPool(
+        host=settings.smtp_host,
+        port=settings.smtp_port,
+        username=settings.smtp_username,
+        password=settings.smtp_password,
+        size=workers,
+        idle_timeout=settings.smtp_pool_idle_seconds,
+    )
+    limiter = RateLimiter(rate, burst=workers)
+    counter_lock = threading.Lock()
+
+    def send_one(recipient: Recipient) -> None:
+        rendered = rendered_for(recipient)
+        message = email_service.build_message(
+            subject=rendered.subject,
+            recipient=recipient.email,
+            text_body=rendered.text_body,
+            html_body=rendered.html_body,
+        )
+        limiter.acquire()
+        try:
+            pool.send(message)
+        except Exception as exc:  # noqa: BLE001
+            with counter_lock:
+                report.failed += 1
+                report.failures.append(recipient.email)
+            print(f"FAILED: {recipient.email} ({exc})")
+            return
+        checkpoint.mark(recipient.email)
+        with counter_lock:
+            report.sent += 1
+        print(f"SENT: {recipient.email}")
+
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="campaign") as executor:
+            list(executor.map(send_one, todo))
+    finally:
+        report.elapsed = time.monotonic() - started
+        pool.close()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Send a PlayBud email campaign.")
+    parser.add_argument("template", choices=sorted(TEMPLATES), help="Email template to send.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--recipients-file", type=Path, help="File with one 'email[,name]' per line.")
+    source.add_argument("--from-users", action="store_true", help="Send to every row in the users table.")
+    parser.add_argument("--link", type=str, default="https://playbud.site", help="Link included in the email.")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent SMTP sessions.")
+    parser.add_argument("--rate", type=float, default=5.0, help="Maximum emails per second (0 = unlimited).")
+    parser.add_argument("--campaign", type=str, default=None, help="Checkpoint name; defaults to the template.")
+    parser.add_argument("--personalise", action="store_true", help="Greet recipients by name when known.")
+    parser.add_argument("--dry-run", action="store_true", help="Print recipients without sending emails.")
+    args = parser.parse_args()
+
+    recipients = recipients_from_file(args.recipients_file) if args.recipients_file else recipients_from_users()
+    try:
+        report = run_campaign(
+            args.template,
+            recipients,
+            checkpoint_path=CHECKPOINT_DIR / f"{args.campaign or args.template}.sent",
+            workers=args.workers,
+            rate=args.rate,
+            personalise=args.personalise,
+            dry_run=args.dry_run,
+            link=args.link,
+        )
+    except CampaignError as exc:
+        parser.exit(1, f"{exc}\n")
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
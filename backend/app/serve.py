@@ -0,0 +1,69 @@
+"""Production entry point: ``python -m app.serve``.
+
+Runs ``WEB_WORKERS`` uvicorn worker processes (default: one per CPU the container
+may use) on uvloop and httptools when they are installed. Each worker keeps its own
+in-process caches and its own outbox, reminder, warm-up and probe threads;
+invalidations reach the other workers through ``services.cache_bus``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+
+from .core.config import get_settings
+
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually use: its affinity mask, capped by a cgroup v2 CPU quota.
+
+    ``os.cpu_count()`` reports the host's CPUs, which inside a container is usually far
+    more than the quota allows.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - macOS has no affinity API
+        cpus = os.cpu_count() or 1
+    try:
+        quota, period = Path(CGROUP_CPU_MAX).read_text().split()[:2]
+    except (OSError, ValueError):
+        return max(cpus, 1)
+    if quota != "max" and int(period) > 0:
+        cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    return max(cpus, 1)
+
+
+def uvicorn_options() -> dict[str, Any]:
+    settings = get_settings()
+    return {
+        "host": settings.web_host,
+        "port": settings.web_port,
+        "workers": settings.web_workers or available_cpus(),
+        "loop": "uvloop" if _available("uvloop") else "asyncio",
+        "http": "httptools" if _available("httptools") else "h11",
+        "timeout_keep_alive": settings.web_keepalive_seconds,
+    }
+
+
+def main() -> None:
+    options = uvicorn_options()
+    print(
+        f"Serving on {options['host']}:{options['port']} with {options['workers']} workers "
+        f"({options['loop']}, {options['http']})"
+    )
+    uvicorn.run("app.main:app", **options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from datetime import datetime, timezone
+from threading import Lock, Timer
+from typing import Optional
+
+from ..core.config import admin_email_set, get_settings
+from ..schemas.games import Game
+from . import email_outbox, email_service
+
+settings = get_settings()
+
+# Pending digest entries live next to the outbox they feed, so every worker sees them and
+# they survive a restart.
+DIGEST_FILE = email_outbox.OUTBOX_FILE
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS admin_digest_pending (
+    game_id TEXT PRIMARY KEY,
+    game_json TEXT NOT NULL,
+    organiser_name TEXT,
+    flush_after REAL NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS admin_digest_flush_idx ON admin_digest_pending (flush_after);
+"""
+
+_db_lock = Lock()
+_conn: Optional[sqlite3.Connection] = None
+_timer_lock = Lock()
+_timer: Optional[Timer] = None
+_timer_due: Optional[float] = None
+
+
+def _db() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        DIGEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DIGEST_FILE), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _conn = conn
+    return _conn
+
+
+def _hours_until(game: Game) -> float:
+    event_dt = email_service._event_datetime(game)
+    if event_dt.tzinfo is None:
+        event_dt = event_dt.replace(tzinfo=timezone.utc)
+    return (event_dt - datetime.now(tz=timezone.utc)).total_seconds() / 3600
+
+
+def _is_urgent(game: Game) -> bool:
+    return _hours_until(game) <= settings.admin_digest_urgent_hours
+
+
+def _arm(due: float) -> None:
+    """Make sure this worker wakes up to flush at ``due`` (or earlier)."""
+    global _timer, _timer_due
+    with _timer_lock:
+        if _timer is not None and _timer_due is not None and _timer_due <= due:
+            return
+        if _timer is not None:
+            _timer.cancel()
+        _timer = Timer(max(0.0, due - time.time()), _on_timer)
+        _timer.daemon = True
+        _timer_due = due
+        _timer.start()
+
+
+def _on_timer() -> None:
+    global _timer, _timer_due
+    with _timer_lock:
+        _timer, _timer_due = None, None
+    try:
+        flush()
+    except Exception as exc:  # noqa: BLE001
+        print(f"Admin digest flush failed: {exc}")
+    start()
+
+
+def notify_pending_review(*, game: Game, organiser_name: str | None) -> None:
+    """Tell admins about a new game, batched into a digest unless it starts soon."""
+    admins = sorted(admin_email_set(settings))
+    if not admins:
+        return
+
+    window = settings.admin_digest_window_minutes
+    if window <= 0 or _is_urgent(game):
+        email_service.send_game_pending_review_to_admins(game=game, organiser_name=organiser_name, admin_emails=admins)
+        return
+
+    now = time.time()
+    with _db_lock:
+        # Joining the open batch keeps its deadline; the first game of a batch opens a new window.
+        row = _db().execute(
+            "INSERT INTO admin_digest_pending (game_id, game_json, organiser_name, flush_after, created_at)"
+            " VALUES (?, ?, ?, COALESCE((SELECT MIN(flush_after) FROM admin_digest_pending), ?), ?)"
+            " ON CONFLICT (game_id) DO UPDATE SET game_json = excluded.game_json,"
+            " organiser_name = excluded.organiser_name"
+            " RETURNING flush_after",
+            (game.id, game.model_dump_json(), organiser_name, now + window * 60, now),
+        ).fetchone()
+    _arm(row["flush_after"])
+
+
+def pending_count() -> int:
+    with _db_lock:
+        return _db().execute("SELECT COUNT(*) FROM admin_digest_pending").fetchone()[0]
+
+
+def _claim(now: Optional[float]) -> list[sqlite3.Row]:
+    # Deleting the rows is the claim: when several workers flush at once only one gets the batch.
+    with _db_lock:
+        db = _db()
+        if now is None:
+            return db.execute("DELETE FROM admin_digest_pending RETURNING *").fetchall()
+        return db.execute("DELETE FROM admin_digest_pending WHERE flush_after <= ? RETURNING *", (now,)).fetchall()
+
+
+def flush(*, force: bool = False) -> int:
+    """Send the digest for every entry whose window has closed (every entry with ``force``)."""
+    rows = sorted(_claim(None if force else time.time()), key=lambda row: row["created_at"])
+    if not rows:
+        return 0
+
+    batch = [(Game.model_validate_json(row["game_json"]), row["organiser_name"]) for row in rows]
+    admins = sorted(admin_email_set(settings))
+    if len(batch) == 1:
+        game, organiser_name = batch[0]
+        email_service.send_game_pending_review_to_admins(game=game, organiser_name=organiser_name, admin_emails=admins)
+    else:
+        email_service.send_admin_pending_digest_email(games=batch, admin_emails=admins)
+    return len(batch)
+
+
+def start() -> None:
+    """Arm the flush timer for entries left by a previous run or by another worker."""
+    with _db_lock:
+        due = _db().execute("SELECT MIN(flush_after) FROM admin_digest_pending").fetchone()[0]
+    if due is not None:
+        _arm(due)
+
+
+def stop() -> None:
+    """Send whatever is already due and leave the rest for the next start; nothing is lost."""
+    global _timer, _timer_due
+    with _timer_lock:
+        if _timer is not None:
+            _timer.cancel()
+        _timer, _timer_due = None, None
+    flush()
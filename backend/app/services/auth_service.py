@@ -1,12 +1,10 @@
 from fastapi import HTTPException, status
-from google.oauth2 import id_token as google_id_token
-from google.auth.transport import requests as google_requests
 from uuid import uuid4
 
 from ..core import security
 from ..core.config import get_settings
 from ..schemas.auth import PasswordResetRequest, UserCreate, UserLogin, TokenResponse, UserBase, GoogleAuthRequest
-from . import user_repository, email_service
+from . import email_service, owner_resolver, user_repository
 
 settings = get_settings()
 
@@ -89,6 +87,10 @@ def _verify_google_id_token(id_token: str) -> dict:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Google login is not configured.",
         )
+    # google-auth (and requests under it) is only needed by this endpoint; keep it off the import path.
+    from google.auth.transport import requests as google_requests
+    from google.oauth2 import id_token as google_id_token
+
     try:
         return google_id_token.verify_oauth2_token(
             id_token,
@@ -137,6 +139,7 @@ def login_with_google(payload: GoogleAuthRequest) -> TokenResponse:
             updates["heard_about"] = payload.heard_about
         if updates:
             record = user_repository.update_user_fields(record.id, updates)
+            owner_resolver.forget_user(record.id)
 
     access_token = security.create_access_token(record.id)
     refresh_token = security.create_refresh_token(record.id)
@@ -1,24 +1,27 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel
 from postgrest.exceptions import APIError
-from supabase import Client
 
-from .supabase_client import get_supabase_client, SupabaseUnavailableError
+from .storage_backend import get_storage_client
+from .supabase_client import SupabaseUnavailableError
 from ..schemas.bookings import Booking
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 BOOKINGS_TABLE = "bookings"
 
 
 def _client() -> Client:
-    client = get_supabase_client()
+    client = get_storage_client()
     if client is None:
         raise SupabaseUnavailableError(
-            "Supabase client is not configured. Ensure SUPABASE_URL and SERVICE_ROLE environment variables are set."
+            "Storage backend is not configured. Set SUPABASE_URL and SERVICE_ROLE, or STORAGE_BACKEND=sqlite."
         )
     return client
 
@@ -130,6 +133,14 @@ def count_active_bookings(game_id: str) -> int:
     return response.count or 0
 
 
+def count_bookings_for_games(game_ids: list[str]) -> dict[str, int]:
+    if not game_ids:
+        return {}
+    # Grouped in the database (migration 0006): one row per game, so max-rows cannot truncate it.
+    response = _client().rpc("count_bookings_for_games", {"p_game_ids": sorted(set(game_ids))}).execute()
+    return {str(item["game_id"]): int(item["bookings"]) for item in response.data or []}
+
+
 def delete_booking(booking_id: str) -> Optional[Booking]:
     client = _client()
     booking = get_booking_by_id(booking_id)
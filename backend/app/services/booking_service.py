@@ -4,15 +4,19 @@ from datetime import datetime, time, timedelta
 from math import ceil
 from typing import List
 
-from ..schemas.bookings import BookingResponse, GameWithBooking
+from ..schemas.bookings import BookingParticipant, BookingResponse, GameWithBooking, ParticipantUser
 from ..schemas.games import Game
 from . import (
     booking_repository,
+    fallback_cache,
     game_repository,
     notification_service,
     email_service,
+    reminder_scheduler,
     user_repository,
-    organizer_repository,
+    organizer_service,
+    organizer_stats_service,
+    owner_resolver,
 )
 
 
@@ -72,18 +76,6 @@ def _parse_cancellation_hours(cancellation: str | None) -> float:
         return 24.0
 
 
-def _get_game_owner_user(game: Game):
-    if getattr(game, "created_by_user_id", None):
-        user_record = user_repository.get_user_by_id(game.created_by_user_id)
-        if user_record:
-            return user_record
-    if getattr(game, "organiser_id", None):
-        organizer_record = organizer_repository.get_by_id(game.organiser_id)
-        if organizer_record:
-            return user_repository.get_user_by_id(organizer_record.user_id)
-    return None
-
-
 def join_game(game_id: str, user_id: str, notes: str | None = None) -> BookingResponse:
     game = game_repository.get_game(game_id)
     if not game:
@@ -108,6 +100,8 @@ def join_game(game_id: str, user_id: str, notes: str | None = None) -> BookingRe
     updated_ids = list(dict.fromkeys([*game.participant_user_ids, user_id]))
     game_repository.update_participant_user_ids(game.id, updated_ids)
     game.participant_user_ids = updated_ids
+    organizer_stats_service.record_booking(game, user_id)
+    organizer_service.invalidate_profile(game.organiser_id)
 
     participant = user_repository.get_user_by_id(user_id)
     if participant:
@@ -116,13 +110,14 @@ def join_game(game_id: str, user_id: str, notes: str | None = None) -> BookingRe
             participant_name=participant.name,
             participant_email=participant.email,
         )
-        email_service.schedule_game_reminder_email(
+        reminder_scheduler.schedule(
             game=game,
             recipient=participant.email,
             name=participant.name,
+            user_id=participant.id,
         )
 
-    owner = _get_game_owner_user(game)
+    owner = owner_resolver.get_game_owner(game)
     if owner:
         total_players = max(game.players or 0, 0)
         half_target = max(1, ceil(total_players / 2)) if total_players else 1
@@ -175,6 +170,10 @@ def cancel_booking(booking_id: str, user_id: str) -> BookingResponse:
         game_repository.update_participant_user_ids(game.id, updated_ids)
         game.participant_user_ids = updated_ids
 
+    reminder_scheduler.cancel(game.id, user_id=booking.user_id)
+    organizer_stats_service.record_cancellation(game, booking.user_id)
+    organizer_service.invalidate_profile(game.organiser_id)
+
     if game.organiser_id:
         notification_service.notify_organizer_cancellation(game.organiser_id, booking)
 
@@ -186,6 +185,30 @@ def get_game_participants(game_id: str) -> List[BookingResponse]:
     return [BookingResponse(**booking.dict()) for booking in bookings]
 
 
+def _load_participant_details(game_id: str) -> List[BookingParticipant]:
+    bookings = booking_repository.get_game_participants(game_id)
+    users = {user.id: user for user in user_repository.get_users_by_ids([booking.user_id for booking in bookings])}
+    participants: List[BookingParticipant] = []
+    for booking in bookings:
+        user = users.get(booking.user_id)
+        participants.append(
+            BookingParticipant(
+                booking_id=booking.id,
+                user=ParticipantUser(
+                    id=booking.user_id,
+                    name=user.name if user else None,
+                    avatar_url=getattr(user, "avatar_url", None) if user else None,
+                ),
+                joined_at=booking.joined_at,
+            )
+        )
+    return participants
+
+
+def get_game_participant_details(game_id: str) -> List[BookingParticipant]:
+    return fallback_cache.read_through(("participants", game_id), lambda: _load_participant_details(game_id))
+
+
 def get_user_bookings(user_id: str) -> List[BookingResponse]:
     bookings = booking_repository.get_user_bookings(user_id)
     return [BookingResponse(**booking.dict()) for booking in bookings]
@@ -193,17 +216,19 @@ def get_user_bookings(user_id: str) -> List[BookingResponse]:
 
 def get_my_games(user_id: str) -> List[GameWithBooking]:
     bookings = booking_repository.get_user_bookings(user_id)
+    game_ids = [booking.game_id for booking in bookings]
+    games = {game.id: game for game in game_repository.get_games_by_ids(game_ids)}
+    counts = booking_repository.count_bookings_for_games(game_ids)
     results: List[GameWithBooking] = []
     for booking in bookings:
-        game = game_repository.get_game(booking.game_id)
+        game = games.get(booking.game_id)
         if not game:
             continue
-        participants = booking_repository.count_active_bookings(booking.game_id)
         results.append(
             GameWithBooking(
                 game=game,
                 booking=BookingResponse(**booking.dict()),
-                participants_count=participants,
+                participants_count=counts.get(booking.game_id, 0),
             )
         )
     return results
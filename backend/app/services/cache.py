@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from ..core import metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+CACHE_LOOKUPS = metrics.Counter(
+    "playbud_cache_lookups_total", "Lookups against named in-process caches.", ("cache", "result")
+)
+_named: dict[str, "TTLCache"] = {}
+
+
+class TTLCache(Generic[K, V]):
+    """Small thread-safe LRU cache whose entries also expire after ``ttl_seconds``.
+
+    Caches given a ``name`` report lookups, hit ratio and size on ``/metrics``.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024, name: str | None = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.name = name
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+        if name is not None:
+            _named[name] = self
+
+    def get(self, key: K) -> Optional[V]:
+        value = self._get(key)
+        if self.name is not None:
+            CACHE_LOOKUPS.inc(self.name, "miss" if value is None else "hit")
+        return value
+
+    def _get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: K, loader: Callable[[], V]) -> V:
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        with self._lock:
+            stale = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def named_caches() -> dict[str, TTLCache]:
+    return dict(_named)
+
+
+def _hit_ratios() -> dict[tuple[str, ...], float]:
+    ratios = {}
+    for name in list(_named):
+        hits, misses = CACHE_LOOKUPS.value(name, "hit"), CACHE_LOOKUPS.value(name, "miss")
+        if hits + misses:
+            ratios[(name,)] = hits / (hits + misses)
+    return ratios
+
+
+metrics.CallbackGauge(
+    "playbud_cache_entries",
+    "Entries currently held by named in-process caches.",
+    lambda: {(name,): float(len(cache)) for name, cache in list(_named.items())},
+    ("cache",),
+)
+metrics.CallbackGauge(
+    "playbud_cache_hit_ratio", "Share of lookups served from cache since start.", _hit_ratios, ("cache",)
+)
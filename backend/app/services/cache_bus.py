@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import secrets
+import struct
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Iterator, Optional
+
+from ..core.config import get_settings
+
+RING_SIZE = 512
+KEY_BYTES = 64
+UNKEYED = 0xFFFF
+HEAD = struct.Struct("<Q")
+# sequence, publisher id, channel id, key length (UNKEYED for "everything"), key
+ENTRY = struct.Struct(f"<QIIH{KEY_BYTES}s")
+FILE_SIZE = HEAD.size + RING_SIZE * ENTRY.size
+POLL_INTERVAL_SECONDS = 0.25
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "storage"
+
+Callback = Callable[[Optional[str]], None]
+
+
+def _channel_id(channel: str) -> int:
+    return zlib.crc32(channel.encode("utf-8"))
+
+
+def _offset(seq: int) -> int:
+    return HEAD.size + (seq % RING_SIZE) * ENTRY.size
+
+
+class CacheBus:
+    """Cross-process cache invalidation through a ring of recent invalidations in a shared mmap'd file.
+
+    Every worker maps the same small file. ``publish`` appends ``(channel, key)`` to the
+    ring under an exclusive file lock. A watcher thread reads the entries other workers
+    appended since its last poll and hands each key to the channel's callbacks, so
+    subscribers drop just that entry. A callback receives ``None`` when the publisher
+    named no key or the poller fell more than a full ring behind: drop everything then.
+    Workers keep their own caches and share nothing but this ring.
+    """
+
+    def __init__(self, path: Path | str, poll_interval: float = POLL_INTERVAL_SECONDS) -> None:
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked():
+            if os.fstat(self._fd).st_size < FILE_SIZE:
+                os.ftruncate(self._fd, FILE_SIZE)
+        self._map = mmap.mmap(self._fd, FILE_SIZE)
+        # Distinguishes this mapping's own entries from other workers' (several may share a pid in tests).
+        self._origin = secrets.randbits(32)
+        self._lock = Lock()
+        self._callbacks: dict[str, list[Callback]] = {}
+        self._channels: dict[int, str] = {}
+        self._seen = HEAD.unpack_from(self._map, 0)[0]
+        self._stop = Event()
+        self._watcher: Optional[Thread] = None
+
+    @contextmanager
+    def _locked(self, mode: int = fcntl.LOCK_EX) -> Iterator[None]:
+        fcntl.flock(self._fd, mode)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def subscribe(self, channel: str, callback: Callback) -> None:
+        with self._lock:
+            self._callbacks.setdefault(channel, []).append(callback)
+            self._channels[_channel_id(channel)] = channel
+
+    def publish(self, channel: str, key: Optional[str] = None) -> None:
+        """Tell other workers that ``key`` (or, with no key, all of ``channel``) changed.
+
+        The caller updates its own cache itself; its own entries are skipped when it polls.
+        """
+        raw = key.encode("utf-8") if key is not None else b""
+        if len(raw) > KEY_BYTES:
+            key, raw = None, b""
+        with self._lock, self._locked():
+            seq = HEAD.unpack_from(self._map, 0)[0] + 1
+            ENTRY.pack_into(
+                self._map, _offset(seq), seq, self._origin, _channel_id(channel), UNKEYED if key is None else len(raw), raw
+            )
+            HEAD.pack_into(self._map, 0, seq)
+
+    def poll(self) -> list[tuple[str, Optional[str]]]:
+        """Run callbacks for entries other workers published since the last poll; returns them."""
+        with self._lock:
+            with self._locked(fcntl.LOCK_SH):
+                head = HEAD.unpack_from(self._map, 0)[0]
+                behind = head - self._seen
+                entries = (
+                    [ENTRY.unpack_from(self._map, _offset(seq)) for seq in range(self._seen + 1, head + 1)]
+                    if 0 < behind <= RING_SIZE
+                    else []
+                )
+            self._seen = head
+            channels = dict(self._channels)
+
+        events: list[tuple[str, Optional[str]]] = []
+        if behind > RING_SIZE:
+            # Entries were overwritten before we read them; we cannot tell which keys changed.
+            events = [(channel, None) for channel in channels.values()]
+        for _, origin, channel_id, length, raw in entries:
+            channel = channels.get(channel_id)
+            if origin == self._origin or channel is None:
+                continue
+            events.append((channel, None if length == UNKEYED else raw[:length].decode("utf-8")))
+        for channel, key in events:
+            self._notify(channel, key)
+        return events
+
+    def _notify(self, channel: str, key: Optional[str]) -> None:
+        for callback in list(self._callbacks.get(channel, ())):
+            try:
+                callback(key)
+            except Exception as exc:  # a broken subscriber must not stop the watcher
+                print(f"Cache bus callback for {channel} failed: {exc}")
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.poll()
+
+    def start(self) -> None:
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = Thread(target=self._watch, name="cache-bus", daemon=True)
+        self._watcher.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=self.poll_interval * 4)
+        self._watcher = None
+
+    def close(self) -> None:
+        self.stop()
+        self._map.close()
+        os.close(self._fd)
+
+
+_settings = get_settings()
+_bus: Optional[CacheBus] = None
+_bus_lock = Lock()
+# Subscriptions made at import time wait here so importing a module never touches the file.
+_pending: list[tuple[str, Callback]] = []
+
+
+def get_bus() -> CacheBus:
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                bus = CacheBus(_settings.cache_bus_path or DATA_DIR / "cache_bus.mmap")
+                for channel, callback in _pending:
+                    bus.subscribe(channel, callback)
+                _pending.clear()
+                _bus = bus
+    return _bus
+
+
+def publish(channel: str, key: Optional[str] = None) -> None:
+    get_bus().publish(channel, key)
+
+
+def subscribe(channel: str, callback: Callback) -> None:
+    with _bus_lock:
+        if _bus is None:
+            _pending.append((channel, callback))
+            return
+    _bus.subscribe(channel, callback)
+
+
+def start() -> None:
+    get_bus().start()
+
+
+def stop() -> None:
+    if _bus is not None:
+        _bus.stop()
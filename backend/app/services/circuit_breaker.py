@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"{name} is unavailable; failing fast while the circuit is open.")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker with a background recovery probe.
+
+    The breaker looks at the last ``window`` outcomes and opens once at least
+    ``min_calls`` of them exist and the failure ratio reaches ``failure_ratio``.
+    While open every call fails immediately; a daemon thread runs ``probe``
+    every ``probe_interval`` seconds and closes the circuit on the first success,
+    so no user request is spent discovering that the dependency is back.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_ratio: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        probe_interval: float = 5.0,
+        probe: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.probe_interval = probe_interval
+        self.probe = probe
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._lock = Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._stop = Event()
+        self._prober: Optional[Thread] = None
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def is_open(self) -> bool:
+        return self._state == OPEN
+
+    def open_for(self) -> float:
+        """Seconds the circuit has been open, or 0 when closed."""
+        return time.monotonic() - self._opened_at if self._state == OPEN else 0.0
+
+    def before_call(self) -> None:
+        if self._state != OPEN:
+            return
+        if self.probe is None and self.open_for() >= self.probe_interval:
+            # Without a probe, let traffic through again once the cool-down has passed.
+            self.close()
+            return
+        raise CircuitOpenError(self.name, self.probe_interval)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._outcomes.append(False)
+            if self._state == OPEN or len(self._outcomes) < self.min_calls:
+                return
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) < self.failure_ratio:
+                return
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+        print(f"Circuit '{self.name}' opened after {failures} failures in {len(self._outcomes)} calls.")
+        self._start_prober()
+
+    def close(self) -> None:
+        with self._lock:
+            was_open = self._state == OPEN
+            self._state = CLOSED
+            self._outcomes.clear()
+        if was_open:
+            print(f"Circuit '{self.name}' closed; dependency recovered.")
+
+    def _start_prober(self) -> None:
+        if self.probe is None:
+            return
+        if self._prober is not None and self._prober.is_alive():
+            return
+        self._stop.clear()
+        self._prober = Thread(target=self._probe_loop, name=f"{self.name}-circuit-probe", daemon=True)
+        self._prober.start()
+
+    def _probe_loop(self) -> None:
+        while self._state == OPEN and not self._stop.wait(self.probe_interval):
+            try:
+                healthy = self.probe()
+            except Exception:  # noqa: BLE001
+                healthy = False
+            if healthy:
+                self.close()
+
+    def stop(self) -> None:
+        self._stop.set()
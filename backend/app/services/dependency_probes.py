@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import time
+from threading import Event, Lock, Thread
+from typing import Callable, NamedTuple, Optional
+
+from ..core import metrics
+from ..core.config import get_settings
+from . import email_outbox, email_service, metadata_repository, reminder_scheduler, supabase_client
+from .cache import named_caches
+from .smtp_pool import get_smtp_pool
+from .sqlite_client import SQLiteClient
+from .storage_backend import get_storage_client
+
+settings = get_settings()
+
+OK = "ok"
+DOWN = "down"
+SKIPPED = "skipped"
+# Requests cannot be served without these; the rest only degrade features.
+CRITICAL = frozenset({"storage"})
+
+
+class ProbeFailed(Exception):
+    """Raised by a probe to report its dependency as down with a reason."""
+
+
+class ProbeResult(NamedTuple):
+    status: str
+    latency_ms: float
+    checked_at: float
+    detail: Optional[dict] = None
+    error: Optional[str] = None
+
+    def as_dict(self, now: float, max_age: float) -> dict:
+        age = now - self.checked_at
+        entry = {
+            # A result older than a few intervals means the prober itself is stuck.
+            "status": self.status if age <= max_age else "stale",
+            "latency_ms": self.latency_ms,
+            "age_seconds": round(age, 1),
+        }
+        if self.detail:
+            entry["detail"] = self.detail
+        if self.error:
+            entry["error"] = self.error
+        return entry
+
+
+def _probe_storage() -> Optional[dict]:
+    client = get_storage_client()
+    if client is None:
+        raise ProbeFailed("Storage backend is not configured")
+    if isinstance(client, SQLiteClient):
+        client.run(lambda conn: conn.execute("SELECT 1").fetchone())
+        return {"backend": "sqlite"}
+    if supabase_client.breaker.is_open():
+        raise ProbeFailed("Circuit breaker is open")
+    if not supabase_client.ping():
+        raise ProbeFailed("Supabase did not answer")
+    return {"backend": "supabase", "circuit": supabase_client.breaker.state}
+
+
+def _probe_smtp() -> Optional[dict]:
+    if not email_service.can_send():
+        return None
+    with get_smtp_pool().session() as server:
+        code, _ = server.noop()
+    if code != 250:
+        raise ProbeFailed(f"NOOP returned {code}")
+    return {"open_connections": get_smtp_pool().open_connections()}
+
+
+def _probe_local_caches() -> Optional[dict]:
+    age = metadata_repository.reference_data_age()
+    return {
+        "reference_data_age_seconds": round(age, 1) if age is not None else None,
+        "email_outbox_pending": email_outbox.pending_count(),
+        "reminders_pending": reminder_scheduler.pending_count(),
+        "cache_entries": {name: len(cache) for name, cache in named_caches().items()},
+    }
+
+
+PROBES: dict[str, Callable[[], Optional[dict]]] = {
+    "storage": _probe_storage,
+    "smtp": _probe_smtp,
+    "local_caches": _probe_local_caches,
+}
+
+_lock = Lock()
+_results: dict[str, ProbeResult] = {}
+_stop = Event()
+_thread: Optional[Thread] = None
+
+
+def _run_probe(probe: Callable[[], Optional[dict]]) -> ProbeResult:
+    start = time.perf_counter()
+    status, detail, error = OK, None, None
+    try:
+        detail = probe()
+        if detail is None:
+            status = SKIPPED
+    except Exception as exc:  # noqa: BLE001
+        status, error = DOWN, str(exc) or exc.__class__.__name__
+    return ProbeResult(status, round((time.perf_counter() - start) * 1000, 2), time.time(), detail, error)
+
+
+def run_once(probes: Optional[dict[str, Callable[[], Optional[dict]]]] = None) -> dict[str, ProbeResult]:
+    results = {name: _run_probe(probe) for name, probe in (probes or PROBES).items()}
+    with _lock:
+        _results.update(results)
+    return results
+
+
+def _loop() -> None:
+    while True:
+        run_once()
+        if _stop.wait(settings.dependency_probe_interval_seconds):
+            return
+
+
+def start() -> None:
+    """Probe on a fixed interval in the background; readiness checks only read the latest results."""
+    global _thread
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _stop.clear()
+        _thread = Thread(target=_loop, name="dependency-probes", daemon=True)
+        _thread.start()
+
+
+def stop() -> None:
+    _stop.set()
+    if _thread is not None:
+        _thread.join(timeout=5)
+
+
+def snapshot() -> dict[str, dict]:
+    now = time.time()
+    max_age = settings.dependency_probe_interval_seconds * 3
+    with _lock:
+        return {name: result.as_dict(now, max_age) for name, result in _results.items()}
+
+
+def healthy(report: dict[str, dict]) -> bool:
+    """True when every critical dependency has a fresh, passing result."""
+    return all(report.get(name, {}).get("status") == OK for name in CRITICAL)
+
+
+metrics.CallbackGauge(
+    "playbud_dependency_up",
+    "1 when the latest background probe of a dependency passed.",
+    lambda: {
+        (name,): float(result.status == OK) for name, result in list(_results.items()) if result.status != SKIPPED
+    },
+    ("dependency",),
+)
+
+
+def reset() -> None:
+    with _lock:
+        _results.clear()
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import time
+from pathlib import Path
+from threading import Condition, Lock, Thread
+from typing import Optional
+
+from ..core import metrics
+from ..core.config import get_settings
+
+settings = get_settings()
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "storage"
+OUTBOX_FILE = Path(settings.email_outbox_path) if settings.email_outbox_path else DATA_DIR / "email_outbox.sqlite3"
+
+BACKOFF_BASE_SECONDS = 30.0
+BACKOFF_MAX_SECONDS = 60.0 * 60
+# A row stuck in "sending" longer than this belonged to a worker that died mid-send.
+SENDING_LEASE_SECONDS = 5.0 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    subject TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    text_body TEXT NOT NULL,
+    html_body TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS email_outbox_due_idx ON email_outbox (status, next_attempt_at);
+"""
+
+_db_lock = Lock()
+_conn: Optional[sqlite3.Connection] = None
+_wakeup = Condition()
+_workers_lock = Lock()
+_workers: list[Thread] = []
+_stopping = False
+
+
+def _db() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        OUTBOX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(OUTBOX_FILE), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _conn = conn
+    return _conn
+
+
+def _backoff(attempts: int) -> float:
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def enqueue(*, subject: str, recipient: str, text_body: str, html_body: str) -> int:
+    now = time.time()
+    with _db_lock:
+        cursor = _db().execute(
+            "INSERT INTO email_outbox (subject, recipient, text_body, html_body, next_attempt_at, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (subject, recipient, text_body, html_body, now, now),
+        )
+        row_id = cursor.lastrowid
+    start_workers()
+    with _wakeup:
+        _wakeup.notify()
+    return row_id
+
+
+def _claim_next() -> tuple[Optional[sqlite3.Row], Optional[float]]:
+    """Mark the next due message as sending; otherwise report when the next one is due."""
+    now = time.time()
+    with _db_lock:
+        db = _db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            row = db.execute(
+                "SELECT * FROM email_outbox WHERE status = 'pending' AND next_attempt_at <= ?"
+                " ORDER BY next_attempt_at LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is not None:
+                db.execute(
+                    "UPDATE email_outbox SET status = 'sending', next_attempt_at = ? WHERE id = ?",
+                    (now + SENDING_LEASE_SECONDS, row["id"]),
+                )
+                db.execute("COMMIT")
+                return row, None
+            upcoming = db.execute(
+                "SELECT MIN(next_attempt_at) FROM email_outbox WHERE status = 'pending'"
+            ).fetchone()[0]
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+    return None, upcoming
+
+
+def _mark_sent(row_id: int) -> None:
+    with _db_lock:
+        _db().execute("DELETE FROM email_outbox WHERE id = ?", (row_id,))
+
+
+def _mark_failed(row: sqlite3.Row, error: str) -> None:
+    attempts = row["attempts"] + 1
+    if attempts >= settings.email_outbox_max_attempts:
+        status, next_attempt_at = "dead", time.time()
+        print(f"Email dead-lettered after {attempts} attempts ({row['subject']} -> {row['recipient']}): {error}")
+    else:
+        status, next_attempt_at = "pending", time.time() + _backoff(attempts)
+    with _db_lock:
+        _db().execute(
+            "UPDATE email_outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+            (status, attempts, next_attempt_at, error[:1000], row["id"]),
+        )
+
+
+def _recover_stale_claims() -> None:
+    with _db_lock:
+        _db().execute(
+            "UPDATE email_outbox SET status = 'pending', next_attempt_at = ? WHERE status = 'sending' AND next_attempt_at <= ?",
+            (time.time(), time.time()),
+        )
+
+
+def _deliver(row: sqlite3.Row) -> None:
+    from .email_service import _deliver_email
+
+    try:
+        _deliver_email(
+            subject=row["subject"],
+            recipient=row["recipient"],
+            text_body=row["text_body"],
+            html_body=row["html_body"],
+        )
+    except Exception as exc:  # noqa: BLE001
+        _mark_failed(row, str(exc) or exc.__class__.__name__)
+        return
+    _mark_sent(row["id"])
+
+
+def _worker_loop() -> None:
+    while not _stopping:
+        try:
+            row, upcoming = _claim_next()
+        except sqlite3.Error as exc:
+            print(f"Email outbox read failed: {exc}")
+            row, upcoming = None, time.time() + 5
+        if row is not None:
+            _deliver(row)
+            continue
+        timeout = SENDING_LEASE_SECONDS if upcoming is None else max(0.0, upcoming - time.time())
+        with _wakeup:
+            if not _stopping:
+                _wakeup.wait(timeout=min(timeout, SENDING_LEASE_SECONDS))
+        _recover_stale_claims()
+
+
+def start_workers() -> None:
+    global _stopping
+    if _workers and all(worker.is_alive() for worker in _workers):
+        return
+    with _workers_lock:
+        if _workers and all(worker.is_alive() for worker in _workers):
+            return
+        _stopping = False
+        _recover_stale_claims()
+        _workers.clear()
+        for index in range(max(1, settings.email_outbox_workers)):
+            worker = Thread(target=_worker_loop, name=f"email-outbox-{index}", daemon=True)
+            _workers.append(worker)
+            worker.start()
+
+
+def pending_count() -> int:
+    with _db_lock:
+        return _db().execute("SELECT COUNT(*) FROM email_outbox WHERE status != 'dead'").fetchone()[0]
+
+
+metrics.CallbackGauge("playbud_email_outbox_pending", "Emails queued or retrying in the outbox.", pending_count)
+
+
+def dead_letters(limit: int = 100) -> list[dict]:
+    with _db_lock:
+        rows = _db().execute(
+            "SELECT id, subject, recipient, attempts, last_error, created_at FROM email_outbox"
+            " WHERE status = 'dead' ORDER BY id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def drain(timeout: float = 30.0) -> bool:
+    """Block until every due message has been attempted; used by scripts before exiting."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with _db_lock:
+            due = _db().execute(
+                "SELECT COUNT(*) FROM email_outbox WHERE status = 'sending'"
+                " OR (status = 'pending' AND attempts = 0)"
+            ).fetchone()[0]
+        if not due:
+            return True
+        with _wakeup:
+            _wakeup.notify_all()
+        time.sleep(0.1)
+    return False
+
+
+def stop_workers(timeout: float = 5.0) -> None:
+    global _stopping
+    _stopping = True
+    with _wakeup:
+        _wakeup.notify_all()
+    for worker in list(_workers):
+        if worker.is_alive():
+            worker.join(timeout=timeout)
+    _workers.clear()
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import smtplib
-from datetime import datetime, timedelta
+from datetime import datetime
 from email.message import EmailMessage
 from html import escape
-from threading import Timer
-from typing import Optional
+from typing import NamedTuple, Optional
 
+from ..core import request_metrics
 from ..core.config import get_settings
 from ..schemas.games import Game
+from . import email_outbox
+from .smtp_pool import get_smtp_pool
 
 settings = get_settings()
 
@@ -30,31 +32,90 @@ def _event_datetime(game: Game) -> datetime:
     return date_value
 
 
-def _can_send() -> bool:
+def can_send() -> bool:
     return all([settings.smtp_host, settings.smtp_username, settings.smtp_password, settings.mail_from])
 
 
-def _send_email(*, subject: str, recipient: str, text_body: str, html_body: str) -> bool:
-    if not _can_send():
-        print(f"Email send skipped (missing SMTP config): {subject} -> {recipient}")
-        return False
-
+def build_message(*, subject: str, recipient: str, text_body: str, html_body: str) -> EmailMessage:
     message = EmailMessage()
     message["Subject"] = subject
     message["From"] = settings.mail_from
     message["To"] = recipient
     message.set_content(text_body)
     message.add_alternative(html_body, subtype="html")
+    return message
+
+
+def _deliver_email(*, subject: str, recipient: str, text_body: str, html_body: str) -> None:
+    """Send one message now; SMTP errors propagate so the outbox can record why it failed."""
+    message = build_message(subject=subject, recipient=recipient, text_body=text_body, html_body=html_body)
+    get_smtp_pool().send(message)
+    print(f"Email sent: {subject} -> {recipient}")
+
+
+@request_metrics.track("email")
+def _send_email(*, subject: str, recipient: str, text_body: str, html_body: str) -> bool:
+    if not can_send():
+        print(f"Email send skipped (missing SMTP config): {subject} -> {recipient}")
+        return False
+
+    if settings.email_outbox_enabled:
+        try:
+            email_outbox.enqueue(subject=subject, recipient=recipient, text_body=text_body, html_body=html_body)
+            return True
+        except Exception as exc:  # noqa: BLE001
+            print(f"Email outbox unavailable, sending inline ({subject}): {exc}")
 
     try:
-        with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port) as server:
-            server.login(settings.smtp_username, settings.smtp_password)
-            server.send_message(message)
-        print(f"Email sent: {subject} -> {recipient}")
-        return True
+        _deliver_email(subject=subject, recipient=recipient, text_body=text_body, html_body=html_body)
     except Exception as exc:  # noqa: BLE001
         print(f"Email send failure ({subject}): {exc}")
         return False
+    return True
+
+
+def _send_bulk_email(*, subject: str, recipients: list[str], text_body: str, html_body: str) -> dict[str, bool]:
+    """Send the same message to several recipients over one pooled SMTP session."""
+    results = {recipient: False for recipient in recipients}
+    if not recipients:
+        return results
+    if not can_send():
+        print(f"Email send skipped (missing SMTP config): {subject} -> {len(recipients)} recipients")
+        return results
+
+    if settings.email_outbox_enabled:
+        return {
+            recipient: _send_email(subject=subject, recipient=recipient, text_body=text_body, html_body=html_body)
+            for recipient in recipients
+        }
+
+    with request_metrics.timed("email"):
+        pending = list(recipients)
+        for attempt in range(2):
+            try:
+                with get_smtp_pool().session() as server:
+                    while pending:
+                        recipient = pending[0]
+                        message = build_message(
+                            subject=subject, recipient=recipient, text_body=text_body, html_body=html_body
+                        )
+                        try:
+                            server.send_message(message)
+                            results[recipient] = True
+                            print(f"Email sent: {subject} -> {recipient}")
+                        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as exc:
+                            if getattr(exc, "smtp_code", None) == 421:
+                                raise
+                            print(f"Email send failure ({subject} -> {recipient}): {exc}")
+                        pending.pop(0)
+                break
+            except (smtplib.SMTPServerDisconnected, ConnectionError) as exc:
+                if attempt:
+                    print(f"Email send failure ({subject}): {exc}")
+            except Exception as exc:  # noqa: BLE001
+                print(f"Email send failure ({subject}): {exc}")
+                break
+    return results
 
 
 def _hero_html(title: str, body: str, button_text: str, button_link: str, footer: Optional[str] = None) -> str:
@@ -126,7 +187,13 @@ def send_welcome_email(*, recipient: str, name: str | None = None) -> bool:
     return _send_email(subject="Welcome to PlayBud", recipient=recipient, text_body=text_body, html_body=html_body)
 
 
-def send_beta_invite_email(*, recipient: str, name: str | None = None, link: str = "https://playbud.site") -> bool:
+class RenderedEmail(NamedTuple):
+    subject: str
+    text_body: str
+    html_body: str
+
+
+def render_beta_invite_email(*, name: str | None = None, link: str = "https://playbud.site") -> RenderedEmail:
     greeting = f"Hi {name}," if name else "Hi,"
     text_body = (
         f"{greeting}\n\nI’ve been heads-down building the PlayBud MVP for the last month and would love your help as a beta tester."
@@ -140,11 +207,16 @@ def send_beta_invite_email(*, recipient: str, name: str | None = None, link: str
         "Open the MVP",
         link,
     )
+    return RenderedEmail(subject="Beta test the PlayBud MVP", text_body=text_body, html_body=html_body)
+
+
+def send_beta_invite_email(*, recipient: str, name: str | None = None, link: str = "https://playbud.site") -> bool:
+    rendered = render_beta_invite_email(name=name, link=link)
     return _send_email(
-        subject="Beta test the PlayBud MVP",
+        subject=rendered.subject,
         recipient=recipient,
-        text_body=text_body,
-        html_body=html_body,
+        text_body=rendered.text_body,
+        html_body=rendered.html_body,
     )
 
 
@@ -249,13 +321,44 @@ def send_game_pending_review_to_admins(*, game: Game, organiser_name: str | None
         "Open admin panel",
         "https://playbud.site/admin/games",
     )
-    for admin_email in admin_emails:
-        _send_email(
-          subject="New game pending approval",
-          recipient=admin_email,
-          text_body=text_body,
-          html_body=html_body,
+    _send_bulk_email(
+        subject="New game pending approval",
+        recipients=admin_emails,
+        text_body=text_body,
+        html_body=html_body,
+    )
+
+
+def send_admin_pending_digest_email(*, games: list[tuple[Game, str | None]], admin_emails: list[str]) -> None:
+    if not admin_emails or not games:
+        return
+    lines = []
+    items_html = []
+    for game, organiser_name in games:
+        event_dt = _event_datetime(game)
+        lines.append(
+            f"- \"{game.name}\" by {organiser_name or 'an organiser'} — "
+            f"{event_dt:%a %d %b %H:%M}, {game.city_slug}, {game.sport_code}"
+        )
+        items_html.append(
+            f"<strong>{escape(game.name)}</strong> by {escape(organiser_name or 'an organiser')} "
+            f"({event_dt:%a %d %b %H:%M}, {escape(game.city_slug)})"
         )
+    count = len(games)
+    noun, verb = ("game", "is") if count == 1 else ("games", "are")
+    text_body = f"{count} new {noun} {verb} waiting for review:\n\n" + "\n".join(lines)
+    html_body = _hero_html(
+        f"{count} {noun} awaiting review",
+        "<br/>".join(items_html),
+        "Open admin panel",
+        "https://playbud.site/admin/games",
+    )
+    _send_bulk_email(
+        subject=f"{count} {noun} pending approval",
+        recipients=admin_emails,
+        text_body=text_body,
+        html_body=html_body,
+    )
 
 
 def send_game_approved_email(*, game: Game, organiser_name: str | None, organiser_email: str) -> bool:
@@ -364,7 +467,7 @@ def send_booking_confirmation_email(*, game: Game, participant_name: str | None,
     return _send_email(subject="You're in for the game", recipient=participant_email, text_body=text_body, html_body=html_body)
 
 
-def _send_game_reminder_email(*, game: Game, recipient: str, name: str | None) -> None:
+def send_game_reminder_email(*, game: Game, recipient: str, name: str | None = None) -> bool:
     event_dt = _event_datetime(game)
     greeting = f"Hi {name}," if name else "Hi,"
     text_body = (
@@ -377,20 +480,7 @@ def _send_game_reminder_email(*, game: Game, recipient: str, name: str | None) -
         "View game",
         f"https://playbud.site/games/{game.id}",
     )
-    _send_email(subject="Your game starts in 6 hours", recipient=recipient, text_body=text_body, html_body=html_body)
-
-
-def schedule_game_reminder_email(*, game: Game, recipient: str, name: str | None = None) -> None:
-    event_dt = _event_datetime(game)
-    send_at = event_dt - timedelta(hours=6)
-    delay = (send_at - datetime.utcnow()).total_seconds()
-    if delay <= 0:
-        _send_game_reminder_email(game=game, recipient=recipient, name=name)
-        return
-
-    timer = Timer(delay, _send_game_reminder_email, kwargs={"game": game, "recipient": recipient, "name": name})
-    timer.daemon = True
-    timer.start()
+    return _send_email(subject="Your game starts in 6 hours", recipient=recipient, text_body=text_body, html_body=html_body)
 
 
 def send_password_reset_email(*, recipient: str, name: str | None, reset_link: str) -> bool:
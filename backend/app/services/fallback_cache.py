@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import Callable, Hashable, Optional, TypeVar
+
+import httpx
+
+from ..core.config import get_settings
+from .cache import TTLCache
+from .circuit_breaker import CircuitOpenError
+from .supabase_client import SupabaseUnavailableError
+
+T = TypeVar("T")
+
+STALE_HEADER = "X-Data-Stale"
+FALLBACK_ERRORS = (CircuitOpenError, SupabaseUnavailableError, httpx.TransportError)
+
+_last_known_good: TTLCache[Hashable, tuple[float, object]] = TTLCache(
+    get_settings().stale_cache_max_age_seconds, max_entries=2048, name="last_known_good"
+)
+# One mutable dict per request, so endpoints running in the threadpool can flag the response.
+_request_state: ContextVar[Optional[dict]] = ContextVar("fallback_request_state", default=None)
+
+
+def begin_request() -> dict:
+    state: dict = {}
+    _request_state.set(state)
+    return state
+
+
+def mark_stale(age_seconds: float) -> None:
+    state = _request_state.get()
+    if state is not None:
+        state["stale_age"] = max(state.get("stale_age", 0.0), age_seconds)
+
+
+def read_through(key: Hashable, loader: Callable[[], T]) -> T:
+    """Call ``loader`` and remember its result; serve the last good result if the database is unavailable."""
+    try:
+        value = loader()
+    except FALLBACK_ERRORS:
+        cached = _last_known_good.get(key)
+        if cached is None:
+            raise
+        stored_at, value = cached
+        mark_stale(time.time() - stored_at)
+        return value
+    if value is not None:
+        _last_known_good.set(key, (time.time(), value))
+    return value
+
+
+def clear() -> None:
+    _last_known_good.clear()
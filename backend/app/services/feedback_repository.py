@@ -1,24 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, EmailStr
 
-from supabase import Client
-
-from .supabase_client import get_supabase_client, SupabaseUnavailableError
+from .storage_backend import get_storage_client
+from .supabase_client import SupabaseUnavailableError
 from ..schemas.feedback import Feedback, FeedbackCreate
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 FEEDBACK_TABLE = "feedback"
 
 
 def _client() -> Client:
-    client = get_supabase_client()
+    client = get_storage_client()
     if client is None:
         raise SupabaseUnavailableError(
-            "Supabase client is not configured. Ensure SUPABASE_URL and SERVICE_ROLE environment variables are set."
+            "Storage backend is not configured. Set SUPABASE_URL and SERVICE_ROLE, or STORAGE_BACKEND=sqlite."
         )
     return client
 
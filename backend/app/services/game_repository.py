@@ -2,25 +2,27 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
-from supabase import Client
-
-from .supabase_client import get_supabase_client, SupabaseUnavailableError
+from .storage_backend import get_storage_client
+from .supabase_client import SupabaseUnavailableError
 from ..schemas.games import GameCreate, Game
 from ..services.helper import parse_iso_datetime, parse_iso_time
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 GAMES_TABLE = "games"
 
 
 def _client() -> Client:
-    client = get_supabase_client()
+    client = get_storage_client()
     if client is None:
         raise SupabaseUnavailableError(
-            "Supabase client is not configured. Ensure SUPABASE_URL and SERVICE_ROLE environment variables are set."
+            "Storage backend is not configured. Set SUPABASE_URL and SERVICE_ROLE, or STORAGE_BACKEND=sqlite."
         )
     return client
 
@@ -183,12 +185,54 @@ def get_game(game_id: str) -> Optional[Game]:
     return None
 
 
+def get_games_by_ids(game_ids: list[str]) -> List[Game]:
+    if not game_ids:
+        return []
+    client = _client()
+    response = client.table(GAMES_TABLE).select("*").in_("id", list(set(game_ids))).execute()
+    data = response.data or []
+    return [_record_to_game(_deserialize_supabase_record(item)) for item in data]
+
+
 def list_games(limit: int = 50) -> List[Game]:
     records = _load_games()
     records = sorted(records, key=lambda r: r.created_at, reverse=True)[:limit]
     return [_record_to_game(record) for record in records]
 
 
+def list_games_by_organizer(organizer_id: str, *, limit: int = 20, offset: int = 0) -> List[Game]:
+    client = _client()
+    response = (
+        client.table(GAMES_TABLE)
+        .select("*")
+        .eq("organiser_id", organizer_id)
+        .order("date", desc=True)
+        .order("id")
+        .range(offset, offset + limit - 1)
+        .execute()
+    )
+    data = response.data or []
+    return [_record_to_game(_deserialize_supabase_record(item)) for item in data]
+
+
+def list_upcoming_public_games_by_organizer(organizer_id: str, *, limit: int = 20) -> List[Game]:
+    client = _client()
+    response = (
+        client.table(GAMES_TABLE)
+        .select("*")
+        .eq("organiser_id", organizer_id)
+        .eq("status", "confirmed")
+        .eq("is_private", False)
+        .gte("date", datetime.utcnow().date().isoformat())
+        .order("date")
+        .order("start_time")
+        .limit(limit)
+        .execute()
+    )
+    data = response.data or []
+    return [_record_to_game(_deserialize_supabase_record(item)) for item in data]
+
+
 def update_participant_user_ids(game_id: str, participant_ids: list[str]) -> None:
     client = _client()
     now = datetime.utcnow().isoformat()
@@ -3,48 +3,55 @@ from __future__ import annotations
 from ..schemas.auth import UserBase
 from ..schemas.games import Game, GameCreate
 from . import (
+    admin_digest,
+    fallback_cache,
     game_repository,
-    organizer_service,
     email_service,
-    organizer_repository,
-    user_repository,
+    organizer_service,
+    organizer_stats_service,
+    owner_resolver,
+    reference_data_service,
+    reminder_scheduler,
 )
-from ..core.config import admin_email_set, get_settings
+
+
+class GameValidationError(Exception):
+    ...
+
+
+def _canonicalize_reference_fields(payload: GameCreate) -> GameCreate:
+    city = reference_data_service.resolve_city(payload.city_slug)
+    if city is None:
+        raise GameValidationError(f"Unknown city '{payload.city_slug}'.")
+    sport = reference_data_service.resolve_sport(payload.sport_code)
+    if sport is None:
+        raise GameValidationError(f"Unknown sport '{payload.sport_code}'.")
+    skill = reference_data_service.resolve_ability(payload.skill)
+    if skill is None:
+        raise GameValidationError(f"Unknown skill level '{payload.skill}'.")
+    return payload.model_copy(update={"city_slug": city, "sport_code": sport, "skill": skill})
 
 
 def create_game(payload: GameCreate, user: UserBase) -> Game:
+    payload = _canonicalize_reference_fields(payload)
     payload_with_creator = payload.model_copy(update={"created_by_user_id": user.id})
     game = game_repository.create_game(payload_with_creator)
-    if payload.organiser_id:
-        organizer_service.link_game_to_organizer(payload.organiser_id, game.id)
+    organizer_stats_service.record_game_created(game)
+    organizer_service.invalidate_profile(game.organiser_id)
     email_service.send_game_pending_review_email(game=game, organiser_name=user.name, organiser_email=user.email)
-    admins = list(admin_email_set(get_settings()))
-    email_service.send_game_pending_review_to_admins(game=game, organiser_name=user.name, admin_emails=admins)
+    admin_digest.notify_pending_review(game=game, organiser_name=user.name)
     return game
 
 
 def list_recent_games(limit: int = 50, status_filter: str | None = None) -> list[Game]:
-    games = game_repository.list_games(limit=limit)
+    games = fallback_cache.read_through(("games", limit), lambda: game_repository.list_games(limit=limit))
     if status_filter:
         return [game for game in games if game.status == status_filter]
     return games
 
 
 def get_game(game_id: str) -> Game | None:
-    return game_repository.get_game(game_id)
-
-
-def _get_game_owner_user(game: Game):
-    user_record = None
-    if game.created_by_user_id:
-        user_record = user_repository.get_user_by_id(game.created_by_user_id)
-        if user_record:
-            return user_record
-    if game.organiser_id:
-        organizer_record = organizer_repository.get_by_id(game.organiser_id)
-        if organizer_record:
-            user_record = user_repository.get_user_by_id(organizer_record.user_id)
-    return user_record
+    return fallback_cache.read_through(("game", game_id), lambda: game_repository.get_game(game_id))
 
 
 def list_user_created_games(user: UserBase, limit: int = 500) -> list[Game]:
@@ -61,8 +68,12 @@ def update_game_status(game_id: str, status: str) -> Game | None:
     updated = game_repository.update_game_status(game_id, status)
     if not updated:
         return None
+    organizer_service.invalidate_profile(updated.organiser_id)
+
+    if status == "unapproved":
+        reminder_scheduler.cancel_game(updated.id)
 
-    owner = _get_game_owner_user(updated)
+    owner = owner_resolver.get_game_owner(updated)
     if owner:
         if status == "confirmed":
             email_service.send_game_approved_email(
@@ -70,7 +81,7 @@ def update_game_status(game_id: str, status: str) -> Game | None:
                 organiser_name=owner.name,
                 organiser_email=owner.email,
             )
-            email_service.schedule_game_reminder_email(game=updated, recipient=owner.email, name=owner.name)
+            reminder_scheduler.schedule(game=updated, recipient=owner.email, name=owner.name, user_id=owner.id)
         elif status == "unapproved":
             email_service.send_game_rejected_email(
                 game=updated,
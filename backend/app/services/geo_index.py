@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+from typing import Generic, Optional, TypeVar
+
+EARTH_RADIUS_KM = 6371.0088
+
+T = TypeVar("T")
+
+
+def _to_unit_vector(lat: float, lng: float) -> tuple[float, float, float]:
+    phi, lam = math.radians(lat), math.radians(lng)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def _km_to_chord(km: float) -> float:
+    return 2 * math.sin(min(math.pi, km / EARTH_RADIUS_KM) / 2)
+
+
+class _Node:
+    __slots__ = ("point", "index", "axis", "left", "right")
+
+    def __init__(self, point: tuple[float, float, float], index: int, axis: int) -> None:
+        self.point = point
+        self.index = index
+        self.axis = axis
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+
+
+class GeoIndex(Generic[T]):
+    """Static k-d tree over points on the sphere.
+
+    Coordinates are stored as 3D unit vectors so straight-line (chord) distance
+    orders points exactly like great-circle distance, with no antimeridian or
+    polar special cases.
+    """
+
+    def __init__(self, items: list[tuple[float, float, T]]) -> None:
+        self.items = [item for _, _, item in items]
+        points = [(_to_unit_vector(lat, lng), i) for i, (lat, lng, _) in enumerate(items)]
+        self._root = self._build(points, 0)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _build(self, points: list[tuple[tuple[float, float, float], int]], depth: int) -> Optional[_Node]:
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda entry: entry[0][axis])
+        mid = len(points) // 2
+        node = _Node(points[mid][0], points[mid][1], axis)
+        node.left = self._build(points[:mid], depth + 1)
+        node.right = self._build(points[mid + 1 :], depth + 1)
+        return node
+
+    def nearest(self, lat: float, lng: float) -> Optional[tuple[T, float]]:
+        if self._root is None:
+            return None
+        target = _to_unit_vector(lat, lng)
+        best: list = [None, math.inf]
+
+        def visit(node: Optional[_Node]) -> None:
+            if node is None:
+                return
+            dist = math.dist(target, node.point)
+            if dist < best[1]:
+                best[0], best[1] = node.index, dist
+            diff = target[node.axis] - node.point[node.axis]
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+            visit(near)
+            if abs(diff) < best[1]:
+                visit(far)
+
+        visit(self._root)
+        return self.items[best[0]], _chord_to_km(best[1])
+
+    def within(self, lat: float, lng: float, radius_km: float) -> list[tuple[T, float]]:
+        target = _to_unit_vector(lat, lng)
+        limit = _km_to_chord(radius_km)
+        found: list[tuple[T, float]] = []
+
+        def visit(node: Optional[_Node]) -> None:
+            if node is None:
+                return
+            dist = math.dist(target, node.point)
+            if dist <= limit:
+                found.append((self.items[node.index], _chord_to_km(dist)))
+            diff = target[node.axis] - node.point[node.axis]
+            if diff - limit <= 0:
+                visit(node.left)
+            if diff + limit >= 0:
+                visit(node.right)
+
+        visit(self._root)
+        return found
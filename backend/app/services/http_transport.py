@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import random
+import time
+from threading import Lock
+
+import httpx
+
+from ..core import metrics, request_metrics
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+)
+
+SUPABASE_LATENCY = metrics.Histogram(
+    "playbud_supabase_request_duration_seconds",
+    "Supabase call latency per table, retries included.",
+    ("table", "method"),
+)
+SUPABASE_ERRORS = metrics.Counter(
+    "playbud_supabase_errors_total", "Failed Supabase calls per table and reason.", ("table", "reason")
+)
+
+
+def table_label(url: httpx.URL) -> str:
+    """``games`` for ``/rest/v1/games?...``, ``rpc/<name>`` for RPCs, ``other`` for non-REST calls."""
+    _, marker, rest = url.path.partition("/rest/v1/")
+    if not marker:
+        return "other"
+    rest = rest.strip("/")
+    if rest.startswith("rpc/"):
+        return rest
+    return rest.split("/", 1)[0] or "root"
+
+
+class TransportMetrics:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.retried_statuses = 0
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "failures": self.failures,
+                "retried_statuses": self.retried_statuses,
+            }
+
+
+class RetryingTransport(httpx.BaseTransport):
+    """Pooled HTTP/1.1+HTTP/2 transport that retries idempotent reads with full-jitter backoff.
+
+    Writes are never retried: PostgREST inserts and RPCs are not guaranteed to be
+    idempotent, so a failed write surfaces to the caller as before.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits,
+        http2: bool = True,
+        max_retries: int = 2,
+        backoff_seconds: float = 0.2,
+        max_backoff_seconds: float = 2.0,
+        inner: httpx.BaseTransport | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.breaker = breaker
+        if inner is not None:
+            self._inner = inner
+        else:
+            try:
+                self._inner = httpx.HTTPTransport(limits=limits, http2=http2)
+            except ImportError:  # pragma: no cover - h2 missing from the image
+                print("HTTP/2 support unavailable; falling back to HTTP/1.1 for Supabase.")
+                self._inner = httpx.HTTPTransport(limits=limits)
+        self.max_retries = max(max_retries, 0)
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.metrics = TransportMetrics()
+
+    def _delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff_seconds, self.backoff_seconds * (2 ** attempt)))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        table = table_label(request.url)
+        reason: str | None = None
+        start = time.perf_counter()
+        try:
+            response = self._guarded(request)
+        except CircuitOpenError:
+            reason = "circuit_open"
+            raise
+        except httpx.TransportError:
+            reason = "transport"
+            raise
+        else:
+            if response.status_code >= 400:
+                reason = f"{response.status_code // 100}xx"
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            request_metrics.record("db", elapsed * 1000)
+            SUPABASE_LATENCY.observe(elapsed, table, request.method)
+            if reason is not None:
+                SUPABASE_ERRORS.inc(table, reason)
+
+    def _guarded(self, request: httpx.Request) -> httpx.Response:
+        if self.breaker is None:
+            return self._send(request)
+        self.breaker.before_call()
+        try:
+            response = self._send(request)
+        except httpx.TransportError:
+            self.breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return response
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        retryable = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            self.metrics.increment("requests")
+            try:
+                response = self._inner.handle_request(request)
+            except RETRYABLE_ERRORS:
+                if not retryable or attempt >= self.max_retries:
+                    self.metrics.increment("failures")
+                    raise
+            else:
+                if not retryable or attempt >= self.max_retries or response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+                response.close()
+                self.metrics.increment("retried_statuses")
+            self.metrics.increment("retries")
+            time.sleep(self._delay(attempt))
+            attempt += 1
+
+    def probe(self, request: httpx.Request) -> bool:
+        """Send ``request`` once, bypassing retries and the breaker; True when the server answers below 500."""
+        try:
+            response = self._inner.handle_request(request)
+        except httpx.HTTPError:
+            return False
+        try:
+            response.read()
+        finally:
+            response.close()
+        return response.status_code < 500
+
+    def pool_stats(self) -> dict[str, int]:
+        pool = getattr(self._inner, "_pool", None)
+        connections = list(pool.connections) if pool is not None else []
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {"connections": len(connections), "idle": idle, "active": len(connections) - idle}
+
+    def close(self) -> None:
+        self._inner.close()
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Optional
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from pydantic import BaseModel
 
-from supabase import Client
-
-from .supabase_client import get_supabase_client
+from .storage_backend import get_storage_client
+from ..core.config import get_settings
 from ..schemas.metadata import City, LookupItem, ReferenceData
 
+if TYPE_CHECKING:
+    from supabase import Client
+
+settings = get_settings()
+
 DATA_DIR = Path(__file__).resolve().parent.parent / "storage"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 REFERENCE_FILE = DATA_DIR / "reference_data.json"
+REFERENCE_TABLES = ("cities", "sports", "abilities", "genders")
+# After a failed background refresh, try again this soon rather than waiting a full TTL.
+REFRESH_RETRY_SECONDS = 30.0
 
 DEFAULT_REFERENCE_DATA: dict[str, Any] = {
     "cities": [
@@ -80,8 +91,26 @@ class ReferenceDataPayload(BaseModel):
     genders: List[LookupItem]
 
 
+def _payload_digest(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+_file_digest: Optional[str] = None
+
+
 def _write_reference_file(payload: dict[str, Any]) -> None:
+    global _file_digest
+    digest = _payload_digest(payload)
+    if _file_digest is None and REFERENCE_FILE.exists():
+        try:
+            _file_digest = _payload_digest(json.loads(REFERENCE_FILE.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            _file_digest = None
+    if digest == _file_digest:
+        return
     REFERENCE_FILE.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    _file_digest = digest
 
 
 def _load_reference_file() -> ReferenceData:
@@ -144,26 +173,32 @@ def _map_lookup(row: dict[str, Any]) -> Optional[LookupItem]:
     )
 
 
+def _fetch_table(client: Client, table: str) -> list[dict[str, Any]]:
+    return client.table(table).select("*").order("name").execute().data or []
+
+
+# One pool for every refresh; its threads start on first use and then stay parked.
+_executor = ThreadPoolExecutor(max_workers=len(REFERENCE_TABLES), thread_name_prefix="reference-data")
+
+
 def _fetch_from_supabase(client: Client) -> Optional[ReferenceData]:
     try:
-        cities_resp = client.table("cities").select("*").order("name").execute()
-        sports_resp = client.table("sports").select("*").order("name").execute()
-        abilities_resp = client.table("abilities").select("*").order("name").execute()
-        genders_resp = client.table("genders").select("*").order("name").execute()
+        futures = {table: _executor.submit(_fetch_table, client, table) for table in REFERENCE_TABLES}
+        rows = {table: future.result() for table, future in futures.items()}
     except Exception:
         return None
 
     cities = [
-        city for item in (cities_resp.data or []) if (city := _map_city(item)) is not None
+        city for item in rows["cities"] if (city := _map_city(item)) is not None
     ]
     sports = [
-        sport for item in (sports_resp.data or []) if (sport := _map_lookup(item)) is not None
+        sport for item in rows["sports"] if (sport := _map_lookup(item)) is not None
     ]
     abilities = [
-        ability for item in (abilities_resp.data or []) if (ability := _map_lookup(item)) is not None
+        ability for item in rows["abilities"] if (ability := _map_lookup(item)) is not None
     ]
     genders = [
-        gender for item in (genders_resp.data or []) if (gender := _map_lookup(item)) is not None
+        gender for item in rows["genders"] if (gender := _map_lookup(item)) is not None
     ]
 
     if not cities or not sports or not abilities or not genders:
@@ -180,11 +215,94 @@ def _fetch_from_supabase(client: Client) -> Optional[ReferenceData]:
     return payload
 
 
-def get_reference_data() -> ReferenceData:
-    client = get_supabase_client()
+def _load_reference_data() -> tuple[ReferenceData, bool]:
+    client = get_storage_client()
     if client:
         data = _fetch_from_supabase(client)
         if data:
-            return data
+            return data, True
+
+    return _load_reference_file(), False
+
+
+_cache_lock = Lock()
+_load_lock = Lock()
+_cached: Optional[ReferenceData] = None
+_cached_version: Optional[str] = None
+_cached_at = 0.0
+_fresh_at: Optional[float] = None
+_refreshing = False
+
+
+def _store(data: ReferenceData, fresh: bool) -> None:
+    global _cached, _cached_version, _cached_at, _fresh_at
+    version = _payload_digest(data.dict())
+    now = time.monotonic()
+    with _cache_lock:
+        if version != _cached_version:
+            _cached, _cached_version = data, version
+        # Served from the local file: retry the database soon instead of after a full TTL.
+        _cached_at = now if fresh else now - settings.reference_data_ttl_seconds + REFRESH_RETRY_SECONDS
+        if fresh:
+            _fresh_at = now
+
+
+def _background_refresh() -> None:
+    global _refreshing, _cached_at
+    try:
+        data, fresh = _load_reference_data()
+        _store(data, fresh)
+    except Exception as exc:  # noqa: BLE001
+        print(f"Reference data refresh failed: {exc}")
+        with _cache_lock:
+            _cached_at = time.monotonic() - settings.reference_data_ttl_seconds + REFRESH_RETRY_SECONDS
+    finally:
+        with _cache_lock:
+            _refreshing = False
+
+
+def get_reference_snapshot() -> tuple[ReferenceData, str]:
+    """Return the cached reference data and its content hash, refreshing in the background when stale."""
+    global _refreshing
+    with _cache_lock:
+        cached, version = _cached, _cached_version
+        stale = time.monotonic() - _cached_at > settings.reference_data_ttl_seconds
+        start_refresh = cached is not None and stale and not _refreshing
+        if start_refresh:
+            _refreshing = True
+
+    if cached is not None:
+        if start_refresh:
+            Thread(target=_background_refresh, name="reference-data-refresh", daemon=True).start()
+        return cached, version
+
+    # Cold cache: let one caller load while the rest wait for its result.
+    with _load_lock:
+        with _cache_lock:
+            if _cached is not None:
+                return _cached, _cached_version
+        data, fresh = _load_reference_data()
+        _store(data, fresh)
+        with _cache_lock:
+            return _cached, _cached_version
+
+
+def get_reference_data() -> ReferenceData:
+    return get_reference_snapshot()[0]
+
+
+def reference_data_version() -> str:
+    return get_reference_snapshot()[1]
+
+
+def reference_data_age() -> Optional[float]:
+    """Seconds since reference data was last loaded from the database, or None if it never was."""
+    with _cache_lock:
+        return None if _fresh_at is None else time.monotonic() - _fresh_at
+
 
-    return _load_reference_file()
+def invalidate_reference_data() -> None:
+    """Mark the cache stale so the next read triggers a background refresh."""
+    global _cached_at
+    with _cache_lock:
+        _cached_at = time.monotonic() - settings.reference_data_ttl_seconds - 1
@@ -1,23 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 from postgrest.exceptions import APIError
-from supabase import Client
 
-from .supabase_client import get_supabase_client, SupabaseUnavailableError
+from .storage_backend import get_storage_client
+from .supabase_client import SupabaseUnavailableError
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 ORGANIZERS_TABLE = "organizers"
 
 
 def _client() -> Client:
-    client = get_supabase_client()
+    client = get_storage_client()
     if client is None:
         raise SupabaseUnavailableError(
-            "Supabase client is not configured. Ensure SUPABASE_URL and SERVICE_ROLE environment variables are set."
+            "Storage backend is not configured. Set SUPABASE_URL and SERVICE_ROLE, or STORAGE_BACKEND=sqlite."
         )
     return client
 
@@ -30,7 +33,6 @@ class OrganizerRecord(BaseModel):
     sports: list[str] = Field(default_factory=list)
     experience: str | None = None
     unique_link: str | None = None
-    game_ids: list[str] = Field(default_factory=list)
 
 
 def _coerce_list(raw: object) -> list[str]:
@@ -55,7 +57,6 @@ def _record_from_row(row: dict) -> OrganizerRecord:
         sports=_coerce_list(row.get("sports")),
         experience=row.get("experience"),
         unique_link=row.get("unique_link"),
-        game_ids=_coerce_list(row.get("game_ids")),
     )
 
 
@@ -77,6 +78,15 @@ def get_by_id(organizer_id: str) -> Optional[OrganizerRecord]:
     return _record_from_row(data[0])
 
 
+def get_by_slug(slug: str) -> Optional[OrganizerRecord]:
+    client = _client()
+    response = client.table(ORGANIZERS_TABLE).select("*").eq("slug", slug).limit(1).execute()
+    data = response.data or []
+    if not data:
+        return None
+    return _record_from_row(data[0])
+
+
 def create(
     user_id: str,
     slug: str | None = None,
@@ -117,7 +127,6 @@ def create(
         sports=normalized_sports,
         experience=experience_value,
         unique_link=unique_link_value,
-        game_ids=[],
     )
 
     client.table(ORGANIZERS_TABLE).insert(
@@ -134,21 +143,3 @@ def create(
 
     return record
 
-
-def append_game(organizer_id: str, game_id: str) -> Optional[OrganizerRecord]:
-    client = _client()
-    organizer = get_by_id(organizer_id)
-    if not organizer:
-        return None
-
-    if game_id in organizer.game_ids:
-        return organizer
-
-    updated_ids = [*organizer.game_ids, game_id]
-    try:
-        client.table(ORGANIZERS_TABLE).update({"game_ids": updated_ids}).eq("id", organizer_id).execute()
-    except APIError as exc:
-        raise RuntimeError(f"Failed to append game to organizer {organizer_id}: {exc.message}") from exc
-
-    organizer.game_ids = updated_ids
-    return organizer
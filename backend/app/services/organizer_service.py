@@ -2,8 +2,17 @@ from __future__ import annotations
 
 import re
 
-from ..schemas.organizers import Organizer, OrganizerCreate
-from . import organizer_repository
+from ..core.config import get_settings
+from ..schemas.organizers import Organizer, OrganizerCreate, OrganizerProfile, PublicOrganizer
+from ..schemas.games import Game
+from . import cache_bus, game_repository, organizer_repository, owner_resolver
+from .cache import TTLCache
+
+PROFILE_GAMES_LIMIT = 20
+
+_profiles: TTLCache[str, OrganizerProfile] = TTLCache(
+    get_settings().organizer_profile_ttl_seconds, name="organizer_profiles"
+)
 
 
 def get_or_create(payload: OrganizerCreate) -> Organizer:
@@ -21,6 +30,8 @@ def get_or_create(payload: OrganizerCreate) -> Organizer:
         experience,
         unique_link,
     )
+    invalidate_profile(record.id)
+    owner_resolver.forget_organizer(record.id)
     return Organizer(
         id=record.id,
         user_id=record.user_id,
@@ -28,7 +39,6 @@ def get_or_create(payload: OrganizerCreate) -> Organizer:
         sports=record.sports,
         experience=record.experience,
         unique_link=record.unique_link,
-        game_ids=record.game_ids,
         created_at=record.created_at,
     )
 
@@ -44,10 +54,48 @@ def get_by_user_id(user_id: str) -> Organizer | None:
         sports=record.sports,
         experience=record.experience,
         unique_link=record.unique_link,
-        game_ids=record.game_ids,
         created_at=record.created_at,
     )
 
 
-def link_game_to_organizer(organizer_id: str, game_id: str) -> None:
-    organizer_repository.append_game(organizer_id, game_id)
+def list_organizer_games(organizer_id: str, *, limit: int = 20, offset: int = 0) -> list[Game]:
+    return game_repository.list_games_by_organizer(organizer_id, limit=limit, offset=offset)
+
+
+def _load_profile(slug: str) -> OrganizerProfile | None:
+    record = organizer_repository.get_by_slug(slug)
+    if not record:
+        return None
+    return OrganizerProfile(
+        organizer=PublicOrganizer(
+            id=record.id,
+            slug=record.slug,
+            sports=record.sports,
+            experience=record.experience,
+            unique_link=record.unique_link,
+            created_at=record.created_at,
+        ),
+        upcoming_games=game_repository.list_upcoming_public_games_by_organizer(record.id, limit=PROFILE_GAMES_LIMIT),
+    )
+
+
+def get_public_profile(slug: str) -> OrganizerProfile | None:
+    slug = slug.strip().lower()
+    return _profiles.get_or_load(slug, lambda: _load_profile(slug))
+
+
+def _drop_profiles(organizer_id: str | None) -> None:
+    if organizer_id is None:
+        _profiles.clear()
+    else:
+        _profiles.discard_where(lambda _, profile: profile.organizer.id == organizer_id)
+
+
+def invalidate_profile(organizer_id: str | None) -> None:
+    if organizer_id:
+        _drop_profiles(organizer_id)
+        # Other workers drop only this organizer's profile; the rest of their cache stays warm.
+        cache_bus.publish("organizer_profiles", organizer_id)
+
+
+cache_bus.subscribe("organizer_profiles", _drop_profiles)
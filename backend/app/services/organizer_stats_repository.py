@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from pydantic import BaseModel
+
+from .storage_backend import get_storage_client
+from .supabase_client import SupabaseUnavailableError
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+SPORT_ROLLUPS_TABLE = "organizer_sport_rollups"
+PLAYER_ROLLUPS_TABLE = "organizer_player_rollups"
+REPEAT_PLAYER_THRESHOLD = 2
+
+
+def _client() -> Client:
+    client = get_storage_client()
+    if client is None:
+        raise SupabaseUnavailableError(
+            "Storage backend is not configured. Set SUPABASE_URL and SERVICE_ROLE, or STORAGE_BACKEND=sqlite."
+        )
+    return client
+
+
+class SportRollup(BaseModel):
+    organiser_id: str
+    sport_code: str
+    games_hosted: int = 0
+    capacity_total: int = 0
+    bookings_total: int = 0
+    cancellations: int = 0
+
+    class Config:
+        extra = "ignore"
+
+
+def bump_sport_rollup(
+    organiser_id: str,
+    sport_code: str,
+    *,
+    games: int = 0,
+    capacity: int = 0,
+    bookings: int = 0,
+    cancellations: int = 0,
+) -> None:
+    _client().rpc(
+        "bump_organizer_sport_rollup",
+        {
+            "p_organiser_id": organiser_id,
+            "p_sport_code": sport_code,
+            "p_games": games,
+            "p_capacity": capacity,
+            "p_bookings": bookings,
+            "p_cancellations": cancellations,
+        },
+    ).execute()
+
+
+def bump_player_rollup(organiser_id: str, user_id: str, delta: int) -> None:
+    _client().rpc(
+        "bump_organizer_player_rollup",
+        {"p_organiser_id": organiser_id, "p_user_id": user_id, "p_delta": delta},
+    ).execute()
+
+
+def list_sport_rollups(organiser_id: str) -> List[SportRollup]:
+    response = (
+        _client()
+        .table(SPORT_ROLLUPS_TABLE)
+        .select("organiser_id,sport_code,games_hosted,capacity_total,bookings_total,cancellations")
+        .eq("organiser_id", organiser_id)
+        .order("sport_code")
+        .execute()
+    )
+    return [SportRollup(**row) for row in response.data or []]
+
+
+def count_repeat_players(organiser_id: str) -> int:
+    response = (
+        _client()
+        .table(PLAYER_ROLLUPS_TABLE)
+        .select("user_id", count="exact")
+        .eq("organiser_id", organiser_id)
+        .gte("games_joined", REPEAT_PLAYER_THRESHOLD)
+        .limit(1)
+        .execute()
+    )
+    return response.count or 0
+
+
+def replace_rollups(organiser_id: str, sports: list[SportRollup], players: dict[str, int]) -> None:
+    """Overwrite every counter for one organiser with freshly computed values."""
+    client = _client()
+    client.table(SPORT_ROLLUPS_TABLE).delete().eq("organiser_id", organiser_id).execute()
+    client.table(PLAYER_ROLLUPS_TABLE).delete().eq("organiser_id", organiser_id).execute()
+    if sports:
+        client.table(SPORT_ROLLUPS_TABLE).insert([rollup.dict() for rollup in sports]).execute()
+    rows = [
+        {"organiser_id": organiser_id, "user_id": user_id, "games_joined": joined}
+        for user_id, joined in players.items()
+        if joined > 0
+    ]
+    if rows:
+        client.table(PLAYER_ROLLUPS_TABLE).insert(rows).execute()
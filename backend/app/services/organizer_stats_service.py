@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from ..schemas.games import Game
+from ..schemas.organizers import OrganizerStats, SportStats
+from . import organizer_stats_repository
+
+
+def _fill_rate(bookings: int, capacity: int) -> float:
+    return round(bookings / capacity, 4) if capacity > 0 else 0.0
+
+
+def _safely(action: str, func, *args, **kwargs) -> None:
+    # Counters are reconciled offline (app.scripts.reconcile_organizer_stats), so a failed
+    # bump must never fail the request; the message says which organiser needs reconciling.
+    try:
+        func(*args, **kwargs)
+    except Exception as exc:  # noqa: BLE001
+        print(f"Organizer stats update ({action}) for {args[0]} failed: {exc}")
+
+
+def record_game_created(game: Game) -> None:
+    if not game.organiser_id:
+        return
+    _safely(
+        "game created",
+        organizer_stats_repository.bump_sport_rollup,
+        game.organiser_id,
+        game.sport_code,
+        games=1,
+        capacity=max(game.players or 0, 0),
+    )
+
+
+def record_booking(game: Game, user_id: str) -> None:
+    if not game.organiser_id:
+        return
+    _safely("booking", organizer_stats_repository.bump_sport_rollup, game.organiser_id, game.sport_code, bookings=1)
+    _safely("booking", organizer_stats_repository.bump_player_rollup, game.organiser_id, user_id, 1)
+
+
+def record_cancellation(game: Game, user_id: str) -> None:
+    if not game.organiser_id:
+        return
+    _safely(
+        "cancellation",
+        organizer_stats_repository.bump_sport_rollup,
+        game.organiser_id,
+        game.sport_code,
+        bookings=-1,
+        cancellations=1,
+    )
+    _safely("cancellation", organizer_stats_repository.bump_player_rollup, game.organiser_id, user_id, -1)
+
+
+def get_stats(organizer_id: str) -> OrganizerStats:
+    rollups = organizer_stats_repository.list_sport_rollups(organizer_id)
+    by_sport = [
+        SportStats(
+            sport_code=rollup.sport_code,
+            games_hosted=rollup.games_hosted,
+            bookings=rollup.bookings_total,
+            cancellations=rollup.cancellations,
+            average_fill_rate=_fill_rate(rollup.bookings_total, rollup.capacity_total),
+        )
+        for rollup in rollups
+    ]
+    return OrganizerStats(
+        games_hosted=sum(rollup.games_hosted for rollup in rollups),
+        bookings=sum(rollup.bookings_total for rollup in rollups),
+        cancellations=sum(rollup.cancellations for rollup in rollups),
+        average_fill_rate=_fill_rate(
+            sum(rollup.bookings_total for rollup in rollups),
+            sum(rollup.capacity_total for rollup in rollups),
+        ),
+        repeat_players=organizer_stats_repository.count_repeat_players(organizer_id),
+        by_sport=by_sport,
+    )
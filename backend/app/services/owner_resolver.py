@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from ..schemas.games import Game
+from . import cache_bus, organizer_repository, user_repository
+from .cache import TTLCache
+from .user_repository import UserRecord
+
+# Ownership links almost never change, so entries live long; the bound keeps memory flat.
+MAPPING_TTL_SECONDS = 3600
+MAX_MAPPINGS = 4096
+
+# game id -> owner record, so a hit needs no user lookup; profile updates drop it via forget_user.
+_game_owners: TTLCache[str, UserRecord] = TTLCache(MAPPING_TTL_SECONDS, MAX_MAPPINGS, name="game_owners")
+_organizer_users: TTLCache[str, str] = TTLCache(MAPPING_TTL_SECONDS, MAX_MAPPINGS, name="organizer_users")
+
+
+def _organizer_user_id(organizer_id: str) -> Optional[str]:
+    def load() -> Optional[str]:
+        record = organizer_repository.get_by_id(organizer_id)
+        return record.user_id if record else None
+
+    return _organizer_users.get_or_load(organizer_id, load)
+
+
+def get_game_owner(game: Game) -> Optional[UserRecord]:
+    """The user who owns ``game``: its creator, otherwise the organiser's user."""
+    owner = _game_owners.get(game.id)
+    if owner:
+        return owner
+
+    if game.created_by_user_id:
+        owner = user_repository.get_user_by_id(game.created_by_user_id)
+        if owner:
+            _game_owners.set(game.id, owner)
+            return owner
+    if game.organiser_id:
+        user_id = _organizer_user_id(game.organiser_id)
+        owner = user_repository.get_user_by_id(user_id) if user_id else None
+        if owner:
+            _game_owners.set(game.id, owner)
+            return owner
+        _organizer_users.discard(game.organiser_id)
+    return None
+
+
+def _forget_organizer_locally(organizer_id: str | None) -> None:
+    if organizer_id is None:
+        clear()
+        return
+    user_id = _organizer_users.get(organizer_id)
+    _organizer_users.discard(organizer_id)
+    if user_id:
+        _forget_user_locally(user_id)
+
+
+def forget_organizer(organizer_id: str) -> None:
+    _forget_organizer_locally(organizer_id)
+    cache_bus.publish("owner_mappings", organizer_id)
+
+
+def _forget_user_locally(user_id: str | None) -> None:
+    if user_id is None:
+        _game_owners.clear()
+        return
+    _game_owners.discard_where(lambda _, owner: owner.id == user_id)
+
+
+def forget_user(user_id: str) -> None:
+    """Drop cached owner records for ``user_id`` after their profile changes."""
+    _forget_user_locally(user_id)
+    cache_bus.publish("owner_users", user_id)
+
+
+def clear() -> None:
+    _game_owners.clear()
+    _organizer_users.clear()
+
+
+cache_bus.subscribe("owner_mappings", _forget_organizer_locally)
+cache_bus.subscribe("owner_users", _forget_user_locally)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+import anyio
+
+MAX_SECONDS = 60.0
+MIN_INTERVAL_SECONDS = 0.001
+TRACEMALLOC_FRAMES = 10
+# Leaf frames that mean the thread is parked rather than doing work.
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one is still running."""
+
+
+_busy = threading.Lock()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    path = Path(code.co_filename)
+    try:
+        location = f"app/{path.relative_to(APP_ROOT).as_posix()}"
+    except ValueError:
+        location = path.name
+    return f"{code.co_name} ({location}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _is_idle(frame) -> bool:
+    return (Path(frame.f_code.co_filename).name, frame.f_code.co_name) in IDLE_LEAVES
+
+
+def _collapse(frame, thread_name: str) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name.replace(";", ":"))
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(seconds: float, interval_seconds: float = 0.005, include_idle: bool = False) -> str:
+    """Sample every thread's stack for ``seconds`` and return them in collapsed ("folded") format.
+
+    Each line is ``thread;outer;...;leaf count``, which flamegraph.pl, speedscope and
+    inferno read directly. Only one profile runs at a time.
+    """
+    seconds = min(max(seconds, 0.0), MAX_SECONDS)
+    interval_seconds = max(interval_seconds, MIN_INTERVAL_SECONDS)
+    if not _busy.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    try:
+        own = threading.get_ident()
+        stacks: Counter[str] = Counter()
+        deadline = time.monotonic() + seconds
+        while True:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own or (not include_idle and _is_idle(frame)):
+                    continue
+                stacks[_collapse(frame, names.get(ident, f"thread-{ident}"))] += 1
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(interval_seconds)
+    finally:
+        _busy.release()
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class AllocationSession:
+    """Allocation deltas summed over the requests to one path that ran while tracing was armed."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.requests = 0
+        self.sizes: Counter[str] = Counter()
+        self.counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> None:
+        diff = after.compare_to(before, "lineno")
+        with self._lock:
+            self.requests += 1
+            for stat in diff:
+                if stat.size_diff <= 0:
+                    continue
+                frame = stat.traceback[0]
+                location = f"{frame.filename}:{frame.lineno}"
+                self.sizes[location] += stat.size_diff
+                self.counts[location] += stat.count_diff
+
+    def report(self, top: int) -> dict:
+        with self._lock:
+            return {
+                "path": self.path,
+                "requests": self.requests,
+                "top": [
+                    {"location": location, "size_bytes": size, "count": self.counts[location]}
+                    for location, size in self.sizes.most_common(top)
+                ],
+            }
+
+
+_allocation_session: Optional[AllocationSession] = None
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap>"))
+    )
+
+
+def _finish(session: AllocationSession, before: tracemalloc.Snapshot) -> None:
+    try:
+        session.add(before, _snapshot())
+    except RuntimeError:  # tracing stopped while the request ran
+        pass
+
+
+@asynccontextmanager
+async def track_allocations(path: str) -> AsyncIterator[None]:
+    """Wraps each request; a no-op unless allocation tracing is armed for ``path``.
+
+    Snapshots and the diff walk every live allocation, so they run in a worker thread
+    rather than stalling the event loop for all other requests.
+    """
+    session = _allocation_session
+    if session is None or session.path != path:
+        yield
+        return
+    try:
+        before = await anyio.to_thread.run_sync(_snapshot)
+    except RuntimeError:  # tracing stopped since the session was read
+        yield
+        return
+    try:
+        yield
+    finally:
+        await anyio.to_thread.run_sync(_finish, session, before)
+
+
+def trace_allocations(path: str, seconds: float, top: int = 25) -> dict:
+    """Trace allocations made while serving ``path`` for ``seconds`` and return the top sources.
+
+    Tracing covers every thread, so requests running concurrently on other paths can
+    show up in the deltas; profile on a quiet instance for clean numbers.
+    """
+    global _allocation_session
+    seconds = min(max(seconds, 0.0), MAX_SECONDS)
+    if not _busy.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+    started = not tracemalloc.is_tracing()
+    try:
+        if started:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        session = _allocation_session = AllocationSession(path)
+        time.sleep(seconds)
+    finally:
+        _allocation_session = None
+        if started:
+            tracemalloc.stop()
+        _busy.release()
+    return session.report(top)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import gzip
+import re
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from ..schemas.metadata import City, ReferenceData, ResolvedCity
+from . import metadata_repository
+from .geo_index import GeoIndex
+
+try:  # brotli is optional; gzip is always available.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deployment image
+    brotli = None
+
+
+class EncodedReferenceData(NamedTuple):
+    version: str
+    etag: str
+    identity: bytes
+    gzip: bytes
+    brotli: Optional[bytes]
+
+
+_lock = Lock()
+_encoded: Optional[EncodedReferenceData] = None
+
+
+def _encode(data: ReferenceData, version: str) -> EncodedReferenceData:
+    body = data.model_dump_json().encode("utf-8")
+    return EncodedReferenceData(
+        version=version,
+        etag=f'"{version[:32]}"',
+        identity=body,
+        gzip=gzip.compress(body, compresslevel=9, mtime=0),
+        brotli=brotli.compress(body, quality=11) if brotli is not None else None,
+    )
+
+
+def get_encoded_reference_data() -> EncodedReferenceData:
+    """Serialized reference-data bodies, rebuilt only when the data's content hash changes."""
+    global _encoded
+    data, version = metadata_repository.get_reference_snapshot()
+    encoded = _encoded
+    if encoded is not None and encoded.version == version:
+        return encoded
+    with _lock:
+        if _encoded is None or _encoded.version != version:
+            _encoded = _encode(data, version)
+        return _encoded
+
+
+class ReferenceIndex(NamedTuple):
+    version: str
+    cities: dict[str, str]
+    sports: dict[str, str]
+    abilities: dict[str, str]
+
+
+def normalize_key(value: str) -> str:
+    return re.sub(r"[\s_-]+", "-", value.strip().casefold()).strip("-")
+
+
+def _index(entries: list[tuple[str, list[str | None]]]) -> dict[str, str]:
+    index: dict[str, str] = {}
+    for canonical, aliases in entries:
+        for alias in aliases:
+            if alias and normalize_key(alias):
+                index.setdefault(normalize_key(alias), canonical)
+    return index
+
+
+def _build_index(data: ReferenceData, version: str) -> ReferenceIndex:
+    # Canonical values are what the web client submits: city slug, sport code and ability name.
+    return ReferenceIndex(
+        version=version,
+        cities=_index([(city.slug, [city.slug, city.name, city.id]) for city in data.cities]),
+        sports=_index(
+            [(sport.code or sport.slug, [sport.code, sport.slug, sport.name, sport.id]) for sport in data.sports]
+        ),
+        abilities=_index(
+            [(ability.name, [ability.name, ability.slug, ability.id]) for ability in data.abilities]
+        ),
+    )
+
+
+_index_lock = Lock()
+_reference_index: Optional[ReferenceIndex] = None
+
+
+def get_reference_index() -> ReferenceIndex:
+    """Lookup tables from normalized aliases to canonical values, rebuilt when reference data changes."""
+    global _reference_index
+    data, version = metadata_repository.get_reference_snapshot()
+    index = _reference_index
+    if index is not None and index.version == version:
+        return index
+    with _index_lock:
+        if _reference_index is None or _reference_index.version != version:
+            _reference_index = _build_index(data, version)
+        return _reference_index
+
+
+def resolve_city(value: str) -> Optional[str]:
+    return get_reference_index().cities.get(normalize_key(value))
+
+
+def resolve_sport(value: str) -> Optional[str]:
+    return get_reference_index().sports.get(normalize_key(value))
+
+
+def resolve_ability(value: str) -> Optional[str]:
+    return get_reference_index().abilities.get(normalize_key(value))
+
+
+class CityLocator(NamedTuple):
+    version: str
+    index: GeoIndex[City]
+    max_radius_km: float
+
+
+_locator_lock = Lock()
+_city_locator: Optional[CityLocator] = None
+
+
+def get_city_locator() -> CityLocator:
+    global _city_locator
+    data, version = metadata_repository.get_reference_snapshot()
+    locator = _city_locator
+    if locator is not None and locator.version == version:
+        return locator
+    with _locator_lock:
+        if _city_locator is None or _city_locator.version != version:
+            _city_locator = CityLocator(
+                version=version,
+                index=GeoIndex([(city.center_lat, city.center_lng, city) for city in data.cities]),
+                max_radius_km=max((city.radius_km for city in data.cities), default=0.0),
+            )
+        return _city_locator
+
+
+def resolve_city_for_point(lat: float, lng: float) -> Optional[ResolvedCity]:
+    """The closest city whose radius contains the point, else the nearest city overall."""
+    locator = get_city_locator()
+    containing = [
+        (city, distance)
+        for city, distance in locator.index.within(lat, lng, locator.max_radius_km)
+        if distance <= city.radius_km
+    ]
+    if containing:
+        city, distance = min(containing, key=lambda entry: entry[1])
+        return ResolvedCity(city=city, distance_km=round(distance, 3), within_radius=True)
+
+    nearest = locator.index.nearest(lat, lng)
+    if nearest is None:
+        return None
+    city, distance = nearest
+    return ResolvedCity(city=city, distance_km=round(distance, 3), within_radius=False)
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import heapq
+import sqlite3
+import time
+from collections import defaultdict
+from datetime import timedelta, timezone
+from pathlib import Path
+from threading import Condition, Lock, Thread
+from typing import Optional
+
+from ..core import metrics
+from ..core.config import get_settings
+from ..schemas.games import Game
+
+settings = get_settings()
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "storage"
+REMINDER_FILE = Path(settings.reminder_store_path) if settings.reminder_store_path else DATA_DIR / "reminders.sqlite3"
+
+REMINDER_LEAD = timedelta(hours=6)
+BATCH_WINDOW_SECONDS = 60.0
+# Other workers may schedule into the same file; pick their rows up this often.
+RELOAD_INTERVAL_SECONDS = 5.0 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    game_id TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    user_id TEXT,
+    name TEXT,
+    send_at REAL NOT NULL,
+    PRIMARY KEY (game_id, recipient)
+);
+CREATE INDEX IF NOT EXISTS reminders_send_at_idx ON reminders (send_at);
+CREATE INDEX IF NOT EXISTS reminders_user_idx ON reminders (game_id, user_id);
+"""
+
+_db_lock = Lock()
+_conn: Optional[sqlite3.Connection] = None
+
+# Heap entries are (send_at, game_id, recipient); _live holds the current send_at per key so
+# superseded or cancelled heap entries are skipped lazily when popped.
+_heap: list[tuple[float, str, str]] = []
+_live: dict[tuple[str, str], float] = {}
+_wakeup = Condition()
+_start_lock = Lock()
+_thread: Optional[Thread] = None
+_stopping = False
+_last_reload = 0.0
+
+
+def _db() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        REMINDER_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(REMINDER_FILE), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _conn = conn
+    return _conn
+
+
+def _send_at(game: Game) -> float:
+    from .email_service import _event_datetime
+
+    event_dt = _event_datetime(game)
+    if event_dt.tzinfo is None:
+        event_dt = event_dt.replace(tzinfo=timezone.utc)
+    return (event_dt - REMINDER_LEAD).timestamp()
+
+
+def _push(game_id: str, recipient: str, send_at: float) -> None:
+    _live[(game_id, recipient)] = send_at
+    heapq.heappush(_heap, (send_at, game_id, recipient))
+
+
+def _reload() -> None:
+    global _last_reload
+    with _db_lock:
+        rows = _db().execute("SELECT game_id, recipient, send_at FROM reminders").fetchall()
+    with _wakeup:
+        seen = set()
+        for row in rows:
+            key = (row["game_id"], row["recipient"])
+            seen.add(key)
+            if _live.get(key) != row["send_at"]:
+                _push(row["game_id"], row["recipient"], row["send_at"])
+        for key in set(_live) - seen:
+            del _live[key]
+        _wakeup.notify()
+    _last_reload = time.monotonic()
+
+
+def schedule(*, game: Game, recipient: str, name: str | None = None, user_id: str | None = None) -> None:
+    """Schedule (or reschedule) the pre-game reminder for one recipient of one game."""
+    send_at = _send_at(game)
+    with _db_lock:
+        _db().execute(
+            "INSERT INTO reminders (game_id, recipient, user_id, name, send_at) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (game_id, recipient) DO UPDATE SET user_id = excluded.user_id,"
+            " name = excluded.name, send_at = excluded.send_at",
+            (game.id, recipient, user_id, name, send_at),
+        )
+    start()
+    with _wakeup:
+        if _live.get((game.id, recipient)) != send_at:
+            _push(game.id, recipient, send_at)
+        _wakeup.notify()
+
+
+def cancel(game_id: str, *, recipient: str | None = None, user_id: str | None = None) -> int:
+    if recipient is None and user_id is None:
+        return 0
+    with _db_lock:
+        db = _db()
+        if recipient is not None:
+            rows = db.execute(
+                "DELETE FROM reminders WHERE game_id = ? AND recipient = ? RETURNING recipient",
+                (game_id, recipient),
+            ).fetchall()
+        else:
+            rows = db.execute(
+                "DELETE FROM reminders WHERE game_id = ? AND user_id = ? RETURNING recipient",
+                (game_id, user_id),
+            ).fetchall()
+    with _wakeup:
+        for row in rows:
+            _live.pop((game_id, row["recipient"]), None)
+    return len(rows)
+
+
+def cancel_game(game_id: str) -> int:
+    with _db_lock:
+        rows = _db().execute("DELETE FROM reminders WHERE game_id = ? RETURNING recipient", (game_id,)).fetchall()
+    with _wakeup:
+        for row in rows:
+            _live.pop((game_id, row["recipient"]), None)
+    return len(rows)
+
+
+def pending_count() -> int:
+    with _db_lock:
+        return _db().execute("SELECT COUNT(*) FROM reminders").fetchone()[0]
+
+
+metrics.CallbackGauge("playbud_reminders_pending", "Game reminders scheduled and not yet sent.", pending_count)
+
+
+def _pop_due_batch(now: float) -> list[tuple[str, str, float]]:
+    """Pop every live entry due before the end of the current minute."""
+    batch_end = (now // BATCH_WINDOW_SECONDS + 1) * BATCH_WINDOW_SECONDS
+    batch: list[tuple[str, str, float]] = []
+    while _heap and _heap[0][0] < batch_end:
+        send_at, game_id, recipient = heapq.heappop(_heap)
+        if _live.get((game_id, recipient)) != send_at:
+            continue
+        del _live[(game_id, recipient)]
+        batch.append((game_id, recipient, send_at))
+    return batch
+
+
+def _claim(game_id: str, recipient: str, send_at: float) -> Optional[sqlite3.Row]:
+    # Deleting the row is the claim: if another worker or a cancel got there first, skip it.
+    with _db_lock:
+        return _db().execute(
+            "DELETE FROM reminders WHERE game_id = ? AND recipient = ? AND send_at = ? RETURNING recipient, name",
+            (game_id, recipient, send_at),
+        ).fetchone()
+
+
+def _dispatch(batch: list[tuple[str, str, float]]) -> None:
+    from . import email_service, game_repository
+
+    by_game: dict[str, list[tuple[str, float]]] = defaultdict(list)
+    for game_id, recipient, send_at in batch:
+        by_game[game_id].append((recipient, send_at))
+
+    for game_id, entries in by_game.items():
+        claimed = [row for recipient, send_at in entries if (row := _claim(game_id, recipient, send_at))]
+        if not claimed:
+            continue
+        try:
+            game = game_repository.get_game(game_id)
+        except Exception as exc:  # noqa: BLE001
+            print(f"Reminder dispatch failed for game {game_id}: {exc}")
+            continue
+        if game is None or game.status == "unapproved":
+            continue
+        for row in claimed:
+            email_service.send_game_reminder_email(game=game, recipient=row["recipient"], name=row["name"])
+
+
+def _run() -> None:
+    while not _stopping:
+        if time.monotonic() - _last_reload >= RELOAD_INTERVAL_SECONDS:
+            try:
+                _reload()
+            except sqlite3.Error as exc:
+                print(f"Reminder reload failed: {exc}")
+        with _wakeup:
+            now = time.time()
+            batch = _pop_due_batch(now)
+            if not batch:
+                timeout = RELOAD_INTERVAL_SECONDS
+                if _heap:
+                    timeout = min(timeout, max(0.0, _heap[0][0] - now))
+                _wakeup.wait(timeout=timeout)
+                continue
+        try:
+            _dispatch(batch)
+        except Exception as exc:  # noqa: BLE001
+            print(f"Reminder dispatch failed: {exc}")
+
+
+def start() -> None:
+    global _thread, _stopping
+    if _thread is not None and _thread.is_alive():
+        return
+    with _start_lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _stopping = False
+        _reload()
+        _thread = Thread(target=_run, name="reminder-scheduler", daemon=True)
+        _thread.start()
+
+
+def stop(timeout: float = 5.0) -> None:
+    global _stopping
+    _stopping = True
+    with _wakeup:
+        _wakeup.notify_all()
+    if _thread is not None and _thread.is_alive():
+        _thread.join(timeout=timeout)
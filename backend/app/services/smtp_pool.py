@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import smtplib
+import time
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from threading import Lock
+from typing import Iterator, Optional
+
+from ..core.config import get_settings
+
+settings = get_settings()
+
+
+class SMTPPoolExhaustedError(Exception):
+    """Raised when no SMTP connection becomes available within the acquire timeout."""
+
+
+class _PooledConnection:
+    def __init__(self, server: smtplib.SMTP) -> None:
+        self.server = server
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        try:
+            self.server.quit()
+        except Exception:  # noqa: BLE001
+            try:
+                self.server.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+
+class SMTPConnectionPool:
+    """Keeps a handful of authenticated SMTP sessions alive between sends.
+
+    Idle sessions are checked with NOOP before reuse and replaced transparently
+    when the server has dropped them.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        size: int = 2,
+        idle_timeout: float = 60.0,
+        connect_timeout: float = 15.0,
+        acquire_timeout: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.acquire_timeout = acquire_timeout
+        self._idle: LifoQueue[_PooledConnection] = LifoQueue()
+        self._lock = Lock()
+        self._open = 0
+
+    def _connect(self) -> _PooledConnection:
+        server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.connect_timeout)
+        try:
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return _PooledConnection(server)
+
+    @staticmethod
+    def _is_alive(conn: _PooledConnection) -> bool:
+        try:
+            code, _ = conn.server.noop()
+        except Exception:  # noqa: BLE001
+            return False
+        return code == 250
+
+    def _discard(self, conn: _PooledConnection) -> None:
+        conn.close()
+        with self._lock:
+            self._open -= 1
+
+    def _take(self) -> _PooledConnection:
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                conn = None
+
+            if conn is not None:
+                if time.monotonic() - conn.last_used > self.idle_timeout or not self._is_alive(conn):
+                    self._discard(conn)
+                    continue
+                return conn
+
+            with self._lock:
+                can_open = self._open < self.size
+                if can_open:
+                    self._open += 1
+            if can_open:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._lock:
+                        self._open -= 1
+                    raise
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SMTPPoolExhaustedError("Timed out waiting for an SMTP connection")
+            try:
+                conn = self._idle.get(timeout=remaining)
+            except Empty:
+                raise SMTPPoolExhaustedError("Timed out waiting for an SMTP connection") from None
+            self._idle.put(conn)
+
+    def _give_back(self, conn: _PooledConnection) -> None:
+        conn.last_used = time.monotonic()
+        self._idle.put(conn)
+
+    @contextmanager
+    def session(self) -> Iterator[smtplib.SMTP]:
+        """Borrow one authenticated session; several messages can be sent on it."""
+        conn = self._take()
+        try:
+            yield conn.server
+        except smtplib.SMTPServerDisconnected:
+            self._discard(conn)
+            raise
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as exc:
+            # Per-message rejections leave the session usable; 421 means the server is closing it,
+            # so report it as a disconnect and callers retry on a fresh session.
+            if getattr(exc, "smtp_code", None) == 421:
+                self._discard(conn)
+                raise smtplib.SMTPServerDisconnected(str(exc)) from exc
+            self._give_back(conn)
+            raise
+        except Exception:
+            self._discard(conn)
+            raise
+        else:
+            self._give_back(conn)
+
+    def send(self, message) -> None:
+        """Send one message, reconnecting once if a pooled session went stale mid-send."""
+        for attempt in range(2):
+            try:
+                with self.session() as server:
+                    server.send_message(message)
+                return
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                if attempt:
+                    raise
+
+    def open_connections(self) -> int:
+        with self._lock:
+            return self._open
+
+    def close(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(conn)
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_lock = Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    global _pool
+    if _pool is not None:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SMTPConnectionPool(
+                host=settings.smtp_host,
+                port=settings.smtp_port,
+                username=settings.smtp_username,
+                password=settings.smtp_password,
+                size=settings.smtp_pool_size,
+                idle_timeout=settings.smtp_pool_idle_seconds,
+            )
+    return _pool
+
+
+def close_smtp_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
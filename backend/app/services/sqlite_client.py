@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from pathlib import Path
+from threading import RLock
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+from postgrest.exceptions import APIError
+
+from ..core import request_metrics
+
+# Mirrors migrations/0001-0005 closely enough for the repositories: same columns, uniqueness
+# and indexes. Array columns are stored as JSON text, booleans as integers.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL DEFAULT '',
+    password_hash TEXT NOT NULL,
+    avatar_url TEXT,
+    organiser_id TEXT,
+    preferred_city TEXT,
+    heard_about TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS organizers (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    slug TEXT UNIQUE,
+    sports TEXT DEFAULT '[]',
+    experience TEXT,
+    unique_link TEXT,
+    game_ids TEXT DEFAULT '[]',
+    created_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS organizers_user_id_idx ON organizers (user_id);
+
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    organiser_id TEXT,
+    created_by_user_id TEXT,
+    name TEXT NOT NULL,
+    venue TEXT NOT NULL,
+    city_slug TEXT NOT NULL,
+    sport_code TEXT NOT NULL,
+    date TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    players INTEGER NOT NULL CHECK (players > 0),
+    description TEXT,
+    rules TEXT,
+    frequency TEXT NOT NULL,
+    price REAL,
+    is_private INTEGER NOT NULL DEFAULT 0,
+    cancellation TEXT NOT NULL DEFAULT '24 Hours',
+    team_sheet INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending','confirmed','unapproved','completed')),
+    participant_user_ids TEXT DEFAULT '[]',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_city_slug_idx ON games (city_slug);
+CREATE INDEX IF NOT EXISTS games_sport_code_idx ON games (sport_code);
+CREATE INDEX IF NOT EXISTS games_organiser_date_idx ON games (organiser_id, date DESC, id);
+
+CREATE TABLE IF NOT EXISTS bookings (
+    id TEXT PRIMARY KEY,
+    game_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    joined_at TEXT NOT NULL,
+    notes TEXT,
+    CONSTRAINT bookings_unique_participant UNIQUE (game_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS bookings_user_idx ON bookings (user_id);
+
+CREATE TABLE IF NOT EXISTS feedback (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    rating INTEGER NOT NULL CHECK (rating BETWEEN 1 AND 5),
+    message TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS feedback_rating_idx ON feedback (rating);
+
+CREATE TABLE IF NOT EXISTS organizer_sport_rollups (
+    organiser_id TEXT NOT NULL,
+    sport_code TEXT NOT NULL,
+    games_hosted INTEGER NOT NULL DEFAULT 0,
+    capacity_total INTEGER NOT NULL DEFAULT 0,
+    bookings_total INTEGER NOT NULL DEFAULT 0,
+    cancellations INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (organiser_id, sport_code)
+);
+
+CREATE TABLE IF NOT EXISTS organizer_player_rollups (
+    organiser_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    games_joined INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (organiser_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS organizer_player_rollups_repeat_idx ON organizer_player_rollups (organiser_id, games_joined);
+
+CREATE TABLE IF NOT EXISTS cities (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    center_lat REAL NOT NULL DEFAULT 0,
+    center_lng REAL NOT NULL DEFAULT 0,
+    radius_km REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sports (id TEXT PRIMARY KEY, name TEXT NOT NULL, slug TEXT NOT NULL, code TEXT);
+CREATE TABLE IF NOT EXISTS abilities (id TEXT PRIMARY KEY, name TEXT NOT NULL, slug TEXT NOT NULL, code TEXT);
+CREATE TABLE IF NOT EXISTS genders (id TEXT PRIMARY KEY, name TEXT NOT NULL, slug TEXT NOT NULL, code TEXT);
+"""
+
+JSON_COLUMNS = frozenset({"sports", "game_ids", "participant_user_ids"})
+BOOL_COLUMNS = frozenset({"is_private", "team_sheet"})
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _ident(name: str) -> str:
+    name = name.strip().strip('"')
+    if not _IDENTIFIER.match(name):
+        raise APIError({"message": f"Invalid identifier '{name}'", "code": "42601"})
+    return f'"{name}"'
+
+
+def _to_db(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def _from_db(row: sqlite3.Row) -> dict[str, Any]:
+    result = dict(row)
+    for column in JSON_COLUMNS.intersection(result):
+        if isinstance(result[column], str):
+            result[column] = json.loads(result[column])
+    for column in BOOL_COLUMNS.intersection(result):
+        if result[column] is not None:
+            result[column] = bool(result[column])
+    return result
+
+
+class SQLiteResponse(NamedTuple):
+    data: list[dict[str, Any]]
+    count: Optional[int] = None
+
+
+class SQLiteQuery:
+    """The subset of postgrest's request builder the repositories use, executed against SQLite."""
+
+    def __init__(self, client: SQLiteClient, table: str) -> None:
+        self._client = client
+        self._table = _ident(table)
+        self._action = "select"
+        self._columns = "*"
+        self._count: Optional[str] = None
+        self._head = False
+        self._payload: list[dict[str, Any]] = []
+        self._on_conflict: Optional[str] = None
+        self._where: list[str] = []
+        self._params: list[Any] = []
+        self._order: list[str] = []
+        self._limit: Optional[int] = None
+        self._offset: Optional[int] = None
+
+    def select(self, columns: str = "*", *, count: Optional[str] = None, head: bool = False) -> SQLiteQuery:
+        self._columns = "*" if columns.strip() == "*" else ", ".join(_ident(col) for col in columns.split(","))
+        self._count = count
+        self._head = head
+        return self
+
+    def insert(self, rows: dict[str, Any] | list[dict[str, Any]]) -> SQLiteQuery:
+        self._action = "insert"
+        self._payload = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows: dict[str, Any] | list[dict[str, Any]], *, on_conflict: str = "id") -> SQLiteQuery:
+        self.insert(rows)
+        self._action = "upsert"
+        self._on_conflict = on_conflict
+        return self
+
+    def update(self, values: dict[str, Any]) -> SQLiteQuery:
+        self._action = "update"
+        self._payload = [values]
+        return self
+
+    def delete(self) -> SQLiteQuery:
+        self._action = "delete"
+        return self
+
+    def _filter(self, column: str, operator: str, value: Any) -> SQLiteQuery:
+        self._where.append(f"{_ident(column)} {operator} ?")
+        self._params.append(_to_db(value))
+        return self
+
+    def eq(self, column: str, value: Any) -> SQLiteQuery:
+        if value is None:
+            self._where.append(f"{_ident(column)} IS NULL")
+            return self
+        return self._filter(column, "=", value)
+
+    def neq(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, "!=", value)
+
+    def gt(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, ">", value)
+
+    def gte(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, ">=", value)
+
+    def lt(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, "<", value)
+
+    def lte(self, column: str, value: Any) -> SQLiteQuery:
+        return self._filter(column, "<=", value)
+
+    def in_(self, column: str, values: Iterable[Any]) -> SQLiteQuery:
+        values = [_to_db(value) for value in values]
+        self._where.append(f"{_ident(column)} IN ({', '.join('?' for _ in values)})")
+        self._params.extend(values)
+        return self
+
+    def order(self, column: str, *, desc: bool = False) -> SQLiteQuery:
+        self._order.append(f"{_ident(column)} {'DESC' if desc else 'ASC'}")
+        return self
+
+    def limit(self, size: int) -> SQLiteQuery:
+        self._limit = size
+        return self
+
+    def range(self, start: int, end: int) -> SQLiteQuery:
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def _where_sql(self) -> str:
+        return f" WHERE {' AND '.join(self._where)}" if self._where else ""
+
+    def _select(self, conn: sqlite3.Connection) -> SQLiteResponse:
+        count = None
+        if self._count:
+            count = conn.execute(f"SELECT COUNT(*) FROM {self._table}{self._where_sql()}", self._params).fetchone()[0]
+        if self._head:
+            return SQLiteResponse([], count)
+        sql = f"SELECT {self._columns} FROM {self._table}{self._where_sql()}"
+        if self._order:
+            sql += f" ORDER BY {', '.join(self._order)}"
+        if self._limit is not None or self._offset is not None:
+            sql += f" LIMIT {int(self._limit if self._limit is not None else -1)} OFFSET {int(self._offset or 0)}"
+        rows = conn.execute(sql, self._params).fetchall()
+        return SQLiteResponse([_from_db(row) for row in rows], count)
+
+    def _insert(self, conn: sqlite3.Connection) -> SQLiteResponse:
+        data = []
+        for row in self._payload:
+            columns = list(row)
+            sql = (
+                f"INSERT INTO {self._table} ({', '.join(_ident(col) for col in columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})"
+            )
+            if self._action == "upsert":
+                conflict = ", ".join(_ident(col) for col in (self._on_conflict or "id").split(","))
+                updates = ", ".join(f"{_ident(col)} = excluded.{_ident(col)}" for col in columns)
+                sql += f" ON CONFLICT ({conflict}) DO UPDATE SET {updates}"
+            sql += " RETURNING *"
+            data.extend(_from_db(item) for item in conn.execute(sql, [_to_db(row[col]) for col in columns]))
+        return SQLiteResponse(data)
+
+    def _update(self, conn: sqlite3.Connection) -> SQLiteResponse:
+        values = self._payload[0]
+        assignments = ", ".join(f"{_ident(col)} = ?" for col in values)
+        sql = f"UPDATE {self._table} SET {assignments}{self._where_sql()} RETURNING *"
+        params = [_to_db(value) for value in values.values()] + self._params
+        return SQLiteResponse([_from_db(row) for row in conn.execute(sql, params)])
+
+    def _delete(self, conn: sqlite3.Connection) -> SQLiteResponse:
+        sql = f"DELETE FROM {self._table}{self._where_sql()} RETURNING *"
+        return SQLiteResponse([_from_db(row) for row in conn.execute(sql, self._params)])
+
+    def execute(self) -> SQLiteResponse:
+        handler = {
+            "select": self._select,
+            "insert": self._insert,
+            "upsert": self._insert,
+            "update": self._update,
+            "delete": self._delete,
+        }[self._action]
+        return self._client.run(handler)
+
+
+class _RPCCall:
+    def __init__(self, client: SQLiteClient, handler: Callable[[sqlite3.Connection, dict[str, Any]], Any], params: dict[str, Any]) -> None:
+        self._client = client
+        self._handler = handler
+        self._params = params
+
+    def execute(self) -> SQLiteResponse:
+        result = self._client.run(lambda conn: self._handler(conn, self._params))
+        return SQLiteResponse(result if isinstance(result, list) else [])
+
+
+def _bump_sport_rollup(conn: sqlite3.Connection, params: dict[str, Any]) -> None:
+    conn.execute(
+        """
+        INSERT INTO organizer_sport_rollups AS r
+            (organiser_id, sport_code, games_hosted, capacity_total, bookings_total, cancellations)
+        VALUES (:p_organiser_id, :p_sport_code, MAX(:p_games, 0), MAX(:p_capacity, 0),
+                MAX(:p_bookings, 0), MAX(:p_cancellations, 0))
+        ON CONFLICT (organiser_id, sport_code) DO UPDATE SET
+            games_hosted = MAX(r.games_hosted + :p_games, 0),
+            capacity_total = MAX(r.capacity_total + :p_capacity, 0),
+            bookings_total = MAX(r.bookings_total + :p_bookings, 0),
+            cancellations = MAX(r.cancellations + :p_cancellations, 0),
+            updated_at = CURRENT_TIMESTAMP
+        """,
+        {"p_games": 0, "p_capacity": 0, "p_bookings": 0, "p_cancellations": 0, **params},
+    )
+
+
+def _bump_player_rollup(conn: sqlite3.Connection, params: dict[str, Any]) -> None:
+    conn.execute(
+        """
+        INSERT INTO organizer_player_rollups AS r (organiser_id, user_id, games_joined)
+        VALUES (:p_organiser_id, :p_user_id, MAX(:p_delta, 0))
+        ON CONFLICT (organiser_id, user_id) DO UPDATE SET
+            games_joined = MAX(r.games_joined + :p_delta, 0)
+        """,
+        params,
+    )
+
+
+def _count_bookings_for_games(conn: sqlite3.Connection, params: dict[str, Any]) -> list[dict[str, Any]]:
+    game_ids = list(params.get("p_game_ids") or [])
+    if not game_ids:
+        return []
+    placeholders = ", ".join("?" for _ in game_ids)
+    rows = conn.execute(
+        f"SELECT game_id, COUNT(*) AS bookings FROM bookings WHERE game_id IN ({placeholders}) GROUP BY game_id",
+        game_ids,
+    )
+    return [dict(row) for row in rows]
+
+
+RPC_HANDLERS: dict[str, Callable[[sqlite3.Connection, dict[str, Any]], Any]] = {
+    "bump_organizer_sport_rollup": _bump_sport_rollup,
+    "bump_organizer_player_rollup": _bump_player_rollup,
+    "count_bookings_for_games": _count_bookings_for_games,
+}
+
+
+class SQLiteClient:
+    """Local stand-in for the Supabase client: ``table()`` and ``rpc()`` over one SQLite database."""
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = RLock()
+        # Round trips served, the SQLite equivalent of PostgREST requests; benchmarks read this.
+        self.round_trips = 0
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def table(self, name: str) -> SQLiteQuery:
+        return SQLiteQuery(self, name)
+
+    from_ = table
+
+    def rpc(self, name: str, params: dict[str, Any]) -> _RPCCall:
+        handler = RPC_HANDLERS.get(name)
+        if handler is None:
+            raise APIError({"message": f"Could not find the function {name}", "code": "PGRST202"})
+        return _RPCCall(self, handler, params)
+
+    def run(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        with request_metrics.timed("db"), self._lock:
+            self.round_trips += 1
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                result = operation(self._conn)
+                self._conn.execute("COMMIT")
+                return result
+            except sqlite3.IntegrityError as exc:
+                self._rollback()
+                raise APIError({"message": str(exc), "code": "23505" if "UNIQUE" in str(exc) else "23514"}) from exc
+            except BaseException:
+                self._rollback()
+                raise
+
+    def _rollback(self) -> None:
+        if self._conn.in_transaction:
+            self._conn.execute("ROLLBACK")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
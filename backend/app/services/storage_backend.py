@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ..core.config import get_settings
+from .sqlite_client import SQLiteClient
+from .supabase_client import get_supabase_client
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+DEFAULT_SQLITE_FILE = Path(__file__).resolve().parent.parent / "storage" / "playbud.sqlite3"
+REFERENCE_TABLES = ("cities", "sports", "abilities", "genders")
+
+StorageClient = Union["Client", SQLiteClient]
+
+_settings = get_settings()
+_lock = Lock()
+_sqlite: Optional[SQLiteClient] = None
+_override: Optional[SQLiteClient] = None
+
+
+def _seed_reference_tables(client: SQLiteClient) -> None:
+    from .metadata_repository import DEFAULT_REFERENCE_DATA, REFERENCE_FILE
+
+    if client.table("cities").select("id", count="exact", head=True).execute().count:
+        return
+    payload: dict[str, Any] = DEFAULT_REFERENCE_DATA
+    if REFERENCE_FILE.exists():
+        with REFERENCE_FILE.open("r", encoding="utf-8") as file:
+            payload = json.load(file)
+    for table in REFERENCE_TABLES:
+        rows = payload.get(table) or []
+        if rows:
+            client.table(table).upsert(rows, on_conflict="id").execute()
+
+
+def get_sqlite_client() -> SQLiteClient:
+    global _sqlite
+    with _lock:
+        if _sqlite is None:
+            _sqlite = SQLiteClient(_settings.sqlite_path or DEFAULT_SQLITE_FILE)
+            _seed_reference_tables(_sqlite)
+        return _sqlite
+
+
+def get_storage_client() -> Optional[StorageClient]:
+    """The database the repositories talk to, chosen by STORAGE_BACKEND ("supabase" or "sqlite")."""
+    if _override is not None:
+        return _override
+    if _settings.storage_backend == "sqlite":
+        return get_sqlite_client()
+    return get_supabase_client()
+
+
+def use_sqlite(client: Optional[SQLiteClient]) -> None:
+    """Route every repository to ``client`` (or back to the configured backend with None); for benchmarks and tests."""
+    global _override
+    if client is not None:
+        _seed_reference_tables(client)
+    _override = client
+
+
+def close_storage() -> None:
+    global _sqlite
+    with _lock:
+        if _sqlite is not None:
+            _sqlite.close()
+            _sqlite = None
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from supabase import Client, create_client
+import httpx
 
 from ..core.config import get_settings
+from .circuit_breaker import CircuitBreaker
+from .http_transport import RetryingTransport
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 
 class SupabaseUnavailableError(Exception):
@@ -13,6 +18,56 @@ class SupabaseUnavailableError(Exception):
 
 _settings = get_settings()
 _client: Optional[Client] = None
+_transport: Optional[RetryingTransport] = None
+
+
+def _probe() -> bool:
+    if _transport is None:
+        return False
+    key = _settings.supabase_service_role_key
+    timeout = _settings.supabase_connect_timeout_seconds
+    request = httpx.Request(
+        "GET",
+        f"{_settings.supabase_url.rstrip('/')}/rest/v1/",
+        headers={"apikey": key, "Authorization": f"Bearer {key}"},
+        extensions={"timeout": {"connect": timeout, "read": timeout, "write": timeout, "pool": timeout}},
+    )
+    return _transport.probe(request)
+
+
+breaker = CircuitBreaker(
+    "supabase",
+    failure_ratio=_settings.supabase_circuit_failure_ratio,
+    window=_settings.supabase_circuit_window,
+    min_calls=_settings.supabase_circuit_min_calls,
+    probe_interval=_settings.supabase_circuit_probe_seconds,
+    probe=_probe,
+)
+
+
+def _build_http_client() -> httpx.Client:
+    global _transport
+    _transport = RetryingTransport(
+        limits=httpx.Limits(
+            max_connections=_settings.supabase_pool_max_connections,
+            max_keepalive_connections=_settings.supabase_pool_max_keepalive,
+            keepalive_expiry=_settings.supabase_keepalive_expiry_seconds,
+        ),
+        http2=_settings.supabase_http2,
+        max_retries=_settings.supabase_read_retries,
+        backoff_seconds=_settings.supabase_retry_backoff_seconds,
+        breaker=breaker,
+    )
+    return httpx.Client(
+        transport=_transport,
+        timeout=httpx.Timeout(
+            connect=_settings.supabase_connect_timeout_seconds,
+            read=_settings.supabase_read_timeout_seconds,
+            write=_settings.supabase_write_timeout_seconds,
+            pool=_settings.supabase_pool_timeout_seconds,
+        ),
+        follow_redirects=True,
+    )
 
 
 def get_supabase_client() -> Optional[Client]:
@@ -23,9 +78,43 @@ def get_supabase_client() -> Optional[Client]:
     if not _settings.supabase_url or not _settings.supabase_service_role_key:
         return None
 
+    # Imported here: the supabase package is slow to import and SQLite-backed runs never need it.
+    from supabase import ClientOptions, create_client
+
     try:
-        _client = create_client(_settings.supabase_url, _settings.supabase_service_role_key)
+        _client = create_client(
+            _settings.supabase_url,
+            _settings.supabase_service_role_key,
+            options=ClientOptions(httpx_client=_build_http_client()),
+        )
     except Exception:
         _client = None
 
     return _client
+
+
+def ping() -> bool:
+    """One request to the REST root that skips retries and the breaker; False when unreachable or unconfigured."""
+    if get_supabase_client() is None:
+        return False
+    return _probe()
+
+
+def transport_metrics() -> dict[str, int]:
+    """Request/retry counters and connection-pool usage for the Supabase HTTP transport."""
+    if _transport is None:
+        return {}
+    return {
+        **_transport.metrics.snapshot(),
+        **_transport.pool_stats(),
+        "circuit_open": int(breaker.is_open()),
+    }
+
+
+def close_supabase_client() -> None:
+    global _client, _transport
+    breaker.stop()
+    if _transport is not None:
+        _transport.close()
+    _client = None
+    _transport = None
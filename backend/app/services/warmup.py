@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+
+from ..core import security
+from ..core.config import get_settings
+from . import email_service, game_service, reference_data_service
+from .smtp_pool import get_smtp_pool
+from .storage_backend import get_storage_client
+
+settings = get_settings()
+
+
+def _open_storage() -> None:
+    get_storage_client()
+
+
+def _reference_data() -> None:
+    # Builds the snapshot, encoded bodies, alias index and city locator the endpoints reuse.
+    reference_data_service.get_encoded_reference_data()
+    reference_data_service.get_reference_index()
+    reference_data_service.get_city_locator()
+
+
+def _upcoming_games() -> None:
+    # The public list is the hottest read; its games' detail pages come next.
+    games = game_service.list_recent_games()
+    for game in games[: settings.warmup_games]:
+        game_service.get_game(game.id)
+
+
+def _auth_keys() -> None:
+    # Imports python-jose and runs a first HS256 round trip, plus argon2's first hash setup.
+    token = security.create_access_token("warmup")
+    security.get_subject_from_token(token)
+    security.pwd_context.hash("warmup")
+    if settings.google_client_id:
+        import google.auth.transport.requests  # noqa: F401
+        import google.oauth2.id_token  # noqa: F401
+
+
+def _smtp_pool() -> None:
+    if not email_service.can_send():
+        return
+    with get_smtp_pool().session():
+        pass
+
+
+STEPS: list[tuple[str, Callable[[], None]]] = [
+    ("storage", _open_storage),
+    ("reference_data", _reference_data),
+    ("upcoming_games", _upcoming_games),
+    ("auth_keys", _auth_keys),
+    ("smtp_pool", _smtp_pool),
+]
+
+_lock = Lock()
+_ready = Event()
+_report: dict[str, dict] = {}
+_thread: Optional[Thread] = None
+
+
+def run(steps: Optional[list[tuple[str, Callable[[], None]]]] = None) -> dict[str, dict]:
+    """Run every warm-up step, then mark the instance ready.
+
+    A failing step is recorded and skipped rather than blocking readiness: the
+    request path can still do that work lazily, just more slowly.
+    """
+    report: dict[str, dict] = {}
+    for name, step in steps or STEPS:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:  # noqa: BLE001
+            report[name] = {"status": "failed", "error": str(exc)}
+            print(f"Warm-up step {name} failed: {exc}")
+        else:
+            report[name] = {"status": "ok"}
+        report[name]["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    with _lock:
+        _report.clear()
+        _report.update(report)
+    _ready.set()
+    return report
+
+
+def start() -> None:
+    """Warm up in the background so liveness answers while readiness waits."""
+    global _thread
+    if not settings.warmup_enabled:
+        _ready.set()
+        return
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _ready.clear()
+        _thread = Thread(target=run, name="warmup", daemon=True)
+        _thread.start()
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def report() -> dict[str, dict]:
+    with _lock:
+        return {name: dict(entry) for name, entry in _report.items()}
+
+
+def reset() -> None:
+    _ready.clear()
+    with _lock:
+        _report.clear()
@@ -0,0 +1,24 @@
+"""Benchmarks and load tests that drive the app in-process against a SQLite stand-in database.
+
+Importing the package isolates side effects before the app reads its settings:
+repositories use SQLite, emails are skipped and scheduler state goes to a scratch directory.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+_scratch = tempfile.mkdtemp(prefix="playbud-bench-")
+os.environ.setdefault("STORAGE_BACKEND", "sqlite")
+os.environ.setdefault("EMAIL_OUTBOX_ENABLED", "false")
+os.environ.setdefault("REMINDER_STORE_PATH", str(Path(_scratch) / "reminders.sqlite3"))
+os.environ.setdefault("CACHE_BUS_PATH", str(Path(_scratch) / "cache_bus.mmap"))
+os.environ["SMTP_USERNAME"] = ""
+os.environ["SMTP_PASSWORD"] = ""
+os.environ["ADMIN_EMAILS"] = ""
+
+if str(BENCHMARKS_DIR.parent) not in sys.path:
+    sys.path.insert(0, str(BENCHMARKS_DIR.parent))
@@ -0,0 +1,136 @@
+"""Synthetic PlayBud data written straight into a SQLite stand-in database."""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from app.core.security import hash_password
+from app.services.sqlite_client import SQLiteClient
+
+CITIES = ("Abuja", "Lagos", "Ilorin")
+SPORTS = ("FOOTBALL", "BASKETBALL", "VOLLEYBALL", "FLAGFOOTBALL", "BADMINTON")
+SKILLS = ("Beginner", "Lower Intermediate", "Intermediate", "Advanced")
+
+
+@dataclass
+class Dataset:
+    user_ids: list[str]
+    organizer_ids: list[str]
+    game_ids: list[str]
+    capacity: dict[str, int]
+    bookings: list[tuple[str, str, str]] = field(default_factory=list)  # (booking_id, game_id, user_id)
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def seed(
+    client: SQLiteClient,
+    *,
+    games: int,
+    bookings: int,
+    users: int | None = None,
+    organizers: int | None = None,
+    players_per_game: int = 20,
+    seed: int = 42,
+) -> Dataset:
+    """Insert ``games`` future games and up to ``bookings`` bookings, deterministically from ``seed``."""
+    rng = random.Random(seed)
+    users = users or max(100, bookings // 5)
+    organizers = organizers or max(10, games // 50)
+    now = datetime.utcnow().replace(microsecond=0)
+    password_hash = hash_password("benchmark")
+
+    user_rows = [
+        (_uuid(rng), f"player{i}@bench.playbud", f"Player {i}", password_hash, _uuid(rng), now.isoformat())
+        for i in range(users)
+    ]
+    user_ids = [row[0] for row in user_rows]
+    organizer_rows = [
+        (_uuid(rng), user_ids[i % users], f"organiser-{i}", json.dumps([rng.choice(SPORTS)]), now.isoformat())
+        for i in range(organizers)
+    ]
+    organizer_ids = [row[0] for row in organizer_rows]
+
+    game_rows = []
+    capacity: dict[str, int] = {}
+    for i in range(games):
+        game_id = _uuid(rng)
+        organizer_index = rng.randrange(organizers)
+        start = now + timedelta(days=rng.randint(3, 60))
+        players = rng.randint(max(2, players_per_game // 2), players_per_game)
+        capacity[game_id] = players
+        created = (now - timedelta(minutes=games - i)).isoformat()
+        game_rows.append(
+            (
+                game_id,
+                organizer_ids[organizer_index],
+                organizer_rows[organizer_index][1],
+                f"Game {i}",
+                f"Venue {rng.randrange(200)}",
+                rng.choice(CITIES),
+                rng.choice(SPORTS),
+                start.replace(hour=0, minute=0, second=0).isoformat(),
+                "18:00:00",
+                "20:00:00",
+                rng.choice(SKILLS),
+                "Mixed",
+                players,
+                "one-off",
+                "confirmed",
+                "[]",
+                created,
+                created,
+            )
+        )
+    game_ids = [row[0] for row in game_rows]
+
+    booking_rows = []
+    participants: dict[str, list[str]] = {}
+    taken: set[tuple[str, str]] = set()
+    attempts = 0
+    while len(booking_rows) < bookings and attempts < bookings * 3:
+        attempts += 1
+        game_id = game_ids[rng.randrange(games)]
+        user_id = user_ids[rng.randrange(users)]
+        joined = participants.setdefault(game_id, [])
+        if (game_id, user_id) in taken or len(joined) >= capacity[game_id] - 1:
+            continue  # keep one seat free so join scenarios can always succeed
+        taken.add((game_id, user_id))
+        joined.append(user_id)
+        booking_rows.append((_uuid(rng), game_id, user_id, now.isoformat()))
+
+    def insert(conn) -> None:
+        conn.executemany(
+            "INSERT INTO users (id, email, name, password_hash, organiser_id, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            user_rows,
+        )
+        conn.executemany(
+            "INSERT INTO organizers (id, user_id, slug, sports, created_at) VALUES (?, ?, ?, ?, ?)",
+            organizer_rows,
+        )
+        conn.executemany(
+            "INSERT INTO games (id, organiser_id, created_by_user_id, name, venue, city_slug, sport_code, date, "
+            "start_time, end_time, skill, gender, players, frequency, status, participant_user_ids, created_at, "
+            "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            game_rows,
+        )
+        conn.executemany("INSERT INTO bookings (id, game_id, user_id, joined_at) VALUES (?, ?, ?, ?)", booking_rows)
+        conn.executemany(
+            "UPDATE games SET participant_user_ids = ? WHERE id = ?",
+            [(json.dumps(ids), game_id) for game_id, ids in participants.items()],
+        )
+
+    client.run(insert)
+    return Dataset(
+        user_ids=user_ids,
+        organizer_ids=organizer_ids,
+        game_ids=game_ids,
+        capacity=capacity,
+        bookings=[(row[0], row[1], row[2]) for row in booking_rows],
+    )
@@ -0,0 +1,85 @@
+"""Cold-start import budget for the API.
+
+    python -m benchmarks.import_time                   # median of 5 fresh interpreters
+    python -m benchmarks.import_time --budget-ms 600 --top 15
+
+Each run starts a fresh interpreter with ``-X importtime`` and imports ``app.main``.
+The run fails when the median cumulative import time exceeds the budget, or when
+one of the heavy libraries that should load lazily shows up at import time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from . import BENCHMARKS_DIR
+
+BACKEND_DIR = BENCHMARKS_DIR.parent
+TARGET = "app.main"
+DEFAULT_BUDGET_MS = 1100.0
+# Only needed on specific paths (Google login, the Supabase backend, token handling).
+LAZY_MODULES = ("supabase", "gotrue", "supabase_auth", "realtime", "storage3", "google.auth", "google.oauth2", "jose")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure() -> dict[str, tuple[int, int]]:
+    """One cold import of ``app.main``; maps module name to (self, cumulative) microseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def eager_lazy_modules(modules: dict[str, tuple[int, int]]) -> list[str]:
+    return [lazy for lazy in LAZY_MODULES if any(name == lazy or name.startswith(f"{lazy}.") for name in modules)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check the cold import time of app.main against a budget.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10, help="Show the slowest top-level packages.")
+    args = parser.parse_args(argv)
+
+    samples = [measure() for _ in range(max(args.runs, 1))]
+    totals_ms = [sample[TARGET][1] / 1000 for sample in samples]
+    median_ms = statistics.median(totals_ms)
+    last = samples[-1]
+
+    packages: dict[str, int] = {}
+    for name, (self_us, _) in last.items():
+        root = name.split(".", 1)[0]
+        packages[root] = packages.get(root, 0) + self_us
+    print(f"{TARGET}: median {median_ms:.1f} ms over {len(samples)} runs (budget {args.budget_ms:.0f} ms)")
+    for root, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {root:<24} {self_us / 1000:8.1f} ms")
+
+    failures = []
+    if median_ms > args.budget_ms:
+        failures.append(f"import time {median_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+    eager = eager_lazy_modules(last)
+    if eager:
+        failures.append(f"imported eagerly: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
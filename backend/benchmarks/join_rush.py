@@ -0,0 +1,294 @@
+"""Join-rush load test: hundreds of players hit one hot game while others browse.
+
+    python -m benchmarks.join_rush --seed 7 --rushers 300 --capacity 22
+
+The whole schedule (who joins, when, which pages browsers load) is derived from
+--seed, so two runs replay the same traffic. Latency is measured from each
+request's scheduled start, so requests delayed behind a saturated app count
+as slow rather than disappearing from the tail.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from app.core.security import create_access_token
+from app.main import app
+from app.schemas.games import GameCreate
+from app.services import booking_repository, fallback_cache, game_repository, owner_resolver, storage_backend
+from app.services.sqlite_client import SQLiteClient
+
+from .dataset import seed
+
+
+@dataclass(order=True)
+class Event:
+    at: float
+    kind: str = field(compare=False)
+    path: str = field(compare=False)
+    user_id: Optional[str] = field(default=None, compare=False)
+
+
+@dataclass
+class Report:
+    seed: int
+    duration_s: float
+    requests: int
+    throughput_rps: float
+    join_attempts: int
+    joins_accepted: int
+    joins_rejected: int
+    errors: int
+    error_rate: float
+    capacity: int
+    bookings: int
+    overbooked: int
+    participant_list_drift: int
+    latency_ms: dict[str, dict[str, float]]
+    statuses: dict[str, int]
+
+
+def _next_saturday(now: datetime) -> datetime:
+    return (now + timedelta(days=(5 - now.weekday()) % 7 or 7)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _hot_game(organiser_id: str, owner_id: str, capacity: int):
+    return game_repository.create_game(
+        GameCreate(
+            organiser_id=organiser_id,
+            created_by_user_id=owner_id,
+            name="Saturday Football",
+            venue="Campus Pitch",
+            city_slug="Abuja",
+            sport_code="FOOTBALL",
+            date=_next_saturday(datetime.utcnow()),
+            start_time=dt_time(8),
+            end_time=dt_time(10),
+            skill="Intermediate",
+            gender="Mixed",
+            players=capacity,
+            frequency="recurring",
+            status="confirmed",
+        )
+    )
+
+
+def build_schedule(
+    rng: random.Random,
+    *,
+    hot_game_id: str,
+    game_ids: list[str],
+    user_ids: list[str],
+    rushers: int,
+    double_click_ratio: float,
+    rush_at: float,
+    rush_window: float,
+    duration: float,
+    browse_rps: float,
+) -> list[Event]:
+    events: list[Event] = []
+    for user_id in rng.sample(user_ids, rushers):
+        # Front-loaded arrivals: most players tap "join" in the first second after the game opens.
+        at = rush_at + rng.betavariate(1.5, 5) * rush_window
+        events.append(Event(at, "join", f"/api/games/{hot_game_id}/join", user_id))
+        if rng.random() < double_click_ratio:
+            events.append(Event(at + rng.uniform(0.05, 0.4), "join", f"/api/games/{hot_game_id}/join", user_id))
+
+    at = 0.0
+    while browse_rps > 0:
+        at += rng.expovariate(browse_rps)
+        if at >= duration:
+            break
+        roll = rng.random()
+        if roll < 0.35:
+            events.append(Event(at, "browse", "/api/games?limit=20"))
+        elif roll < 0.6:
+            game_id = hot_game_id if rng.random() < 0.5 else rng.choice(game_ids)
+            events.append(Event(at, "browse", f"/api/games/{game_id}"))
+        elif roll < 0.85:
+            events.append(Event(at, "browse", f"/api/games/{hot_game_id}/participants"))
+        else:
+            events.append(Event(at, "browse", "/api/reference-data"))
+    return sorted(events)
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))], 2)
+
+    return {
+        "p50": round(statistics.median(ordered), 2),
+        "p95": pct(95),
+        "p99": pct(99),
+        "max": round(ordered[-1], 2),
+    }
+
+
+async def _replay(events: list[Event]) -> list[tuple[Event, int, float, str]]:
+    transport = httpx.ASGITransport(app=app)
+    results: list[tuple[Event, int, float, str]] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as client:
+        tokens: dict[str, str] = {}
+        start = time.perf_counter()
+
+        async def fire(event: Event) -> None:
+            delay = start + event.at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            headers = {}
+            if event.user_id:
+                token = tokens.setdefault(event.user_id, create_access_token(event.user_id))
+                headers["Authorization"] = f"Bearer {token}"
+            try:
+                if event.kind == "join":
+                    response = await client.post(event.path, json={}, headers=headers)
+                else:
+                    response = await client.get(event.path, headers=headers)
+                status, body = response.status_code, response.text
+            except Exception as exc:  # noqa: BLE001
+                status, body = 599, repr(exc)
+            results.append((event, status, (time.perf_counter() - start - event.at) * 1000, body))
+
+        await asyncio.gather(*(fire(event) for event in events))
+    return results
+
+
+def run(
+    *,
+    seed_value: int = 42,
+    games: int = 1_000,
+    rushers: int = 300,
+    capacity: int = 22,
+    double_click_ratio: float = 0.1,
+    rush_at: float = 1.0,
+    rush_window: float = 3.0,
+    duration: float = 6.0,
+    browse_rps: float = 40.0,
+) -> Report:
+    rng = random.Random(seed_value)
+    db = SQLiteClient(":memory:")
+    storage_backend.use_sqlite(db)
+    fallback_cache.clear()
+    owner_resolver.clear()
+    try:
+        data = seed(db, games=games, bookings=games, users=max(rushers * 2, 200), seed=seed_value)
+        hot = _hot_game(data.organizer_ids[0], data.user_ids[0], capacity)
+        events = build_schedule(
+            rng,
+            hot_game_id=hot.id,
+            game_ids=data.game_ids,
+            user_ids=data.user_ids[1:],
+            rushers=rushers,
+            double_click_ratio=double_click_ratio,
+            rush_at=rush_at,
+            rush_window=rush_window,
+            duration=duration,
+            browse_rps=browse_rps,
+        )
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # the app logs skipped emails
+            results = asyncio.run(_replay(events))
+        elapsed = time.perf_counter() - started
+
+        joins = [r for r in results if r[0].kind == "join"]
+        accepted = sum(1 for _, status, _, _ in joins if status == 200)
+        rejected = sum(1 for _, status, _, _ in joins if status == 400)
+        errors = sum(1 for _, status, _, _ in results if status >= 500 or status in (401, 404, 422))
+        bookings = booking_repository.count_active_bookings(hot.id)
+        participants = game_repository.get_game(hot.id).participant_user_ids
+
+        return Report(
+            seed=seed_value,
+            duration_s=round(elapsed, 3),
+            requests=len(results),
+            throughput_rps=round(len(results) / elapsed, 1),
+            join_attempts=len(joins),
+            joins_accepted=accepted,
+            joins_rejected=rejected,
+            errors=errors,
+            error_rate=round(errors / len(results), 4) if results else 0.0,
+            capacity=capacity,
+            bookings=bookings,
+            overbooked=max(0, bookings - capacity),
+            participant_list_drift=abs(len(participants) - bookings),
+            latency_ms={
+                "join": _summary([latency for _, _, latency, _ in joins]),
+                "browse": _summary([latency for event, _, latency, _ in results if event.kind == "browse"]),
+            },
+            statuses={str(code): count for code, count in sorted(Counter(status for _, status, _, _ in results).items())},
+        )
+    finally:
+        storage_backend.use_sqlite(None)
+        db.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a join rush on one hot game plus mixed browse traffic.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--games", type=int, default=1_000, help="Background games (and bookings) to seed.")
+    parser.add_argument("--rushers", type=int, default=300, help="Distinct players trying to join the hot game.")
+    parser.add_argument("--capacity", type=int, default=22, help="Player limit of the hot game.")
+    parser.add_argument("--double-click", type=float, default=0.1, help="Share of rushers who submit twice.")
+    parser.add_argument("--rush-at", type=float, default=1.0, help="Seconds before the rush starts.")
+    parser.add_argument("--rush-window", type=float, default=3.0, help="Seconds over which rushers arrive.")
+    parser.add_argument("--duration", type=float, default=6.0, help="Seconds of browse traffic.")
+    parser.add_argument("--browse-rps", type=float, default=40.0, help="Mean browse requests per second.")
+    parser.add_argument("--json", type=Path, help="Also write the report to this file.")
+    parser.add_argument(
+        "--strict", action="store_true", help="Exit non-zero on overbooking, participant list drift or server errors."
+    )
+    args = parser.parse_args(argv)
+
+    report = run(
+        seed_value=args.seed,
+        games=args.games,
+        rushers=args.rushers,
+        capacity=args.capacity,
+        double_click_ratio=args.double_click,
+        rush_at=args.rush_at,
+        rush_window=args.rush_window,
+        duration=args.duration,
+        browse_rps=args.browse_rps,
+    )
+
+    print(f"seed {report.seed}: {report.requests} requests in {report.duration_s}s ({report.throughput_rps} req/s)")
+    print(
+        f"joins: {report.join_attempts} attempts, {report.joins_accepted} accepted, {report.joins_rejected} rejected"
+    )
+    print(f"errors: {report.errors} ({report.error_rate:.2%})  statuses: {report.statuses}")
+    print(
+        f"hot game: {report.bookings}/{report.capacity} booked, overbooked by {report.overbooked}, "
+        f"participant list drift {report.participant_list_drift}"
+    )
+    for kind, summary in report.latency_ms.items():
+        print(f"{kind} latency ms: " + "  ".join(f"{name} {value}" for name, value in summary.items()))
+    if args.json:
+        args.json.write_text(json.dumps(asdict(report), indent=2) + "\n")
+
+    if args.strict and (report.overbooked or report.participant_list_drift or report.errors):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
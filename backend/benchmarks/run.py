@@ -0,0 +1,258 @@
+"""Endpoint latency benchmarks against the in-process app and a SQLite stand-in database.
+
+    python -m benchmarks.run                      # compare against benchmarks/baseline.json
+    python -m benchmarks.run --sizes 1k --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+from app.core.security import create_access_token
+from app.main import app
+from app.services import fallback_cache, owner_resolver, storage_backend
+from app.services.sqlite_client import SQLiteClient
+
+from . import BENCHMARKS_DIR
+from .dataset import Dataset, seed
+
+BASELINE_FILE = BENCHMARKS_DIR / "baseline.json"
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+MIN_SAMPLES = 10
+
+
+@dataclass
+class Result:
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries: float
+    errors: int = 0
+
+
+class SyncASGIClient:
+    """Blocking wrapper over httpx's ASGI transport; requests never leave the process."""
+
+    def __init__(self, asgi_app) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://bench")
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return self._loop.run_until_complete(self._client.request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self._loop.run_until_complete(self._client.aclose())
+        self._loop.close()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Bench:
+    def __init__(self, db: SQLiteClient, data: Dataset, rng: random.Random) -> None:
+        self.db = db
+        self.data = data
+        self.rng = rng
+        self.http = SyncASGIClient(app)
+        self._joinable = [gid for gid in data.game_ids]
+        self._booked: list[tuple[str, str]] = []  # (booking_id, user_id) created by the join scenario
+        self._taken = {(game_id, user_id) for _, game_id, user_id in data.bookings}
+
+    def _auth(self, user_id: str) -> dict[str, str]:
+        return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+    def list_games(self):
+        return self.http.get("/api/games", params={"limit": 50})
+
+    def game_detail(self):
+        return self.http.get(f"/api/games/{self.rng.choice(self.data.game_ids)}")
+
+    def participants(self):
+        return self.http.get(f"/api/games/{self.rng.choice(self.data.game_ids)}/participants")
+
+    def reference_data(self):
+        return self.http.get("/api/reference-data")
+
+    def my_games(self):
+        return self.http.get("/api/users/me/games", headers=self._auth(self.rng.choice(self.data.user_ids)))
+
+    def join(self):
+        # Pick a user who is not in the game yet so the request takes the success path.
+        game_id = self.rng.choice(self._joinable)
+        user_id = self.rng.choice(self.data.user_ids)
+        while (game_id, user_id) in self._taken:
+            user_id = self.rng.choice(self.data.user_ids)
+        self._taken.add((game_id, user_id))
+        response = self.http.post(f"/api/games/{game_id}/join", json={}, headers=self._auth(user_id))
+        if response.status_code == 200:
+            self._booked.append((response.json()["id"], user_id))
+        elif "full" in response.text:
+            self._joinable.remove(game_id)
+        return response
+
+    def cancel(self):
+        if self._booked:
+            booking_id, user_id = self._booked.pop()
+        else:
+            booking_id, _, user_id = self.data.bookings[self.rng.randrange(len(self.data.bookings))]
+            self.data.bookings.remove((booking_id, _, user_id))
+        return self.http.delete(f"/api/bookings/{booking_id}", headers=self._auth(user_id))
+
+
+SCENARIOS: dict[str, Callable[[Bench], object]] = {
+    "list_games": Bench.list_games,
+    "game_detail": Bench.game_detail,
+    "join": Bench.join,
+    "cancel": Bench.cancel,
+    "my_games": Bench.my_games,
+    "participants": Bench.participants,
+    "reference_data": Bench.reference_data,
+}
+
+
+def run_size(
+    games: int, *, iterations: int, warmup: int, seed_value: int, max_seconds: float = 30.0
+) -> dict[str, Result]:
+    db = SQLiteClient(":memory:")
+    storage_backend.use_sqlite(db)
+    fallback_cache.clear()
+    owner_resolver.clear()
+    try:
+        data = seed(db, games=games, bookings=games, seed=seed_value)
+        bench = Bench(db, data, random.Random(seed_value))
+        results: dict[str, Result] = {}
+        for name, scenario in SCENARIOS.items():
+            timings: list[float] = []
+            trips: list[int] = []
+            errors = 0
+            with contextlib.redirect_stdout(io.StringIO()):  # the app logs skipped emails
+                for _ in range(warmup):
+                    scenario(bench)
+                deadline = time.perf_counter() + max_seconds
+                for index in range(iterations):
+                    if index >= MIN_SAMPLES and time.perf_counter() > deadline:
+                        break  # slow scenarios at large sizes: enough samples for the medians
+                    before = db.round_trips
+                    start = time.perf_counter()
+                    response = scenario(bench)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    trips.append(db.round_trips - before)
+                    if response.status_code >= 400:
+                        errors += 1
+            results[name] = Result(
+                p50_ms=round(statistics.median(timings), 3),
+                p95_ms=round(_percentile(timings, 95), 3),
+                p99_ms=round(_percentile(timings, 99), 3),
+                queries=round(statistics.mean(trips), 2),
+                errors=errors,
+            )
+        bench.http.close()
+        return results
+    finally:
+        storage_backend.use_sqlite(None)
+        db.close()
+
+
+def compare(
+    label: str,
+    results: dict[str, Result],
+    baseline: dict[str, dict],
+    *,
+    tolerance: float,
+    slack_ms: float,
+) -> list[str]:
+    failures = []
+    for name, result in results.items():
+        if result.errors:
+            failures.append(f"{label}/{name}: {result.errors} failed requests")
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        # p99 is reported but not gated: with ~100 samples it is a single outlier.
+        for metric in ("p50_ms", "p95_ms"):
+            limit = expected[metric] * (1 + tolerance) + slack_ms
+            if getattr(result, metric) > limit:
+                failures.append(f"{label}/{name}: {metric} {getattr(result, metric):.2f} > {limit:.2f}")
+        if result.queries > expected["queries"] + 0.01:
+            failures.append(f"{label}/{name}: queries/request {result.queries} > {expected['queries']}")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark API endpoints against a SQLite stand-in database.")
+    parser.add_argument("--sizes", default="1k,10k,100k", help="Comma-separated dataset sizes (1k, 10k, 100k).")
+    parser.add_argument("--iterations", type=int, default=100, help="Timed requests per scenario.")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed requests per scenario.")
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="Time cap per scenario once 10 samples exist.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative latency regression.")
+    parser.add_argument("--slack-ms", type=float, default=2.0, help="Absolute latency slack added to every budget.")
+    parser.add_argument("--update-baseline", action="store_true", help="Record these results as the new baseline.")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    failures: list[str] = []
+
+    for label in [size.strip() for size in args.sizes.split(",") if size.strip()]:
+        if label not in SIZES:
+            parser.error(f"Unknown size '{label}'; choose from {', '.join(SIZES)}")
+        results = run_size(
+            SIZES[label],
+            iterations=args.iterations,
+            warmup=args.warmup,
+            seed_value=args.seed,
+            max_seconds=args.max_seconds,
+        )
+        print(f"\n{label} games / {label} bookings")
+        print(f"{'scenario':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>10}{'errors':>8}")
+        for name, result in results.items():
+            print(
+                f"{name:<16}{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{result.p99_ms:>10.2f}"
+                f"{result.queries:>10.2f}{result.errors:>8}"
+            )
+        if args.update_baseline:
+            baseline[label] = {name: asdict(result) for name, result in results.items()}
+        else:
+            failures += compare(
+                label, results, baseline.get(label, {}), tolerance=args.tolerance, slack_ms=args.slack_ms
+            )
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    if failures:
+        print("\nRegressions:\n  " + "\n  ".join(failures))
+        return 1
+    print("\nAll scenarios within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+-- Migration: Derive organizer game listings from games.organiser_id
+-- Apply this after 0003_create_feedback_table.sql
+
+-- organizers.game_ids was maintained with a read-modify-write from the API, which cost two
+-- round-trips per game and lost updates under concurrent creates. Listings now page through
+-- games by organiser_id, so the column is no longer written.
+CREATE INDEX IF NOT EXISTS games_organiser_id_date_idx ON public.games (organiser_id, date DESC, id);
+
+-- Read-only view for tools that still expect an array of game ids per organizer.
+CREATE OR REPLACE VIEW public.organizer_game_ids AS
+SELECT
+    o.id AS organizer_id,
+    COALESCE(
+        array_agg(g.id::text ORDER BY g.created_at) FILTER (WHERE g.id IS NOT NULL),
+        '{}'::text[]
+    ) AS game_ids
+FROM public.organizers o
+LEFT JOIN public.games g ON g.organiser_id = o.id
+GROUP BY o.id;
+
+COMMENT ON COLUMN public.organizers.game_ids IS
+    'Deprecated: no longer maintained. Query games by organiser_id or use organizer_game_ids.';
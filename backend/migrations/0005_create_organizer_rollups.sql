@@ -0,0 +1,60 @@
+-- Migration: Incremental rollup counters behind GET /api/organizers/me/stats
+-- Apply this after 0004_derive_organizer_game_ids.sql
+
+CREATE TABLE IF NOT EXISTS public.organizer_sport_rollups (
+    organiser_id uuid NOT NULL REFERENCES public.organizers (id) ON DELETE CASCADE,
+    sport_code text NOT NULL,
+    games_hosted integer NOT NULL DEFAULT 0,
+    capacity_total integer NOT NULL DEFAULT 0,
+    bookings_total integer NOT NULL DEFAULT 0,
+    cancellations integer NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT timezone('UTC', now()),
+    PRIMARY KEY (organiser_id, sport_code)
+);
+
+CREATE TABLE IF NOT EXISTS public.organizer_player_rollups (
+    organiser_id uuid NOT NULL REFERENCES public.organizers (id) ON DELETE CASCADE,
+    user_id uuid NOT NULL REFERENCES public.users (id) ON DELETE CASCADE,
+    games_joined integer NOT NULL DEFAULT 0,
+    PRIMARY KEY (organiser_id, user_id)
+);
+
+CREATE INDEX IF NOT EXISTS organizer_player_rollups_repeat_idx
+    ON public.organizer_player_rollups (organiser_id, games_joined);
+
+-- Atomic increments so concurrent joins/cancels never lose updates.
+CREATE OR REPLACE FUNCTION public.bump_organizer_sport_rollup(
+    p_organiser_id uuid,
+    p_sport_code text,
+    p_games integer DEFAULT 0,
+    p_capacity integer DEFAULT 0,
+    p_bookings integer DEFAULT 0,
+    p_cancellations integer DEFAULT 0
+) RETURNS void
+LANGUAGE sql
+AS $$
+    INSERT INTO public.organizer_sport_rollups AS r
+        (organiser_id, sport_code, games_hosted, capacity_total, bookings_total, cancellations)
+    VALUES
+        (p_organiser_id, p_sport_code, GREATEST(p_games, 0), GREATEST(p_capacity, 0),
+         GREATEST(p_bookings, 0), GREATEST(p_cancellations, 0))
+    ON CONFLICT (organiser_id, sport_code) DO UPDATE SET
+        games_hosted = GREATEST(r.games_hosted + p_games, 0),
+        capacity_total = GREATEST(r.capacity_total + p_capacity, 0),
+        bookings_total = GREATEST(r.bookings_total + p_bookings, 0),
+        cancellations = GREATEST(r.cancellations + p_cancellations, 0),
+        updated_at = timezone('UTC', now());
+$$;
+
+CREATE OR REPLACE FUNCTION public.bump_organizer_player_rollup(
+    p_organiser_id uuid,
+    p_user_id uuid,
+    p_delta integer
+) RETURNS void
+LANGUAGE sql
+AS $$
+    INSERT INTO public.organizer_player_rollups AS r (organiser_id, user_id, games_joined)
+    VALUES (p_organiser_id, p_user_id, GREATEST(p_delta, 0))
+    ON CONFLICT (organiser_id, user_id) DO UPDATE SET
+        games_joined = GREATEST(r.games_joined + p_delta, 0);
+$$;
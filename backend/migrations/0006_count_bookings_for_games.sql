@@ -0,0 +1,15 @@
+-- Migration: Grouped booking counts for several games in one round trip
+-- Apply this after 0005_create_organizer_rollups.sql
+
+-- One row per game instead of one row per booking, so PostgREST's max-rows limit
+-- cannot truncate the counts.
+CREATE OR REPLACE FUNCTION public.count_bookings_for_games(p_game_ids uuid[])
+RETURNS TABLE (game_id uuid, bookings bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT b.game_id, COUNT(*) AS bookings
+    FROM public.bookings AS b
+    WHERE b.game_id = ANY (p_game_ids)
+    GROUP BY b.game_id;
+$$;
@@ -1,7 +1,103 @@
+import os
 import sys
+import tempfile
+from datetime import datetime, time, timedelta
 from pathlib import Path
 
+import pytest
+
 # Ensure backend/app is importable as "app" when running pytest from repo root.
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
+
+# Keep the outbox, reminder store and cache bus files out of app/storage; this runs before
+# any test module imports the app and its settings.
+_scratch = Path(tempfile.mkdtemp(prefix="playbud-tests-"))
+os.environ.setdefault("EMAIL_OUTBOX_PATH", str(_scratch / "email_outbox.sqlite3"))
+os.environ.setdefault("REMINDER_STORE_PATH", str(_scratch / "reminders.sqlite3"))
+os.environ.setdefault("CACHE_BUS_PATH", str(_scratch / "cache_bus.mmap"))
+
+
+def _make_game(game_id: str = "game-1", starts_in: timedelta = timedelta(days=2), **overrides):
+    from app.schemas.games import Game
+
+    start = datetime.utcnow() + starts_in
+    now = datetime.utcnow()
+    fields = dict(
+        id=game_id,
+        organiser_id=None,
+        created_by_user_id=None,
+        name="Saturday Football",
+        venue="Pitch 1",
+        city_slug="Abuja",
+        sport_code="FOOTBALL",
+        date=start.replace(hour=0, minute=0, second=0, microsecond=0),
+        start_time=start.time(),
+        end_time=start.time(),
+        skill="Mixed",
+        gender="Mixed",
+        players=10,
+        description=None,
+        rules=None,
+        frequency="one-off",
+        price=None,
+        is_private=False,
+        cancellation="24 Hours",
+        team_sheet=True,
+        status="confirmed",
+        created_at=now,
+        updated_at=now,
+    )
+    fields.update(overrides)
+    return Game(**fields)
+
+
+@pytest.fixture
+def make_game():
+    """Factory for ``Game`` records starting ``starts_in`` from now."""
+    return _make_game
+
+
+@pytest.fixture
+def sqlite_storage():
+    """Route every repository to a fresh in-memory SQLite stand-in for one test."""
+    from app.services import fallback_cache, storage_backend
+    from app.services.sqlite_client import SQLiteClient
+
+    client = SQLiteClient(":memory:")
+    storage_backend.use_sqlite(client)
+    fallback_cache.clear()
+    yield client
+    storage_backend.use_sqlite(None)
+    fallback_cache.clear()
+    client.close()
+
+
+def _create_game(*, days_ahead: int = 3, **overrides):
+    from app.schemas.games import GameCreate
+    from app.services import game_repository
+
+    fields = dict(
+        organiser_id="org",
+        name="Saturday Football",
+        venue="Pitch 1",
+        city_slug="Abuja",
+        sport_code="FOOTBALL",
+        date=datetime.utcnow() + timedelta(days=days_ahead),
+        start_time=time(9),
+        end_time=time(11),
+        skill="Beginner",
+        gender="Mixed",
+        players=2,
+        frequency="one-off",
+        status="confirmed",
+    )
+    fields.update(overrides)
+    return game_repository.create_game(GameCreate(**fields))
+
+
+@pytest.fixture
+def create_game(sqlite_storage):
+    """Factory that stores a ``GameCreate`` through game_repository; pass fields to override."""
+    return _create_game
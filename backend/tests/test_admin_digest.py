@@ -0,0 +1,78 @@
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import admin_digest, email_service
+
+
+@pytest.fixture
+def digest(monkeypatch, tmp_path):
+    monkeypatch.setattr(admin_digest, "DIGEST_FILE", tmp_path / "outbox.sqlite3")
+    monkeypatch.setattr(admin_digest, "_conn", None)
+    monkeypatch.setattr(admin_digest, "_arm", lambda due: None)
+    monkeypatch.setattr(admin_digest.settings, "admin_emails_raw", "admin@example.com")
+    monkeypatch.setattr(admin_digest.settings, "admin_digest_window_minutes", 15)
+    monkeypatch.setattr(admin_digest.settings, "admin_digest_urgent_hours", 24.0)
+    return admin_digest
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    sent = {"single": [], "digest": []}
+    monkeypatch.setattr(
+        email_service,
+        "send_game_pending_review_to_admins",
+        lambda *, game, organiser_name, admin_emails: sent["single"].append(game.id),
+    )
+    monkeypatch.setattr(
+        email_service,
+        "send_admin_pending_digest_email",
+        lambda *, games, admin_emails: sent["digest"].append([game.id for game, _ in games]),
+    )
+    return sent
+
+
+def _pending_rows(digest):
+    return digest._db().execute("SELECT game_id, flush_after FROM admin_digest_pending ORDER BY created_at").fetchall()
+
+
+def test_games_in_one_window_share_its_deadline_and_go_out_as_one_digest(digest, sent, make_game, monkeypatch):
+    digest.notify_pending_review(game=make_game("game-1"), organiser_name="Ada")
+    digest.notify_pending_review(game=make_game("game-2"), organiser_name="Bo")
+
+    rows = _pending_rows(digest)
+    assert [row["game_id"] for row in rows] == ["game-1", "game-2"]
+    assert rows[0]["flush_after"] == rows[1]["flush_after"]
+    assert digest.flush() == 0  # the window is still open
+
+    monkeypatch.setattr(time, "time", lambda: rows[0]["flush_after"] + 1)
+    assert digest.flush() == 2
+    assert sent == {"single": [], "digest": [["game-1", "game-2"]]}
+    assert digest.pending_count() == 0
+
+
+def test_urgent_games_skip_the_digest(digest, sent, make_game):
+    digest.notify_pending_review(game=make_game("soon", starts_in=timedelta(hours=3)), organiser_name=None)
+
+    assert sent["single"] == ["soon"]
+    assert digest.pending_count() == 0
+
+
+def test_pending_entries_survive_a_restart_and_are_claimed_once(digest, sent, make_game, monkeypatch):
+    digest.notify_pending_review(game=make_game("game-1"), organiser_name="Ada")
+    digest.stop()  # shutdown inside the window sends nothing early
+    assert sent == {"single": [], "digest": []}
+
+    # A fresh connection stands in for the next process (or another worker) reading the file.
+    monkeypatch.setattr(digest, "_conn", None)
+    assert digest.pending_count() == 1
+    assert digest.flush(force=True) == 1
+    assert digest.flush(force=True) == 0
+    assert sent["single"] == ["game-1"]
@@ -0,0 +1,76 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import organizer_service
+from app.services.cache_bus import RING_SIZE, CacheBus
+
+
+def test_keyed_publish_reaches_other_workers_but_not_the_publisher(tmp_path):
+    path = tmp_path / "bus.mmap"
+    # Two mappings of one file stand in for two worker processes.
+    worker_a, worker_b = CacheBus(path), CacheBus(path)
+    dropped = {"a": [], "b": []}
+    worker_a.subscribe("profiles", dropped["a"].append)
+    worker_b.subscribe("profiles", dropped["b"].append)
+
+    worker_a.publish("profiles", "org-1")
+    worker_a.publish("profiles")
+
+    assert worker_a.poll() == []
+    assert worker_b.poll() == [("profiles", "org-1"), ("profiles", None)]
+    assert worker_b.poll() == []
+    assert dropped == {"a": [], "b": ["org-1", None]}
+    worker_a.close()
+    worker_b.close()
+
+
+def test_poller_that_falls_a_full_ring_behind_drops_everything(tmp_path):
+    path = tmp_path / "bus.mmap"
+    worker_a, worker_b = CacheBus(path), CacheBus(path)
+    dropped = []
+    worker_b.subscribe("owners", dropped.append)
+    worker_b.subscribe("other", lambda key: None)
+
+    for index in range(RING_SIZE + 1):
+        worker_a.publish("owners", f"org-{index}")
+
+    assert sorted(worker_b.poll()) == [("other", None), ("owners", None)]
+    assert dropped == [None]
+    worker_a.close()
+    worker_b.close()
+
+
+def test_organizer_profile_invalidation_only_drops_that_organizer(monkeypatch):
+    published = []
+    monkeypatch.setattr(organizer_service.cache_bus, "publish", lambda channel, key=None: published.append((channel, key)))
+    organizer_service._profiles.clear()
+    organizer_service._profiles.set("a", SimpleNamespace(organizer=SimpleNamespace(id="org-a")))
+    organizer_service._profiles.set("b", SimpleNamespace(organizer=SimpleNamespace(id="org-b")))
+
+    organizer_service.invalidate_profile("org-a")
+    assert published == [("organizer_profiles", "org-a")]
+    assert organizer_service._profiles.get("a") is None
+    assert organizer_service._profiles.get("b") is not None
+
+    # What a subscriber does when another worker publishes the same key.
+    organizer_service._drop_profiles("org-b")
+    assert organizer_service._profiles.get("b") is None
+    organizer_service._profiles.clear()
+
+
+def test_default_workers_follow_the_cgroup_cpu_quota(monkeypatch, tmp_path):
+    from app import serve
+
+    cpu_max = tmp_path / "cpu.max"
+    cpu_max.write_text("150000 100000\n")
+    monkeypatch.setattr(serve, "CGROUP_CPU_MAX", str(cpu_max))
+    monkeypatch.setattr(serve.os, "sched_getaffinity", lambda pid: set(range(16)))
+    assert serve.available_cpus() == 2
+
+    cpu_max.write_text("max 100000\n")
+    assert serve.available_cpus() == 16
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.main import app
+from app.services import fallback_cache, game_repository
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.http_transport import RetryingTransport
+
+
+def test_breaker_opens_on_error_rate_and_fails_fast():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(503)
+
+    breaker = CircuitBreaker("test", failure_ratio=0.5, window=4, min_calls=4, probe_interval=60, probe=lambda: False)
+    transport = RetryingTransport(
+        limits=httpx.Limits(), max_retries=0, inner=httpx.MockTransport(handler), breaker=breaker
+    )
+    with httpx.Client(transport=transport) as client:
+        for _ in range(4):
+            client.get("http://supabase.test/rest/v1/games")
+        assert breaker.is_open()
+        with pytest.raises(CircuitOpenError):
+            client.get("http://supabase.test/rest/v1/games")
+    assert len(calls) == 4
+
+    breaker.close()
+    assert not breaker.is_open()
+    breaker.stop()
+
+
+@pytest.mark.anyio
+async def test_games_list_serves_last_known_good_when_database_is_down(monkeypatch):
+    fallback_cache.clear()
+    monkeypatch.setattr(game_repository, "list_games", lambda limit: [])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        fresh = await client.get("/api/games")
+        assert fresh.status_code == 200
+        assert "x-data-stale" not in fresh.headers
+
+        def unavailable(limit):
+            raise CircuitOpenError("supabase", 5)
+
+        monkeypatch.setattr(game_repository, "list_games", unavailable)
+        stale = await client.get("/api/games")
+        assert stale.status_code == 200
+        assert stale.json() == []
+        assert stale.headers["x-data-stale"] == "true"
+
+        uncached = await client.get("/api/games?limit=5")
+        assert uncached.status_code == 503
+        assert uncached.headers["retry-after"] == "5"
+    fallback_cache.clear()
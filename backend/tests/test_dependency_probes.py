@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.main import app
+from app.services import dependency_probes, warmup
+
+
+@pytest.fixture(autouse=True)
+def _warm_instance():
+    warmup.run([])
+    dependency_probes.reset()
+    yield
+    warmup.reset()
+    dependency_probes.reset()
+
+
+def _smtp_down():
+    raise dependency_probes.ProbeFailed("connection refused")
+
+
+def _storage_timeout():
+    raise ConnectionError("timeout")
+
+
+@pytest.mark.anyio
+async def test_readiness_serves_cached_probe_results_without_probing():
+    calls = []
+
+    def storage():
+        calls.append("storage")
+        return {"backend": "sqlite"}
+
+    dependency_probes.run_once({"storage": storage, "smtp": _smtp_down, "local_caches": lambda: {"entries": 3}})
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = [await client.get("/health/ready") for _ in range(20)]
+
+    assert calls == ["storage"]
+    assert {response.status_code for response in responses} == {200}
+    dependencies = responses[-1].json()["dependencies"]
+    assert dependencies["storage"]["status"] == "ok"
+    # SMTP failures degrade email but do not take the instance out of rotation.
+    assert dependencies["smtp"] == {
+        "status": "down",
+        "latency_ms": dependencies["smtp"]["latency_ms"],
+        "age_seconds": dependencies["smtp"]["age_seconds"],
+        "error": "connection refused",
+    }
+
+
+@pytest.mark.anyio
+async def test_readiness_fails_when_storage_probe_fails_or_goes_stale(monkeypatch):
+    dependency_probes.run_once({"storage": _storage_timeout})
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        down = await client.get("/health/ready")
+        assert down.status_code == 503
+        assert down.json()["status"] == "unavailable"
+
+        dependency_probes.run_once({"storage": lambda: {"backend": "sqlite"}})
+        assert (await client.get("/health/ready")).status_code == 200
+
+        monkeypatch.setattr(dependency_probes.settings, "dependency_probe_interval_seconds", -1.0)
+        stale = await client.get("/health/ready")
+        assert stale.status_code == 503
+        assert stale.json()["dependencies"]["storage"]["status"] == "stale"
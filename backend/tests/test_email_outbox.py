@@ -0,0 +1,60 @@
+import smtplib
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import email_outbox, email_service
+
+
+def _fresh_outbox(monkeypatch, tmp_path):
+    monkeypatch.setattr(email_outbox, "OUTBOX_FILE", tmp_path / "outbox.sqlite3")
+    monkeypatch.setattr(email_outbox, "_conn", None)
+    monkeypatch.setattr(email_outbox, "start_workers", lambda: None)
+
+
+def _enqueue(recipient: str = "player@example.com") -> None:
+    email_outbox.enqueue(subject="Hi", recipient=recipient, text_body="text", html_body="<p>html</p>")
+
+
+def test_delivered_messages_leave_the_outbox(monkeypatch, tmp_path):
+    _fresh_outbox(monkeypatch, tmp_path)
+    delivered = []
+    monkeypatch.setattr(email_service, "_deliver_email", lambda **kwargs: delivered.append(kwargs))
+
+    _enqueue()
+    row, _ = email_outbox._claim_next()
+    email_outbox._deliver(row)
+
+    assert [item["recipient"] for item in delivered] == ["player@example.com"]
+    assert email_outbox.pending_count() == 0
+
+
+def test_failed_messages_back_off_then_dead_letter(monkeypatch, tmp_path):
+    _fresh_outbox(monkeypatch, tmp_path)
+
+    def refuse(**kwargs):
+        raise smtplib.SMTPRecipientsRefused({kwargs["recipient"]: (550, b"Mailbox unavailable")})
+
+    monkeypatch.setattr(email_service, "_deliver_email", refuse)
+    monkeypatch.setattr(email_outbox.settings, "email_outbox_max_attempts", 2)
+
+    _enqueue()
+    row, _ = email_outbox._claim_next()
+    email_outbox._deliver(row)
+
+    row, next_due = email_outbox._claim_next()
+    assert row is None
+    assert next_due is not None
+
+    email_outbox._db().execute("UPDATE email_outbox SET next_attempt_at = 0")
+    row, _ = email_outbox._claim_next()
+    email_outbox._deliver(row)
+
+    assert email_outbox.pending_count() == 0
+    dead = email_outbox.dead_letters()
+    assert [item["recipient"] for item in dead] == ["player@example.com"]
+    assert dead[0]["attempts"] == 2
+    assert "Mailbox unavailable" in dead[0]["last_error"]
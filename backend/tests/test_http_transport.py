@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services.http_transport import RetryingTransport
+
+
+def _transport(handler, max_retries=2):
+    return RetryingTransport(
+        limits=httpx.Limits(max_connections=4),
+        max_retries=max_retries,
+        backoff_seconds=0,
+        inner=httpx.MockTransport(handler),
+    )
+
+
+def test_reads_are_retried_on_transient_errors():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.method)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        if len(attempts) == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    transport = _transport(handler)
+    with httpx.Client(transport=transport) as client:
+        response = client.get("http://supabase.test/rest/v1/games")
+
+    assert response.json() == {"ok": True}
+    assert transport.metrics.snapshot() == {"requests": 3, "retries": 2, "failures": 0, "retried_statuses": 1}
+
+
+def test_writes_are_not_retried():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.method)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    transport = _transport(handler)
+    with httpx.Client(transport=transport) as client:
+        with pytest.raises(httpx.ConnectError):
+            client.post("http://supabase.test/rest/v1/bookings", json={})
+
+    assert attempts == ["POST"]
+    assert transport.metrics.snapshot()["failures"] == 1
+
+
+def test_reads_give_up_after_max_retries():
+    transport = _transport(lambda request: httpx.Response(504), max_retries=1)
+    with httpx.Client(transport=transport) as client:
+        assert client.get("http://supabase.test/rest/v1/games").status_code == 504
+    assert transport.metrics.snapshot()["requests"] == 2
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+LAZY_MODULES = ("supabase", "google.auth", "google.oauth2", "jose")
+
+
+def test_app_import_leaves_heavy_clients_unloaded():
+    script = (
+        "import sys, app.main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_ROOT, capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == ""
+    # Settings load quietly; nothing about secrets reaches stdout.
+    assert "Service Role" not in completed.stdout
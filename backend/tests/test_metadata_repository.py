@@ -0,0 +1,122 @@
+import copy
+import sys
+import time
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import metadata_repository
+
+
+class FakeClient:
+    """Answers ``client.table(name).select("*").order("name").execute().data`` from a dict."""
+
+    def __init__(self, tables: dict, delay: float = 0.0) -> None:
+        self.tables = tables
+        self.delay = delay
+        self.calls: list[str] = []
+
+    def table(self, name: str):
+        self.calls.append(name)
+        return self._Query(self, name)
+
+    class _Query:
+        def __init__(self, client: "FakeClient", name: str) -> None:
+            self.client, self.name = client, name
+
+        def select(self, *args):
+            return self
+
+        def order(self, *args):
+            return self
+
+        def execute(self):
+            time.sleep(self.client.delay)
+            return type("Response", (), {"data": copy.deepcopy(self.client.tables[self.name])})()
+
+
+class InlineThread:
+    """Runs the background refresh synchronously so the test can observe its result."""
+
+    def __init__(self, target, name=None, daemon=None) -> None:
+        self.target = target
+
+    def start(self) -> None:
+        self.target()
+
+
+@pytest.fixture
+def repo(monkeypatch, tmp_path):
+    monkeypatch.setattr(metadata_repository, "REFERENCE_FILE", tmp_path / "reference_data.json")
+    monkeypatch.setattr(metadata_repository, "_file_digest", None)
+    monkeypatch.setattr(metadata_repository, "_cached", None)
+    monkeypatch.setattr(metadata_repository, "_cached_version", None)
+    monkeypatch.setattr(metadata_repository, "_cached_at", 0.0)
+    monkeypatch.setattr(metadata_repository, "_fresh_at", None)
+    monkeypatch.setattr(metadata_repository, "_refreshing", False)
+    monkeypatch.setattr(metadata_repository.settings, "reference_data_ttl_seconds", 300)
+    client = FakeClient(copy.deepcopy(metadata_repository.DEFAULT_REFERENCE_DATA))
+    monkeypatch.setattr(metadata_repository, "get_storage_client", lambda: client)
+    return client
+
+
+def test_stale_snapshot_is_served_while_a_refresh_loads_the_new_one(repo, monkeypatch):
+    monkeypatch.setattr(metadata_repository, "Thread", InlineThread)
+    fresh, version = metadata_repository.get_reference_snapshot()
+    assert len(repo.calls) == len(metadata_repository.REFERENCE_TABLES)
+
+    # Still fresh: no database calls.
+    assert metadata_repository.get_reference_snapshot() == (fresh, version)
+    assert len(repo.calls) == len(metadata_repository.REFERENCE_TABLES)
+
+    repo.tables["cities"][0]["name"] = "Abuja FCT"
+    metadata_repository.invalidate_reference_data()
+    stale, stale_version = metadata_repository.get_reference_snapshot()
+    assert stale_version == version  # the caller gets the stale copy without waiting
+
+    refreshed, refreshed_version = metadata_repository.get_reference_snapshot()
+    assert refreshed_version != version
+    assert refreshed.cities[0].name == "Abuja FCT"
+    assert metadata_repository.reference_data_age() is not None
+
+
+def test_cold_cache_loads_once_for_concurrent_callers(repo):
+    repo.delay = 0.05
+    results = []
+
+    def read():
+        results.append(metadata_repository.get_reference_snapshot()[1])
+
+    threads = [Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(results)) == 1 and len(results) == 8
+    assert sorted(repo.calls) == sorted(metadata_repository.REFERENCE_TABLES)
+
+
+def test_unchanged_payload_does_not_rewrite_the_file(repo, monkeypatch):
+    path = metadata_repository.REFERENCE_FILE
+    writes = []
+    original = type(path).write_text
+
+    def counting_write(self, *args, **kwargs):
+        writes.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(path), "write_text", counting_write)
+    metadata_repository.get_reference_snapshot()
+    assert writes == [path]
+
+    # A later process starts with no in-memory digest and must compare against the file.
+    monkeypatch.setattr(metadata_repository, "_file_digest", None)
+    metadata_repository.invalidate_reference_data()
+    metadata_repository._background_refresh()
+    assert writes == [path]
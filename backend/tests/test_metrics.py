@@ -0,0 +1,109 @@
+import sys
+from pathlib import Path
+from threading import Thread
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core import metrics
+from app.main import app
+from app.services.cache import TTLCache
+from app.services.http_transport import table_label
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(metrics, "REGISTRY", {})
+    return metrics.REGISTRY
+
+
+def test_counters_sum_per_thread_shards(registry):
+    counter = metrics.Counter("test_events_total", "Events.", ("kind",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("a")
+
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc("b", amount=2)
+
+    assert counter.value("a") == 4000
+    assert 'test_events_total{kind="b"} 2' in metrics.render()
+
+
+def test_exited_threads_fold_into_a_retired_total(registry):
+    counter = metrics.Counter("test_jobs_total", "Jobs.")
+    histogram = metrics.Histogram("test_job_seconds", "Job time.", buckets=(1.0,))
+
+    def job():
+        counter.inc()
+        histogram.observe(0.5)
+
+    for _ in range(50):
+        thread = Thread(target=job)
+        thread.start()
+        thread.join()
+
+    assert counter.value() == 50
+    assert histogram.count() == 50
+    # Only shards of live threads are kept; the 50 finished ones were folded away.
+    assert len(counter._shards) <= 1
+    assert len(histogram._shards) <= 1
+    counter.inc()
+    assert counter.value() == 51
+
+
+def test_histogram_renders_cumulative_buckets(registry):
+    histogram = metrics.Histogram("test_latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, "/x")
+
+    lines = metrics.render().splitlines()
+    assert 'test_latency_seconds_bucket{route="/x",le="0.1"} 1' in lines
+    assert 'test_latency_seconds_bucket{route="/x",le="1"} 3' in lines
+    assert 'test_latency_seconds_bucket{route="/x",le="+Inf"} 4' in lines
+    assert 'test_latency_seconds_count{route="/x"} 4' in lines
+    assert 'test_latency_seconds_sum{route="/x"} 4.05' in lines
+
+
+def test_named_cache_reports_hit_ratio():
+    cache = TTLCache(60, name="test_ratio")
+    cache.set("k", 1)
+    cache.get("k")
+    cache.get("k")
+    cache.get("missing")
+    cache.get("k")
+
+    assert 'playbud_cache_hit_ratio{cache="test_ratio"} 0.75' in metrics.render()
+
+
+def test_table_label_groups_calls_by_table():
+    assert table_label(httpx.URL("https://x.supabase.co/rest/v1/games?select=*&id=eq.1")) == "games"
+    assert table_label(httpx.URL("https://x.supabase.co/rest/v1/rpc/bump_organizer_sport_rollup")) == (
+        "rpc/bump_organizer_sport_rollup"
+    )
+    assert table_label(httpx.URL("https://x.supabase.co/auth/v1/user")) == "other"
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_exposes_route_latency_and_threadpool():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/health")
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'playbud_http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in body
+    assert 'playbud_threadpool_workers{state="capacity"} 40' in body
+    assert "playbud_email_outbox_pending" in body
+    assert "playbud_reminders_pending" in body
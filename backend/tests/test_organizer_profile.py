@@ -0,0 +1,101 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.main import app
+from app.routers.auth import _get_current_user
+from app.schemas.auth import UserBase
+from app.services import game_repository, organizer_repository, organizer_service
+from app.services.organizer_repository import OrganizerRecord
+
+
+@pytest.fixture(autouse=True)
+def _empty_profile_cache():
+    organizer_service._profiles.clear()
+    yield
+    organizer_service._profiles.clear()
+
+
+@pytest.mark.anyio
+async def test_profile_by_slug_is_cached_until_invalidated(monkeypatch):
+    lookups = []
+    record = OrganizerRecord(id="org-1", user_id="user-1", slug="lagos-ballers", created_at=datetime(2024, 1, 1))
+
+    def get_by_slug(slug):
+        lookups.append(slug)
+        return record if slug == "lagos-ballers" else None
+
+    monkeypatch.setattr(organizer_repository, "get_by_slug", get_by_slug)
+    monkeypatch.setattr(game_repository, "list_upcoming_public_games_by_organizer", lambda organizer_id, limit: [])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/organizers/by-slug/Lagos-Ballers")
+        second = await client.get("/api/organizers/by-slug/lagos-ballers")
+        assert first.status_code == second.status_code == 200
+        assert first.json()["organizer"]["id"] == "org-1"
+        assert "user_id" not in first.json()["organizer"]
+        assert lookups == ["lagos-ballers"]
+
+        organizer_service.invalidate_profile("org-1")
+        await client.get("/api/organizers/by-slug/lagos-ballers")
+        assert lookups == ["lagos-ballers", "lagos-ballers"]
+
+        missing = await client.get("/api/organizers/by-slug/nobody")
+        assert missing.status_code == 404
+
+
+@pytest.fixture
+def signed_in():
+    app.dependency_overrides[_get_current_user] = lambda: UserBase(id="user-1", email="host@example.com", name="Host")
+    yield
+    app.dependency_overrides.pop(_get_current_user, None)
+
+
+@pytest.mark.anyio
+async def test_my_games_requires_a_signed_in_user():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/organizers/me/games")
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_my_games_is_empty_for_users_who_are_not_organizers(signed_in, monkeypatch):
+    monkeypatch.setattr(organizer_repository, "get_by_user_id", lambda user_id: None)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/organizers/me/games")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.anyio
+async def test_my_games_pages_with_limit_and_offset(signed_in, monkeypatch, make_game):
+    record = OrganizerRecord(id="org-1", user_id="user-1", slug="host", created_at=datetime(2024, 1, 1))
+    games = [make_game(f"game-{index:02d}") for index in range(25)]
+    calls = []
+
+    def list_games_by_organizer(organizer_id, *, limit, offset):
+        calls.append((organizer_id, limit, offset))
+        return games[offset : offset + limit]
+
+    monkeypatch.setattr(organizer_repository, "get_by_user_id", lambda user_id: record)
+    monkeypatch.setattr(game_repository, "list_games_by_organizer", list_games_by_organizer)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/organizers/me/games")
+        last = await client.get("/api/organizers/me/games", params={"limit": 10, "offset": 20})
+        too_many = await client.get("/api/organizers/me/games", params={"limit": 101})
+
+    assert [game["id"] for game in first.json()] == [f"game-{index:02d}" for index in range(20)]
+    assert [game["id"] for game in last.json()] == [f"game-{index:02d}" for index in range(20, 25)]
+    assert calls == [("org-1", 20, 0), ("org-1", 10, 20)]
+    assert too_many.status_code == 422
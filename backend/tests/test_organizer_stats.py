@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.scripts import reconcile_organizer_stats
+from app.services import (
+    booking_service,
+    organizer_repository,
+    organizer_stats_repository,
+    organizer_stats_service,
+    reminder_scheduler,
+    user_repository,
+)
+from app.services.organizer_stats_repository import SportRollup
+
+
+def test_stats_aggregate_rollups_per_sport(monkeypatch):
+    rollups = [
+        SportRollup(organiser_id="org", sport_code="FOOTBALL", games_hosted=3, capacity_total=30, bookings_total=24, cancellations=2),
+        SportRollup(organiser_id="org", sport_code="TENNIS", games_hosted=1, capacity_total=10, bookings_total=2),
+    ]
+    monkeypatch.setattr(organizer_stats_repository, "list_sport_rollups", lambda organiser_id: rollups)
+    monkeypatch.setattr(organizer_stats_repository, "count_repeat_players", lambda organiser_id: 5)
+
+    stats = organizer_stats_service.get_stats("org")
+
+    assert stats.games_hosted == 4
+    assert stats.cancellations == 2
+    assert stats.repeat_players == 5
+    assert stats.average_fill_rate == 0.65
+    assert [(sport.sport_code, sport.average_fill_rate) for sport in stats.by_sport] == [
+        ("FOOTBALL", 0.8),
+        ("TENNIS", 0.2),
+    ]
+
+
+@pytest.fixture
+def hosted_games(create_game, monkeypatch):
+    # join_game schedules reminders; keep the scheduler thread from outliving the test.
+    monkeypatch.setattr(reminder_scheduler, "start", lambda: None)
+    host = user_repository.create_user(email="host@example.com", password_hash="x", name="Host")
+    organizer = organizer_repository.create(host.id, "host", ["FOOTBALL"])
+    players = [
+        user_repository.create_user(email=f"p{index}@example.com", password_hash="x", name=f"P{index}")
+        for index in range(2)
+    ]
+    games = [
+        create_game(organiser_id=organizer.id, created_by_user_id=host.id, players=4, days_ahead=5),
+        create_game(organiser_id=organizer.id, created_by_user_id=host.id, players=4, days_ahead=6, sport_code="TENNIS"),
+    ]
+    for game in games:
+        organizer_stats_service.record_game_created(game)
+    return organizer, players, games
+
+
+def test_counters_move_on_join_and_cancel(hosted_games):
+    organizer, (ada, bo), (football, tennis) = hosted_games
+
+    booking_service.join_game(football.id, ada.id)
+    cancelled = booking_service.join_game(football.id, bo.id)
+    booking_service.join_game(tennis.id, ada.id)
+    stats = organizer_stats_service.get_stats(organizer.id)
+    assert (stats.games_hosted, stats.bookings, stats.cancellations, stats.repeat_players) == (2, 3, 0, 1)
+
+    booking_service.cancel_booking(cancelled.id, bo.id)
+    stats = organizer_stats_service.get_stats(organizer.id)
+    assert (stats.bookings, stats.cancellations) == (2, 1)
+    assert {sport.sport_code: sport.bookings for sport in stats.by_sport} == {"FOOTBALL": 1, "TENNIS": 1}
+    assert stats.average_fill_rate == 0.25
+
+
+def test_reconcile_rebuild_repairs_drifted_counters(sqlite_storage, hosted_games):
+    organizer, (ada, bo), (football, tennis) = hosted_games
+    booking_service.join_game(football.id, ada.id)
+    booking_service.cancel_booking(booking_service.join_game(football.id, bo.id).id, bo.id)
+    booking_service.join_game(tennis.id, ada.id)
+    expected = organizer_stats_service.get_stats(organizer.id)
+
+    # Lost and doubled bumps, as after a crash between the booking write and the counter update.
+    organizer_stats_repository.bump_sport_rollup(organizer.id, "FOOTBALL", bookings=5, games=1)
+    organizer_stats_repository.bump_player_rollup(organizer.id, bo.id, 3)
+    assert organizer_stats_service.get_stats(organizer.id) != expected
+
+    sports, players = reconcile_organizer_stats.rebuild(sqlite_storage, organizer.id)
+    organizer_stats_repository.replace_rollups(organizer.id, sports, players)
+
+    assert organizer_stats_service.get_stats(organizer.id) == expected
+
+
+def test_a_failed_counter_update_does_not_fail_the_request(monkeypatch, make_game, capsys):
+    def unavailable(*args, **kwargs):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(organizer_stats_repository, "bump_sport_rollup", unavailable)
+    organizer_stats_service.record_game_created(make_game(organiser_id="org"))
+
+    assert "for org failed: database unavailable" in capsys.readouterr().out
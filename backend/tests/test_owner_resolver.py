@@ -0,0 +1,73 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import organizer_repository, owner_resolver, user_repository
+from app.services.organizer_repository import OrganizerRecord
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches():
+    owner_resolver.clear()
+    yield
+    owner_resolver.clear()
+
+
+class _User:
+    def __init__(self, user_id, name="Owner"):
+        self.id = user_id
+        self.name = name
+
+
+def test_organizer_owner_is_resolved_once_per_game(monkeypatch, make_game):
+    calls = []
+
+    def get_user_by_id(user_id):
+        calls.append(("user", user_id))
+        return _User(user_id)
+
+    def get_by_id(organizer_id):
+        calls.append(("organizer", organizer_id))
+        return OrganizerRecord(id=organizer_id, user_id="owner-1", created_at=datetime(2024, 1, 1))
+
+    monkeypatch.setattr(user_repository, "get_user_by_id", get_user_by_id)
+    monkeypatch.setattr(organizer_repository, "get_by_id", get_by_id)
+
+    game = make_game("game-1", created_by_user_id=None, organiser_id="org-1")
+    assert owner_resolver.get_game_owner(game).id == "owner-1"
+    assert owner_resolver.get_game_owner(game).id == "owner-1"
+    assert owner_resolver.get_game_owner(make_game("game-2", created_by_user_id=None, organiser_id="org-1")).id == "owner-1"
+
+    # A second game of the same organizer reuses the mapping; only its owner record is loaded.
+    assert calls == [("organizer", "org-1"), ("user", "owner-1"), ("user", "owner-1")]
+
+
+def test_profile_updates_drop_the_cached_owner(monkeypatch, make_game):
+    names = {"owner-1": "Ada"}
+    monkeypatch.setattr(user_repository, "get_user_by_id", lambda user_id: _User(user_id, names[user_id]))
+    monkeypatch.setattr(owner_resolver.cache_bus, "publish", lambda channel, key=None: None)
+    game = make_game("game-1", created_by_user_id="owner-1")
+
+    assert owner_resolver.get_game_owner(game).name == "Ada"
+    names["owner-1"] = "Ada L."
+    assert owner_resolver.get_game_owner(game).name == "Ada"
+
+    owner_resolver.forget_user("owner-1")
+    assert owner_resolver.get_game_owner(game).name == "Ada L."
+
+
+def test_missing_creator_falls_back_to_organizer(monkeypatch, make_game):
+    monkeypatch.setattr(user_repository, "get_user_by_id", lambda user_id: _User(user_id) if user_id != "gone" else None)
+    monkeypatch.setattr(
+        organizer_repository,
+        "get_by_id",
+        lambda organizer_id: OrganizerRecord(id=organizer_id, user_id="owner-2", created_at=datetime(2024, 1, 1)),
+    )
+    assert owner_resolver.get_game_owner(make_game("game-3", created_by_user_id="gone", organiser_id="org-2")).id == "owner-2"
+    assert owner_resolver.get_game_owner(make_game("game-4", created_by_user_id=None, organiser_id=None)) is None
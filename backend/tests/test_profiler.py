@@ -0,0 +1,78 @@
+import sys
+import threading
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.main import app
+from app.routers import admin
+from app.routers.auth import _get_current_user
+from app.schemas.auth import UserBase
+from app.services import profiler
+
+
+@pytest.fixture
+def signed_in(monkeypatch):
+    user = UserBase(id="user-1", email="ops@playbud.site", name="Ops")
+    app.dependency_overrides[_get_current_user] = lambda: user
+    yield monkeypatch
+    app.dependency_overrides.pop(_get_current_user, None)
+
+
+def _spin_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sample_stacks_folds_busy_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin_until, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        folded = profiler.sample_stacks(0.2, interval_seconds=0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    lines = [line for line in folded.splitlines() if line.startswith("busy-worker;")]
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert "_spin_until (" in stack
+    assert int(count) > 0
+
+
+@pytest.mark.anyio
+async def test_profile_endpoints_are_admin_only(signed_in):
+    signed_in.setattr(admin, "ADMIN_EMAILS", set())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/admin/profile", params={"seconds": 0.01})
+        assert response.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_allocation_trace_covers_requests_to_the_path(signed_in):
+    signed_in.setattr(admin, "ADMIN_EMAILS", {"ops@playbud.site"})
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def traffic():
+            await anyio.sleep(0.1)
+            for _ in range(3):
+                await client.get("/health")
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(traffic)
+            response = await client.get("/api/admin/profile/allocations", params={"path": "/health", "seconds": 0.5})
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["path"] == "/health"
+    assert 1 <= report["requests"] <= 3
+    assert all(entry["size_bytes"] > 0 for entry in report["top"])
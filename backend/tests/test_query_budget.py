@@ -0,0 +1,92 @@
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core import request_metrics
+from app.core.security import create_access_token
+from app.main import app
+from app.services import booking_repository, user_repository
+
+
+def _game_with_players(create_game, count: int):
+    users = [
+        user_repository.create_user(email=f"p{count}-{i}@example.com", password_hash="x", name=f"P{i}")
+        for i in range(count)
+    ]
+    game = create_game(days_ahead=5, players=20)
+    for user in users:
+        booking_repository.create_booking(game.id, user.id)
+    return game, users
+
+
+def _db_calls(response: httpx.Response) -> int:
+    match = re.search(r'db;dur=[\d.]+;desc="(\d+) calls"', response.headers["server-timing"])
+    return int(match.group(1)) if match else 0
+
+
+@pytest.mark.anyio
+async def test_participants_query_count_does_not_grow_with_players(create_game):
+    small, _ = _game_with_players(create_game, 2)
+    large, _ = _game_with_players(create_game, 12)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        small_response = await client.get(f"/api/games/{small.id}/participants")
+        large_response = await client.get(f"/api/games/{large.id}/participants")
+
+    assert len(large_response.json()) == 12
+    assert _db_calls(small_response) == _db_calls(large_response) <= 2
+
+
+@pytest.mark.anyio
+async def test_my_games_stays_within_query_budget(create_game):
+    game, users = _game_with_players(create_game, 3)
+    other, _ = _game_with_players(create_game, 1)
+    booking_repository.create_booking(other.id, users[0].id)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/users/me/games", headers={"Authorization": f"Bearer {create_access_token(users[0].id)}"}
+        )
+
+    assert response.status_code == 200
+    assert {item["participants_count"] for item in response.json()} == {3, 2}
+    # current user + bookings + games + counts
+    assert _db_calls(response) <= 4
+
+
+
+@pytest.mark.anyio
+async def test_each_request_writes_one_json_log_line(create_game, caplog):
+    game, _ = _game_with_players(create_game, 2)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(f"/api/games/{game.id}/participants")
+
+    # Nothing but the app itself configures this logger, so INFO must be enabled by default.
+    assert logging.getLogger("playbud.requests").isEnabledFor(logging.INFO)
+    records = [record for record in caplog.records if record.name == "playbud.requests"]
+    assert len(records) == 1
+    line = json.loads(records[0].getMessage())
+    assert line["method"] == "GET"
+    assert line["path"] == f"/api/games/{game.id}/participants"
+    assert line["status"] == response.status_code == 200
+    assert line["calls"]["db"] == _db_calls(response)
+
+def test_capture_counts_hash_operations():
+    from app.core import security
+
+    with request_metrics.capture() as metrics:
+        security.verify_password("secret", security.hash_password("secret"))
+    assert metrics.counts["hash"] == 2
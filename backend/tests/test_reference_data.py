@@ -0,0 +1,65 @@
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.main import app
+from app.schemas.metadata import ReferenceData
+from app.services import metadata_repository, reference_data_service
+
+REFERENCE = ReferenceData(**metadata_repository.DEFAULT_REFERENCE_DATA)
+
+
+@pytest.fixture(autouse=True)
+def _cached_reference_data(monkeypatch):
+    monkeypatch.setattr(metadata_repository, "get_reference_snapshot", lambda: (REFERENCE, "v1" * 16))
+
+
+@pytest.mark.anyio
+async def test_reference_data_serves_precomputed_gzip_and_etag():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/reference-data", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == json.loads(REFERENCE.model_dump_json())
+        etag = response.headers["etag"]
+
+        cached = await client.get("/api/reference-data", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+
+@pytest.mark.anyio
+async def test_reference_data_plain_body_matches_model():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/reference-data", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert ReferenceData(**response.json()) == REFERENCE
+
+
+def test_reference_index_resolves_aliases_to_canonical_values():
+    assert reference_data_service.resolve_city("abuja") == "Abuja"
+    assert reference_data_service.resolve_city("  city-lagos ") == "Lagos"
+    assert reference_data_service.resolve_sport("Flag Football") == "FLAGFOOTBALL"
+    assert reference_data_service.resolve_sport("football") == "FOOTBALL"
+    assert reference_data_service.resolve_ability("lower intermediate") == "Lower Intermediate"
+    assert reference_data_service.resolve_city("Abujaa") is None
+
+
+def test_resolve_city_prefers_containing_city_then_nearest():
+    inside_lagos = reference_data_service.resolve_city_for_point(6.60, 3.35)
+    assert inside_lagos.city.slug == "Lagos"
+    assert inside_lagos.within_radius
+
+    far_north = reference_data_service.resolve_city_for_point(12.0, 8.5)
+    assert far_north.city.slug == "Abuja"
+    assert not far_north.within_radius
+    assert far_north.distance_km > far_north.city.radius_km
@@ -0,0 +1,63 @@
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import email_service, game_repository, reminder_scheduler
+
+
+@pytest.fixture
+def scheduler(monkeypatch, tmp_path):
+    monkeypatch.setattr(reminder_scheduler, "REMINDER_FILE", tmp_path / "reminders.sqlite3")
+    monkeypatch.setattr(reminder_scheduler, "_conn", None)
+    monkeypatch.setattr(reminder_scheduler, "_heap", [])
+    monkeypatch.setattr(reminder_scheduler, "_live", {})
+    monkeypatch.setattr(reminder_scheduler, "start", lambda: None)
+    return reminder_scheduler
+
+
+def test_reminders_are_deduplicated_per_game_and_recipient(scheduler, make_game):
+    game = make_game("game-1", timedelta(days=2))
+
+    scheduler.schedule(game=game, recipient="a@example.com", name="A", user_id="user-a")
+    scheduler.schedule(game=game, recipient="a@example.com", name="A", user_id="user-a")
+
+    assert scheduler.pending_count() == 1
+
+
+def test_due_reminders_dispatch_as_one_batch_per_game(scheduler, monkeypatch, make_game):
+    game = make_game("game-1", timedelta(hours=1))
+    fetched, sent = [], []
+    monkeypatch.setattr(game_repository, "get_game", lambda game_id: fetched.append(game_id) or game)
+    monkeypatch.setattr(email_service, "send_game_reminder_email", lambda **kwargs: sent.append(kwargs["recipient"]))
+
+    for recipient in ("a@example.com", "b@example.com", "c@example.com"):
+        scheduler.schedule(game=game, recipient=recipient)
+    scheduler.cancel("game-1", recipient="c@example.com")
+
+    batch = scheduler._pop_due_batch(time.time())
+    scheduler._dispatch(batch)
+
+    assert fetched == ["game-1"]
+    assert sorted(sent) == ["a@example.com", "b@example.com"]
+    assert scheduler.pending_count() == 0
+
+
+def test_reminders_survive_a_restart(scheduler, monkeypatch, make_game):
+    game = make_game("game-1", timedelta(days=2))
+    scheduler.schedule(game=game, recipient="a@example.com", user_id="user-a")
+
+    monkeypatch.setattr(reminder_scheduler, "_conn", None)
+    monkeypatch.setattr(reminder_scheduler, "_heap", [])
+    monkeypatch.setattr(reminder_scheduler, "_live", {})
+    scheduler._reload()
+
+    assert list(scheduler._live) == [("game-1", "a@example.com")]
+    assert scheduler.cancel("game-1", user_id="user-a") == 1
+    assert scheduler.pending_count() == 0
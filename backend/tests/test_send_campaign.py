@@ -0,0 +1,105 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.scripts import send_campaign
+from app.scripts.send_campaign import CampaignError, Checkpoint, RateLimiter, Recipient, run_campaign
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakePool:
+    instances: list["FakePool"] = []
+    fail_for: set[str] = set()
+
+    def __init__(self, **kwargs) -> None:
+        self.sent: list[str] = []
+        FakePool.instances.append(self)
+
+    def send(self, message) -> None:
+        if message["To"] in self.fail_for:
+            raise ConnectionError("refused")
+        self.sent.append(message["To"])
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    FakePool.instances = []
+    monkeypatch.setattr(send_campaign, "SMTPConnectionPool", FakePool)
+    monkeypatch.setattr(send_campaign.email_service, "can_send", lambda: True)
+    return FakePool
+
+
+def test_rate_limiter_allows_a_burst_then_paces_to_the_rate(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(send_campaign.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(send_campaign.time, "sleep", clock.sleep)
+    limiter = RateLimiter(per_second=2.0, burst=2)
+
+    for _ in range(6):
+        limiter.acquire()
+
+    # Two tokens up front, then one every half second.
+    assert clock.now == pytest.approx(2.0)
+    assert all(pause == pytest.approx(0.5) for pause in clock.sleeps)
+
+
+def test_rerun_after_a_partial_checkpoint_only_sends_the_rest(smtp, tmp_path):
+    checkpoint_path = tmp_path / "invite.sent"
+    checkpoint_path.write_text("a@example.com\nB@example.com\n", encoding="utf-8")
+    recipients = [Recipient(email) for email in ("a@example.com", "b@example.com", "c@example.com")]
+
+    report = run_campaign("beta-invite", recipients, checkpoint_path=checkpoint_path, workers=2, rate=0, link="x")
+
+    assert (report.total, report.sent, report.skipped) == (3, 1, 2)
+    assert smtp.instances[0].sent == ["c@example.com"]
+    assert Checkpoint(checkpoint_path).done == {"a@example.com", "b@example.com", "c@example.com"}
+
+
+def test_duplicate_recipients_get_one_email(smtp, tmp_path):
+    recipients = [Recipient("a@example.com", "A"), Recipient("A@Example.com"), Recipient("b@example.com")]
+
+    report = run_campaign("beta-invite", recipients, checkpoint_path=tmp_path / "x.sent", workers=1, rate=0, link="x")
+
+    assert report.total == 2
+    assert sorted(smtp.instances[0].sent) == ["a@example.com", "b@example.com"]
+
+
+def test_failed_sends_are_not_checkpointed(smtp, tmp_path, monkeypatch):
+    monkeypatch.setattr(FakePool, "fail_for", {"b@example.com"})
+    checkpoint_path = tmp_path / "x.sent"
+    recipients = [Recipient("a@example.com"), Recipient("b@example.com")]
+
+    report = run_campaign("beta-invite", recipients, checkpoint_path=checkpoint_path, workers=1, rate=0, link="x")
+
+    assert (report.sent, report.failed, report.failures) == (1, 1, ["b@example.com"])
+    assert Checkpoint(checkpoint_path).done == {"a@example.com"}
+
+
+def test_missing_smtp_config_fails_before_anything_is_marked(monkeypatch, tmp_path):
+    monkeypatch.setattr(send_campaign.email_service, "can_send", lambda: False)
+    checkpoint_path = tmp_path / "x.sent"
+
+    with pytest.raises(CampaignError):
+        run_campaign("beta-invite", [Recipient("a@example.com")], checkpoint_path=checkpoint_path, rate=0, link="x")
+
+    assert not checkpoint_path.exists()
@@ -0,0 +1,101 @@
+import smtplib
+import sys
+from email.message import EmailMessage
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import smtp_pool
+from app.services.smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    instances: list["FakeSMTP"] = []
+
+    def __init__(self, host, port, timeout=None):
+        self.logins = 0
+        self.sent = []
+        self.alive = True
+        FakeSMTP.instances.append(self)
+
+    def login(self, username, password):
+        self.logins += 1
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("gone")
+        return 250, b"OK"
+
+    def send_message(self, message):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("gone")
+        self.sent.append(message["To"])
+
+    def quit(self):
+        self.alive = False
+
+    def close(self):
+        self.alive = False
+
+
+def _pool(monkeypatch) -> SMTPConnectionPool:
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP_SSL", FakeSMTP)
+    return SMTPConnectionPool(host="smtp.test", port=465, username="u", password="p", size=2)
+
+
+def test_pool_reuses_authenticated_session(monkeypatch):
+    pool = _pool(monkeypatch)
+
+    for recipient in ("a@example.com", "b@example.com", "c@example.com"):
+        message = EmailMessage()
+        message["To"] = recipient
+        pool.send(message)
+
+    assert len(FakeSMTP.instances) == 1
+    assert FakeSMTP.instances[0].logins == 1
+    assert FakeSMTP.instances[0].sent == ["a@example.com", "b@example.com", "c@example.com"]
+
+
+def test_pool_reconnects_when_noop_fails(monkeypatch):
+    pool = _pool(monkeypatch)
+
+    with pool.session() as server:
+        server.send_message({"To": "first@example.com"})
+    FakeSMTP.instances[0].alive = False
+
+    with pool.session() as server:
+        server.send_message({"To": "second@example.com"})
+
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[1].sent == ["second@example.com"]
+    assert pool.open_connections() == 1
+
+
+def test_bulk_send_retries_a_421_on_a_fresh_session(monkeypatch):
+    from app.services import email_service
+
+    pool = _pool(monkeypatch)
+    closing = {"armed": True}
+    original = FakeSMTP.send_message
+
+    def send_message(self, message):
+        if closing["armed"] and message["To"] == "b@example.com":
+            closing["armed"] = False
+            raise smtplib.SMTPResponseException(421, b"Service closing transmission channel")
+        original(self, message)
+
+    monkeypatch.setattr(FakeSMTP, "send_message", send_message)
+    monkeypatch.setattr(email_service, "get_smtp_pool", lambda: pool)
+    monkeypatch.setattr(email_service, "can_send", lambda: True)
+    monkeypatch.setattr(email_service.settings, "email_outbox_enabled", False)
+
+    results = email_service._send_bulk_email(
+        subject="Hi", recipients=["a@example.com", "b@example.com", "c@example.com"], text_body="t", html_body="h"
+    )
+
+    assert results == {"a@example.com": True, "b@example.com": True, "c@example.com": True}
+    assert [instance.sent for instance in FakeSMTP.instances] == [["a@example.com"], ["b@example.com", "c@example.com"]]
+    assert pool.open_connections() == 1
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import pytest
+from postgrest.exceptions import APIError
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import (
+    booking_repository,
+    game_repository,
+    metadata_repository,
+    organizer_repository,
+    organizer_stats_repository,
+    user_repository,
+)
+
+
+def test_repositories_round_trip_through_sqlite(sqlite_storage, create_game):
+    user = user_repository.create_user(email="ada@example.com", password_hash="x", name="Ada")
+    organizer = organizer_repository.create(user.id, "ada-games", ["FOOTBALL"])
+    game = create_game(organiser_id=organizer.id, created_by_user_id=user.id)
+
+    assert organizer_repository.get_by_slug("ada-games").sports == ["FOOTBALL"]
+    assert game_repository.get_game(game.id).is_private is False
+    assert [g.id for g in game_repository.list_games_by_organizer(organizer.id)] == [game.id]
+    assert [g.id for g in game_repository.list_upcoming_public_games_by_organizer(organizer.id)] == [game.id]
+
+    booking = booking_repository.create_booking(game.id, user.id)
+    game_repository.update_participant_user_ids(game.id, [user.id])
+    assert booking_repository.count_active_bookings(game.id) == 1
+    assert game_repository.get_game(game.id).participant_user_ids == [user.id]
+    with pytest.raises(APIError):
+        booking_repository.create_booking(game.id, user.id)
+
+    assert game_repository.update_game_status(game.id, "completed").status == "completed"
+    assert booking_repository.delete_booking(booking.id).id == booking.id
+    assert booking_repository.count_active_bookings(game.id) == 0
+
+
+def test_rollup_rpcs_and_reference_tables(sqlite_storage):
+    organizer_stats_repository.bump_sport_rollup("org", "FOOTBALL", games=1, capacity=10)
+    organizer_stats_repository.bump_sport_rollup("org", "FOOTBALL", bookings=1)
+    organizer_stats_repository.bump_player_rollup("org", "u1", 1)
+    organizer_stats_repository.bump_player_rollup("org", "u1", 1)
+
+    [rollup] = organizer_stats_repository.list_sport_rollups("org")
+    assert (rollup.games_hosted, rollup.capacity_total, rollup.bookings_total) == (1, 10, 1)
+    assert organizer_stats_repository.count_repeat_players("org") == 1
+
+    data, fresh = metadata_repository._load_reference_data()
+    assert fresh
+    assert {city.slug for city in data.cities} >= {"Abuja", "Lagos"}
+
+
+def test_upcoming_public_games_start_from_the_utc_day(sqlite_storage, create_game):
+    today = create_game(organiser_id="org", days_ahead=0)
+    create_game(organiser_id="org", days_ahead=-1)
+
+    assert [g.id for g in game_repository.list_upcoming_public_games_by_organizer("org")] == [today.id]
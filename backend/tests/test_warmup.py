@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.main import app
+from app.services import dependency_probes, warmup
+
+
+@pytest.fixture(autouse=True)
+def _reset_warmup():
+    warmup.reset()
+    dependency_probes.reset()
+    yield
+    warmup.reset()
+    dependency_probes.reset()
+
+
+def _broken():
+    raise RuntimeError("smtp down")
+
+
+@pytest.mark.anyio
+async def test_readiness_waits_for_warmup_but_liveness_does_not():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/health")).json() == {"status": "ok"}
+        warming = await client.get("/health/ready")
+        assert warming.status_code == 503
+
+        warmup.run([("reference_data", lambda: None), ("smtp_pool", _broken)])
+        dependency_probes.run_once({"storage": lambda: {"backend": "sqlite"}})
+
+        ready = await client.get("/health/ready")
+        assert ready.status_code == 200
+        body = ready.json()
+        assert body["status"] == "ready"
+        assert body["warmup"]["reference_data"]["status"] == "ok"
+        assert body["warmup"]["smtp_pool"] == {
+            "status": "failed",
+            "error": "smtp down",
+            "duration_ms": body["warmup"]["smtp_pool"]["duration_ms"],
+        }
+
+
+def test_default_steps_warm_reference_data_and_tokens(monkeypatch):
+    calls = []
+    monkeypatch.setattr(warmup.reference_data_service, "get_encoded_reference_data", lambda: calls.append("encoded"))
+    monkeypatch.setattr(warmup.reference_data_service, "get_reference_index", lambda: calls.append("index"))
+    monkeypatch.setattr(warmup.reference_data_service, "get_city_locator", lambda: calls.append("locator"))
+
+    report = warmup.run([step for step in warmup.STEPS if step[0] in {"reference_data", "auth_keys"}])
+
+    assert calls == ["encoded", "index", "locator"]
+    assert report["auth_keys"]["status"] == "ok"
+    assert warmup.is_ready()
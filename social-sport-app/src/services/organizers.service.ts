@@ -1,4 +1,5 @@
 import { apiRequest } from "./api-client";
+import type { GameResponse } from "./games.service";
 
 export interface Organizer {
   id: string;
@@ -7,7 +8,6 @@ export interface Organizer {
   sports: string[];
   experience?: string | null;
   unique_link?: string | null;
-  game_ids: string[];
   created_at: string;
 }
 
@@ -30,3 +30,8 @@ export async function ensureOrganizer(payload: OrganizerPayload): Promise<Organi
 export async function getMyOrganizer(): Promise<Organizer> {
   return apiRequest<Organizer>("/organizers/me", { auth: true });
 }
+
+export function listMyOrganizerGames(limit = 20, offset = 0): Promise<GameResponse[]> {
+  const params = new URLSearchParams({ limit: String(limit), offset: String(offset) });
+  return apiRequest<GameResponse[]>(`/organizers/me/games?${params.toString()}`, { auth: true });
+}